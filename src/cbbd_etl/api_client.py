@@ -19,6 +19,8 @@ class ApiConfig:
     log_every_requests: int = 100
     games_chunk_days: int = 30
     lines_chunk_days: int = 30
+    fanout_batch_size: int = 20
+    endpoint_concurrency: int = 4
 
 
 class RateLimiter:
@@ -76,20 +78,20 @@ class ApiClient:
                 if self._logger:
                     self._logger.info(
                         "http_request_start",
-                        extra={"extra": {"path": path, "attempt": attempt, "params": params}},
+                        extra={"_json_extra": {"path": path, "attempt": attempt, "params": params}},
                     )
                 try:
                     resp = await self._client.get(path, params=params)
                 except httpx.TimeoutException:
                     if self._logger:
-                        self._logger.info("http_timeout", extra={"extra": {"path": path, "attempt": attempt}})
+                        self._logger.info("http_timeout", extra={"_json_extra": {"path": path, "attempt": attempt}})
                     if attempt >= max_attempts:
                         raise
                     await asyncio.sleep(min(max_delay, base_delay * (2 ** (attempt - 1))))
                     continue
                 except httpx.RequestError as exc:
                     if self._logger:
-                        self._logger.info("http_error", extra={"extra": {"path": path, "attempt": attempt, "error": str(exc)}})
+                        self._logger.info("http_error", extra={"_json_extra": {"path": path, "attempt": attempt, "error": str(exc)}})
                     if attempt >= max_attempts:
                         raise
                     await asyncio.sleep(min(max_delay, base_delay * (2 ** (attempt - 1))))
@@ -108,7 +110,7 @@ class ApiClient:
                     self._logger.info(
                         "http_retry",
                         extra={
-                            "extra": {
+                            "_json_extra": {
                                 "path": path,
                                 "status": resp.status_code,
                                 "attempt": attempt,
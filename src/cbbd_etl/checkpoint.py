@@ -3,10 +3,13 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 import boto3
 
+# DynamoDB BatchGetItem accepts at most 100 keys per request.
+_BATCH_GET_LIMIT = 100
+
 
 @dataclass
 class Checkpoint:
@@ -34,6 +37,32 @@ class CheckpointStore:
         payload = json.loads(item["payload"]["S"])
         return Checkpoint(endpoint=endpoint, parameter_hash=parameter_hash, payload=payload)
 
+    def get_many(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Checkpoint]:
+        """Fetch several (endpoint, parameter_hash) checkpoints with BatchGetItem.
+
+        Missing checkpoints are absent from the result.
+        """
+        pending = [
+            {"endpoint": {"S": endpoint}, "parameter_hash": {"S": parameter_hash}}
+            for endpoint, parameter_hash in dict.fromkeys(keys)
+        ]
+        found: Dict[Tuple[str, str], Checkpoint] = {}
+        while pending:
+            batch, pending = pending[:_BATCH_GET_LIMIT], pending[_BATCH_GET_LIMIT:]
+            request = {self.table_name: {"Keys": batch}}
+            while request:
+                resp = self._client.batch_get_item(RequestItems=request)
+                for item in resp.get("Responses", {}).get(self.table_name, []):
+                    endpoint = item["endpoint"]["S"]
+                    parameter_hash = item["parameter_hash"]["S"]
+                    found[(endpoint, parameter_hash)] = Checkpoint(
+                        endpoint=endpoint,
+                        parameter_hash=parameter_hash,
+                        payload=json.loads(item["payload"]["S"]),
+                    )
+                request = resp.get("UnprocessedKeys") or None
+        return found
+
     def put(self, endpoint: str, parameter_hash: str, payload: Dict[str, Any]) -> None:
         self._client.put_item(
             TableName=self.table_name,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional
+
+_PATH_PARAM_RE = re.compile(r"\{([^}]+)\}")
 
 
 @dataclass
@@ -13,6 +16,12 @@ class EndpointSpec:
     date_param: Optional[str] = None
     start_date_param: Optional[str] = None
     end_date_param: Optional[str] = None
+    # Placeholders in ``path`` (e.g. ``gameId`` in ``/plays/game/{gameId}``),
+    # extracted once rather than on every request.
+    path_params: FrozenSet[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.path_params = frozenset(_PATH_PARAM_RE.findall(self.path))
 
 
 def build_extractor(spec: Dict[str, Any]) -> EndpointSpec:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 import boto3
 import pyarrow as pa
@@ -9,12 +9,19 @@ import pyarrow as pa
 class GlueCatalog:
     def __init__(self, region: str) -> None:
         self._client = boto3.client("glue", region_name=region)
+        # Databases and table definitions this instance has already ensured,
+        # so repeat calls in one run skip the Glue round trips.
+        self._known_databases: Set[str] = set()
+        self._known_tables: Dict[Tuple[str, str], tuple] = {}
 
     def ensure_database(self, name: str) -> None:
+        if name in self._known_databases:
+            return
         try:
             self._client.get_database(Name=name)
         except self._client.exceptions.EntityNotFoundException:
             self._client.create_database(DatabaseInput={"Name": name})
+        self._known_databases.add(name)
 
     def ensure_table(
         self,
@@ -39,13 +46,16 @@ class GlueCatalog:
             },
             "PartitionKeys": partitions,
         }
+        signature = _table_signature(table_input)
+        if self._known_tables.get((database, name)) == signature:
+            return
         try:
             existing = self._client.get_table(DatabaseName=database, Name=name)["Table"]
-            if _table_matches(existing, table_input):
-                return
-            self._client.update_table(DatabaseName=database, TableInput=table_input)
+            if not _table_matches(existing, table_input):
+                self._client.update_table(DatabaseName=database, TableInput=table_input)
         except self._client.exceptions.EntityNotFoundException:
             self._client.create_table(DatabaseName=database, TableInput=table_input)
+        self._known_tables[(database, name)] = signature
 
 
 def _pa_to_glue(dtype: pa.DataType) -> str:
@@ -63,22 +73,17 @@ def _pa_to_glue(dtype: pa.DataType) -> str:
 
 
 def _table_matches(existing: dict, desired: dict) -> bool:
-    existing_cols = _normalize_columns(existing.get("StorageDescriptor", {}).get("Columns", []))
-    desired_cols = _normalize_columns(desired.get("StorageDescriptor", {}).get("Columns", []))
-    if existing_cols != desired_cols:
-        return False
+    return _table_signature(existing) == _table_signature(desired)
 
-    existing_partitions = _normalize_columns(existing.get("PartitionKeys", []))
-    desired_partitions = _normalize_columns(desired.get("PartitionKeys", []))
-    if existing_partitions != desired_partitions:
-        return False
 
-    existing_location = (existing.get("StorageDescriptor", {}).get("Location") or "").rstrip("/")
-    desired_location = (desired.get("StorageDescriptor", {}).get("Location") or "").rstrip("/")
-    if existing_location != desired_location:
-        return False
-
-    return True
+def _table_signature(table: dict) -> tuple:
+    """Columns, partition keys and location as compared by _table_matches."""
+    descriptor = table.get("StorageDescriptor", {})
+    return (
+        tuple(_normalize_columns(descriptor.get("Columns", []))),
+        tuple(_normalize_columns(table.get("PartitionKeys", []))),
+        (descriptor.get("Location") or "").rstrip("/"),
+    )
 
 
 def _normalize_columns(columns: List[dict]) -> List[tuple[str, str]]:
@@ -10,24 +10,55 @@ from S3, applies transforms, and returns a ``pyarrow.Table``.
 
 from __future__ import annotations
 
-from .team_power_rankings import build as build_team_power_rankings
-from .game_predictions_features import build as build_game_predictions_features
-from .player_season_impact import build as build_player_season_impact
-from .market_lines_analysis import build as build_market_lines_analysis
-from .team_season_summary import build as build_team_season_summary
-from .adjusted_efficiencies import build as build_adj_eff
-from .adjusted_efficiencies import build_no_garbage as build_adj_eff_no_garbage
-
-GOLD_TRANSFORMS = {
-    "team_power_rankings": build_team_power_rankings,
-    "game_predictions_features": build_game_predictions_features,
-    "player_season_impact": build_player_season_impact,
-    "market_lines_analysis": build_market_lines_analysis,
-    "team_season_summary": build_team_season_summary,
-    "team_adjusted_efficiencies": build_adj_eff,
-    "team_adjusted_efficiencies_no_garbage": build_adj_eff_no_garbage,
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .team_power_rankings import build as build_team_power_rankings
+    from .game_predictions_features import build as build_game_predictions_features
+    from .player_season_impact import build as build_player_season_impact
+    from .market_lines_analysis import build as build_market_lines_analysis
+    from .team_season_summary import build as build_team_season_summary
+    from .adjusted_efficiencies import build as build_adj_eff
+    from .adjusted_efficiencies import build_no_garbage as build_adj_eff_no_garbage
+
+# Transform modules pull in pyarrow/numpy/boto3, so they are imported on
+# first attribute access rather than with the package (keeps CLI start-up
+# and ``--help`` fast). Exported name -> (module, attribute).
+_BUILDERS = {
+    "build_team_power_rankings": (".team_power_rankings", "build"),
+    "build_game_predictions_features": (".game_predictions_features", "build"),
+    "build_player_season_impact": (".player_season_impact", "build"),
+    "build_market_lines_analysis": (".market_lines_analysis", "build"),
+    "build_team_season_summary": (".team_season_summary", "build"),
+    "build_adj_eff": (".adjusted_efficiencies", "build"),
+    "build_adj_eff_no_garbage": (".adjusted_efficiencies", "build_no_garbage"),
+}
+
+# Gold table name -> exported builder name.
+_GOLD_TABLES = {
+    "team_power_rankings": "build_team_power_rankings",
+    "game_predictions_features": "build_game_predictions_features",
+    "player_season_impact": "build_player_season_impact",
+    "market_lines_analysis": "build_market_lines_analysis",
+    "team_season_summary": "build_team_season_summary",
+    "team_adjusted_efficiencies": "build_adj_eff",
+    "team_adjusted_efficiencies_no_garbage": "build_adj_eff_no_garbage",
 }
 
+
+def __getattr__(name: str) -> Any:
+    if name in _BUILDERS:
+        module_name, attr = _BUILDERS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    elif name == "GOLD_TRANSFORMS":
+        value = {table: __getattr__(builder) for table, builder in _GOLD_TABLES.items()}
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "GOLD_TRANSFORMS",
     "build_team_power_rankings",
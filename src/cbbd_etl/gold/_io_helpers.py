@@ -6,9 +6,14 @@ and common utilities used across gold modules.
 
 from __future__ import annotations
 
-import io
-from typing import Dict, List, Optional
-
+import ast
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 import pyarrow as pa
 import pyarrow.compute
 import pyarrow.parquet as pq
@@ -16,6 +21,34 @@ import pyarrow.parquet as pq
 from ..config import Config
 from ..s3_io import S3IO
 
+# Process-wide LRU cache of decoded silver tables. Several gold transforms
+# (and several lookups within one transform) read the same silver tables;
+# pyarrow Tables are immutable, so the decoded result can be shared safely.
+_SILVER_CACHE_MAXSIZE = 16
+_silver_cache: "OrderedDict[Tuple, pa.Table]" = OrderedDict()
+_silver_cache_lock = threading.Lock()
+# Reads currently in progress, so concurrent transforms asking for the same
+# table wait for one S3 fetch instead of each issuing their own.
+_silver_inflight: Dict[Tuple, Future] = {}
+
+# Team-id columns normalised to int64 as silver tables are read.
+_ID_COLUMNS = frozenset({"teamId", "teamid", "homeTeamId", "awayTeamId"})
+
+# Parquet files of one silver table fetched/decoded in parallel.
+_FETCH_WORKERS = 8
+
+# dim_teams is season-invariant: it and the team lookups derived from it are
+# held outside the LRU (so season-partitioned reads never evict them) for
+# the life of the process, until clear_silver_cache().
+_dim_team_cache: Dict[Tuple, Any] = {}
+
+
+def clear_silver_cache() -> None:
+    """Drop all cached silver tables (e.g. between runs or tests)."""
+    with _silver_cache_lock:
+        _silver_cache.clear()
+        _dim_team_cache.clear()
+
 
 def read_silver_table(
     s3: S3IO,
@@ -23,6 +56,7 @@ def read_silver_table(
     table_name: str,
     season: Optional[int] = None,
     columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
 ) -> pa.Table:
     """Read a silver-layer table from S3, optionally filtering by season partition.
 
@@ -32,12 +66,72 @@ def read_silver_table(
         table_name: Silver table name (e.g. ``fct_games``, ``dim_teams``).
         season: If provided, restrict to the ``season={season}/`` partition.
         columns: If provided, only read these columns from Parquet files.
+            Columns missing from a file are skipped rather than raising, so
+            callers can list every alias they might look up.
+        filters: Optional ``(column, op, value)`` predicates pushed down to
+            the Parquet reader (row groups that cannot match are skipped).
+            Predicates on columns a file does not have are ignored for that
+            file, like :func:`filter_by_season`.
 
     Returns:
         A consolidated ``pyarrow.Table``. Returns an empty table with no columns
-        if no data is found.
+        if no data is found. Results are cached per process, and concurrent
+        calls for the same read share a single fetch; see
+        :func:`clear_silver_cache`.
     """
     silver_prefix = cfg.s3_layout["silver_prefix"]
+    cache_key = (
+        cfg.bucket,
+        silver_prefix,
+        table_name,
+        season,
+        tuple(columns) if columns is not None else None,
+        tuple(tuple(f) for f in filters) if filters else None,
+    )
+    with _silver_cache_lock:
+        cached = _silver_cache.get(cache_key)
+        if cached is not None:
+            _silver_cache.move_to_end(cache_key)
+            return cached
+        pending = _silver_inflight.get(cache_key)
+        if pending is None:
+            pending = _silver_inflight[cache_key] = Future()
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return pending.result()
+
+    try:
+        table = _read_silver_table_uncached(
+            s3, silver_prefix, table_name, season, columns, filters
+        )
+    except BaseException as exc:
+        with _silver_cache_lock:
+            del _silver_inflight[cache_key]
+        pending.set_exception(exc)
+        raise
+
+    with _silver_cache_lock:
+        del _silver_inflight[cache_key]
+        _silver_cache[cache_key] = table
+        _silver_cache.move_to_end(cache_key)
+        while len(_silver_cache) > _SILVER_CACHE_MAXSIZE:
+            _silver_cache.popitem(last=False)
+    pending.set_result(table)
+    return table
+
+
+def _read_silver_table_uncached(
+    s3: S3IO,
+    silver_prefix: str,
+    table_name: str,
+    season: Optional[int],
+    columns: Optional[List[str]],
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+) -> pa.Table:
+    """Read and concatenate a silver table's Parquet files from S3."""
     if season is not None:
         prefix = f"{silver_prefix}/{table_name}/season={season}/"
     else:
@@ -49,11 +143,17 @@ def read_silver_table(
     if not parquet_keys:
         return pa.table({})
 
-    tables: List[pa.Table] = []
-    for key in parquet_keys:
-        data = s3.get_object_bytes(key)
-        tbl = pq.read_table(io.BytesIO(data), columns=columns)
-        tables.append(tbl)
+    def fetch(key: str) -> pa.Table:
+        return _read_parquet_bytes(s3.get_object_bytes(key), columns, filters)
+
+    # Fetch and decode the partition's files concurrently so each S3 round
+    # trip overlaps with decoding the others; map() keeps the key order.
+    if len(parquet_keys) == 1:
+        tables = [fetch(parquet_keys[0])]
+    else:
+        workers = min(len(parquet_keys), _FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            tables = list(pool.map(fetch, parquet_keys))
 
     if not tables:
         return pa.table({})
@@ -61,10 +161,132 @@ def read_silver_table(
     # Use permissive promotion to handle type mismatches across files
     # (e.g., int64 vs double, string vs double in optional fields)
     try:
-        return pa.concat_tables(tables, promote_options="permissive")
+        table = pa.concat_tables(tables, promote_options="permissive")
     except (pa.ArrowInvalid, pa.ArrowTypeError):
         # Fall back to casting all tables to a unified schema
-        return _concat_with_unified_schema(tables)
+        table = _concat_with_unified_schema(tables)
+    return _cast_id_columns(table)
+
+
+def _cast_id_columns(table: pa.Table) -> pa.Table:
+    """Cast numeric team-id columns to ``int64`` once, at read time.
+
+    Permissive promotion can widen an id column to ``double`` (or files may
+    store a narrower int), so downstream transforms would otherwise coerce
+    each value themselves. Columns holding non-integral values are left as
+    they are.
+    """
+    for i, field in enumerate(table.schema):
+        if field.name not in _ID_COLUMNS or field.type == pa.int64():
+            continue
+        if not (pa.types.is_integer(field.type) or pa.types.is_floating(field.type)):
+            continue
+        try:
+            cast = pyarrow.compute.cast(table.column(i), pa.int64())
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            continue
+        table = table.set_column(i, pa.field(field.name, pa.int64()), cast)
+    return table
+
+
+def _read_parquet_bytes(
+    data: bytes,
+    columns: Optional[List[str]],
+    filters: Optional[List[Tuple[str, str, Any]]],
+) -> pa.Table:
+    """Decode one Parquet object, projecting/filtering only on columns it has.
+
+    The bytes are wrapped in an Arrow buffer so every range read the Parquet
+    reader issues stays in C++ instead of calling back into a Python file.
+    The footer is parsed once up front; a file with no rows returns an empty
+    table of the projected schema without touching any column chunks.
+    """
+    buf = pa.py_buffer(data)
+    pf = pq.ParquetFile(pa.BufferReader(buf))
+    schema = pf.schema_arrow
+    if columns is not None:
+        columns = [c for c in columns if c in schema.names]
+    if pf.metadata.num_rows == 0:
+        if columns is not None:
+            schema = pa.schema([schema.field(c) for c in columns])
+        return schema.empty_table()
+    if filters:
+        filters = [f for f in filters if f[0] in schema.names] or None
+    if not filters:
+        return pf.read(columns=columns)
+    return pq.read_table(pa.BufferReader(buf), columns=columns, filters=filters)
+
+
+def read_dim_teams(s3: S3IO, cfg: Config) -> pa.Table:
+    """Return the full silver dim_teams table, read once per process.
+
+    Shared by every transform and season; see :func:`clear_silver_cache`.
+    """
+    key = (cfg.bucket, cfg.s3_layout["silver_prefix"], "dim_teams")
+    with _silver_cache_lock:
+        cached = _dim_team_cache.get(key)
+    if cached is not None:
+        return cached
+
+    dim = read_silver_table(s3, cfg, "dim_teams")
+    with _silver_cache_lock:
+        _dim_team_cache[key] = dim
+    return dim
+
+
+def dim_team_lookup(s3: S3IO, cfg: Config) -> Dict[int, Dict[str, Optional[str]]]:
+    """Return a teamId -> {school, conference} lookup built from dim_teams.
+
+    Later rows win for duplicate team IDs. The dict is cached per process
+    and shared between callers, so treat it as read-only.
+    """
+    key = (cfg.bucket, cfg.s3_layout["silver_prefix"], "lookup")
+    with _silver_cache_lock:
+        cached = _dim_team_cache.get(key)
+    if cached is not None:
+        return cached
+
+    dim = read_dim_teams(s3, cfg)
+    lookup: Dict[int, Dict[str, Optional[str]]] = {}
+    if dim.num_rows > 0:
+        tids = arrow_column(dim, "teamId", pa.int64()).to_pylist()
+        schools = pydict_get(dim, "school")
+        confs = pydict_get(dim, "conference")
+        for i, tid in enumerate(tids):
+            if tid is not None:
+                lookup[tid] = {"school": schools[i], "conference": confs[i]}
+
+    with _silver_cache_lock:
+        _dim_team_cache[key] = lookup
+    return lookup
+
+
+def dim_team_table(s3: S3IO, cfg: Config) -> pa.Table:
+    """Return dim_teams as a (teamId, school, conference) join table.
+
+    Later rows win for duplicate team IDs, so each ID joins at most once.
+    ``school`` and ``conference`` are dictionary-encoded, so joins gather
+    int32 codes rather than copying strings. Cached per process like
+    :func:`dim_team_lookup`.
+    """
+    key = (cfg.bucket, cfg.s3_layout["silver_prefix"], "table")
+    with _silver_cache_lock:
+        cached = _dim_team_cache.get(key)
+    if cached is not None:
+        return cached
+
+    dim = read_dim_teams(s3, cfg)
+    teams = dedup_by(pa.table({
+        "teamId": arrow_column(dim, "teamId", pa.int64()),
+        "school": arrow_column(dim, "school", pa.string()),
+        "conference": arrow_column(dim, "conference", pa.string()),
+    }), ["teamId"], keep="last").combine_chunks()
+    teams = teams.set_column(1, "school", pa.compute.dictionary_encode(teams.column("school")))
+    teams = teams.set_column(2, "conference", pa.compute.dictionary_encode(teams.column("conference")))
+
+    with _silver_cache_lock:
+        _dim_team_cache[key] = teams
+    return teams
 
 
 def safe_divide(
@@ -91,21 +313,130 @@ def safe_divide(
     return result
 
 
+def first_column_name(
+    table: pa.Table, candidates: Union[str, List[str]]
+) -> Optional[str]:
+    """Return the first candidate column present in ``table``, or None.
+
+    Names are resolved through the schema's field index (a hashed lookup)
+    rather than by scanning ``table.column_names``, which rebuilds the
+    full name list on every access.
+    """
+    if isinstance(candidates, str):
+        candidates = [candidates]
+    schema = table.schema
+    for col in candidates:
+        if schema.get_field_index(col) >= 0:
+            return col
+    return None
+
+
 def pydict_get(table: pa.Table, col: str) -> List:
     """Safely extract a column as a Python list, returning empty list if missing."""
-    if col in table.column_names:
+    if first_column_name(table, col) is not None:
         return table.column(col).to_pylist()
     return [None] * table.num_rows
 
 
+def pydict_get_ints(table: pa.Table, col: str) -> List[Optional[int]]:
+    """Extract an ID column as Python ints, casting the whole column once.
+
+    Silver ID columns can arrive as int32, double or string depending on the
+    source file; casting the column to int64 up front lets callers use the
+    values directly as lookup keys without a per-row ``int()``.
+    """
+    if first_column_name(table, col) is None:
+        return [None] * table.num_rows
+    column = table.column(col)
+    if not pa.types.is_int64(column.type):
+        try:
+            column = pa.compute.cast(column, pa.int64())
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return [int(v) if v is not None else None for v in column.to_pylist()]
+    return column.to_pylist()
+
+
 def pydict_get_first(table: pa.Table, candidates: List[str]) -> List:
     """Try multiple column names, returning the first found as a Python list."""
-    for col in candidates:
-        if col in table.column_names:
-            return table.column(col).to_pylist()
+    col = first_column_name(table, candidates)
+    if col is not None:
+        return table.column(col).to_pylist()
     return [None] * table.num_rows
 
 
+def pydict_get_arr(table: pa.Table, candidates: Union[str, List[str]]) -> pa.ChunkedArray:
+    """Return the first available column as a ``ChunkedArray`` (all-null if missing).
+
+    Unlike :func:`pydict_get`, nothing is boxed into Python objects, so
+    callers can filter or compute on the column before materialising it.
+    """
+    col = first_column_name(table, candidates)
+    if col is not None:
+        return table.column(col)
+    return pa.chunked_array([pa.nulls(table.num_rows)])
+
+
+def arrow_column(
+    table: pa.Table,
+    candidates: Union[str, List[str]],
+    dtype: pa.DataType,
+) -> pa.ChunkedArray:
+    """Return the first available column cast to ``dtype``, kept in Arrow.
+
+    Missing columns yield all-null arrays. Values that cannot be converted
+    become null, matching a per-value ``float()``/``int()`` with a
+    ``None`` fallback (floats are truncated toward zero when cast to int).
+    """
+    col = first_column_name(table, candidates)
+    if col is None:
+        return pa.chunked_array([pa.nulls(table.num_rows, type=dtype)], type=dtype)
+    column = table.column(col)
+    if column.type == dtype:
+        return column
+    if pa.types.is_floating(column.type) and pa.types.is_integer(dtype):
+        return float_to_int(column, dtype)
+    try:
+        return pa.compute.cast(column, dtype)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        convert = _PY_CONVERTERS.get(dtype, str)
+        return pa.chunked_array(
+            [pa.array([_convert_or_none(v, convert) for v in column.to_pylist()], type=dtype)],
+            type=dtype,
+        )
+
+
+def float_to_int(column: pa.ChunkedArray, dtype: pa.DataType = pa.int64()) -> pa.ChunkedArray:
+    """Truncate a float column toward zero into integer ``dtype``, like ``int()``.
+
+    NaN, infinities and values outside ``dtype``'s range become null
+    instead of wrapping around.
+    """
+    bits = dtype.bit_width
+    if pa.types.is_signed_integer(dtype):
+        low, high = -(2.0 ** (bits - 1)), 2.0 ** (bits - 1)
+    else:
+        low, high = 0.0, 2.0 ** bits
+    truncated = pa.compute.trunc(column)
+    # Both bounds are exact in float64; NaN fails either comparison.
+    in_range = pa.compute.and_(
+        pa.compute.greater_equal(truncated, low),
+        pa.compute.less(truncated, high),
+    )
+    valid = pa.compute.if_else(in_range, truncated, pa.scalar(None, column.type))
+    return pa.compute.cast(valid, dtype, safe=False)
+
+
+def values_and_mask(column: pa.ChunkedArray, fill: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Split a column into ``(values with nulls filled, null mask)`` NumPy arrays.
+
+    The pair maps directly onto Arrow's layout, so results computed on the
+    values can be wrapped back with ``pa.array(values, mask=mask)``.
+    """
+    mask = column.is_null().to_numpy(zero_copy_only=False)
+    values = pa.compute.fill_null(column, fill).to_numpy()
+    return values, mask
+
+
 def filter_by_season(table: pa.Table, season: int) -> pa.Table:
     """Filter a table by season column (for tables without season partition)."""
     if table.num_rows == 0 or "season" not in table.column_names:
@@ -114,8 +445,18 @@ def filter_by_season(table: pa.Table, season: int) -> pa.Table:
     return table.filter(mask)
 
 
-def dedup_by(table: pa.Table, key_cols: List[str]) -> pa.Table:
-    """Deduplicate a table by key columns, keeping the first occurrence."""
+def dedup_by(table: pa.Table, key_cols: List[str], keep: str = "first") -> pa.Table:
+    """Deduplicate a table by key columns.
+
+    Args:
+        table: Input table.
+        key_cols: Columns forming the key.
+        keep: ``"first"`` or ``"last"`` occurrence to keep per key. ``"last"``
+            matches building a ``{key: row}`` dict in row order.
+
+    Returns:
+        The deduplicated table, with surviving rows in their original order.
+    """
     if table.num_rows == 0:
         return table
     # Verify all key columns exist
@@ -125,19 +466,102 @@ def dedup_by(table: pa.Table, key_cols: List[str]) -> pa.Table:
     seen = set()
     indices = []
     key_data = [table.column(c).to_pylist() for c in key_cols]
-    for i in range(table.num_rows):
+    order = range(table.num_rows) if keep == "first" else range(table.num_rows - 1, -1, -1)
+    for i in order:
         key = tuple(key_data[j][i] for j in range(len(key_cols)))
         if key not in seen:
             seen.add(key)
             indices.append(i)
+    if keep != "first":
+        indices.reverse()
     return table.take(indices)
 
 
+_STAT_NUMBER = r"-?(?:0|[1-9]\d*)(?:\.\d*)?(?:[eE][-+]?\d+)?|None"
+_STAT_PAIR = r"""['"](\w+)['"]\s*:\s*(""" + _STAT_NUMBER + r")"
+_STAT_PAIR_RE = re.compile(_STAT_PAIR)
+_FLAT_STAT_DICT_RE = re.compile(
+    r"\{\s*(?:" + _STAT_PAIR + r"\s*(?:,\s*" + _STAT_PAIR + r"\s*)*,?\s*)?\}"
+)
+
+
+def parse_stat_dict(val: Any) -> Optional[dict]:
+    """Parse a string dict like "{'made': 175, 'attempted': 367, 'pct': 47.7}".
+
+    Flat dicts of numbers are parsed with a precompiled regex; anything else
+    (nested dicts, strings) falls back to ``ast.literal_eval``.
+    """
+    if val is None:
+        return None
+    if isinstance(val, dict):
+        return val
+    text = str(val)
+    if _FLAT_STAT_DICT_RE.fullmatch(text):
+        return {key: _parse_stat_number(num) for key, num in _STAT_PAIR_RE.findall(text)}
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return None
+
+
+def parse_made_attempted(raw_col: List) -> Tuple[List, List]:
+    """Parse a list of string dicts into (made_list, attempted_list)."""
+    made = []
+    attempted = []
+    for val in raw_col:
+        d = parse_stat_dict(val)
+        if d is not None:
+            made.append(d.get("made"))
+            attempted.append(d.get("attempted"))
+        else:
+            made.append(None)
+            attempted.append(None)
+    return made, attempted
+
+
+def parse_stat_total(raw_col: List) -> List:
+    """Parse a list of string dicts and extract 'total' key."""
+    result = []
+    for val in raw_col:
+        d = parse_stat_dict(val)
+        if d is not None:
+            result.append(d.get("total"))
+        else:
+            result.append(None)
+    return result
+
+
 def table_to_pydict(table: pa.Table) -> Dict[str, List]:
     """Convert a pyarrow Table to a plain Python dict of lists."""
     return {col: table.column(col).to_pylist() for col in table.column_names}
 
 
+_PY_CONVERTERS = {
+    pa.float64(): float,
+    pa.int64(): int,
+    pa.int32(): int,
+}
+
+
+def _parse_stat_number(text: str) -> Optional[Union[int, float]]:
+    """Convert a number matched by ``_STAT_NUMBER`` the way ``literal_eval`` would."""
+    if text == "None":
+        return None
+    if "." in text or "e" in text or "E" in text:
+        return float(text)
+    return int(text)
+
+
+def _convert_or_none(value: Any, convert: Any) -> Any:
+    """Apply ``convert`` to a scalar, returning None on failure."""
+    if value is None:
+        return None
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def _concat_with_unified_schema(tables: List[pa.Table]) -> pa.Table:
     """Concatenate tables with incompatible schemas by casting all to string."""
     # Gather all column names and pick the broadest type for each
@@ -20,16 +20,27 @@ import logging
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 from ..config import Config
 from ..normalize import normalize_records
 from ..s3_io import S3IO
-from ._io_helpers import dedup_by, pydict_get, pydict_get_first, read_silver_table
+from ._io_helpers import (
+    arrow_column,
+    dedup_by,
+    dim_team_lookup,
+    pydict_get_arr,
+    read_dim_teams,
+    read_silver_table,
+    values_and_mask,
+)
 from .iterative_ratings import (
     GameObs,
-    compute_barthag,
+    GameObsArray,
+    compute_barthag_batch,
     exponential_decay_weight,
     solve_ratings,
 )
@@ -208,9 +219,10 @@ def _apply_margin_cap(
     return capped
 
 
-def build(cfg: Config, season: int) -> pa.Table:
+def build(cfg: Config, season: int, s3: Optional[S3IO] = None) -> pa.Table:
     """Build team_adjusted_efficiencies from fct_game_teams (API box scores)."""
-    s3 = S3IO(cfg.bucket, cfg.region)
+    if s3 is None:
+        s3 = S3IO(cfg.bucket, cfg.region)
     params = _get_rating_params(cfg)
     margin_cap = _get_margin_cap(cfg)
     preseason_regression = _get_preseason_regression(cfg)
@@ -242,9 +254,10 @@ def build(cfg: Config, season: int) -> pa.Table:
     return normalize_records("team_adjusted_efficiencies", records)
 
 
-def build_no_garbage(cfg: Config, season: int) -> pa.Table:
+def build_no_garbage(cfg: Config, season: int, s3: Optional[S3IO] = None) -> pa.Table:
     """Build team_adjusted_efficiencies_no_garbage from PBP garbage-removed data."""
-    s3 = S3IO(cfg.bucket, cfg.region)
+    if s3 is None:
+        s3 = S3IO(cfg.bucket, cfg.region)
     params = _get_rating_params(cfg)
     margin_cap = _get_margin_cap(cfg)
     preseason_regression = _get_preseason_regression(cfg)
@@ -284,15 +297,14 @@ def build_no_garbage(cfg: Config, season: int) -> pa.Table:
 
 def _load_d1_team_ids(s3: S3IO, cfg: Config) -> Set[int]:
     """Return the set of D1 team IDs (teams with a conference in dim_teams)."""
-    dim = read_silver_table(s3, cfg, "dim_teams")
+    dim = read_dim_teams(s3, cfg)
     d1: Set[int] = set()
     if dim.num_rows == 0:
         return d1
-    tids = pydict_get(dim, "teamId")
-    confs = pydict_get(dim, "conference")
-    for i, tid in enumerate(tids):
-        if tid is not None and confs[i] is not None and str(confs[i]).strip():
-            d1.add(int(tid))
+    tids, tid_null = values_and_mask(arrow_column(dim, "teamId", pa.int64()), 0)
+    confs = pc.utf8_trim_whitespace(arrow_column(dim, "conference", pa.string()))
+    has_conf = pc.fill_null(pc.not_equal(confs, ""), False).to_numpy(zero_copy_only=False)
+    d1.update(tids[~tid_null & has_conf].tolist())
     return d1
 
 
@@ -301,6 +313,28 @@ def _load_d1_team_ids(s3: S3IO, cfg: Config) -> Set[int]:
 # ---------------------------------------------------------------------------
 
 
+def _d1_game_rows(
+    fct_games: pa.Table, d1_ids: Set[int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Select D1-vs-D1 games from fct_games with NumPy masks.
+
+    Returns ``(rows, game_ids, home_ids, away_ids)`` for the games with a
+    game ID whose home and away teams are both D1 (a missing team ID never
+    matches).
+    """
+    gids, gid_null = values_and_mask(arrow_column(fct_games, "gameId", pa.int64()), 0)
+    home, home_null = values_and_mask(arrow_column(fct_games, "homeTeamId", pa.int64()), 0)
+    away, away_null = values_and_mask(arrow_column(fct_games, "awayTeamId", pa.int64()), 0)
+    d1 = np.fromiter(d1_ids, dtype=np.int64, count=len(d1_ids))
+    keep = (
+        ~gid_null
+        & ~home_null & np.isin(home, d1)
+        & ~away_null & np.isin(away, d1)
+    )
+    rows = np.flatnonzero(keep)
+    return rows, gids[rows], home[rows], away[rows]
+
+
 def _load_box_score_games(
     s3: S3IO, cfg: Config, season: int, d1_ids: Set[int]
 ) -> Dict[str, List[GameObs]]:
@@ -320,30 +354,19 @@ def _load_box_score_games(
     game_home: Dict[int, int] = {}
     game_away: Dict[int, int] = {}
 
-    g_ids = pydict_get(fct_games, "gameId")
-    g_starts = pydict_get_first(fct_games, ["startDate", "start_date", "date"])
-    g_neutral = pydict_get(fct_games, "neutralSite")
-    g_home = pydict_get(fct_games, "homeTeamId")
-    g_away = pydict_get(fct_games, "awayTeamId")
-
-    for i, gid in enumerate(g_ids):
-        if gid is None:
-            continue
-        gid = int(gid)
-        home_id = int(g_home[i]) if g_home[i] is not None else 0
-        away_id = int(g_away[i]) if g_away[i] is not None else 0
-
-        # Skip non-D1 games
-        if home_id not in d1_ids or away_id not in d1_ids:
-            continue
+    rows, g_ids, g_home, g_away = _d1_game_rows(fct_games, d1_ids)
+    take = pa.array(rows)
+    g_starts = pydict_get_arr(fct_games, ["startDate", "start_date", "date"]).take(take).to_pylist()
+    g_neutral = pydict_get_arr(fct_games, "neutralSite").take(take).to_pylist()
 
+    for i, gid in enumerate(g_ids.tolist()):
         dt_str = _parse_date_str(g_starts[i])
         if dt_str is None:
             continue
         game_dates[gid] = dt_str
         game_neutral[gid] = bool(g_neutral[i]) if g_neutral[i] is not None else False
-        game_home[gid] = home_id
-        game_away[gid] = away_id
+        game_home[gid] = int(g_home[i])
+        game_away[gid] = int(g_away[i])
 
     # Read fct_game_teams
     gt = dedup_by(
@@ -353,25 +376,21 @@ def _load_box_score_games(
     if gt.num_rows == 0:
         return {}
 
-    gt_gids = pydict_get(gt, "gameId")
-    gt_tids = pydict_get(gt, "teamId")
-    gt_stats = pydict_get(gt, "teamStats")
-    gt_opp_stats = pydict_get(gt, "opponentStats")
+    # Only rows of dated D1 games reach the per-row stats parsing.
+    gt_gids, gid_null = values_and_mask(arrow_column(gt, "gameId", pa.int64()), 0)
+    gt_tids, tid_null = values_and_mask(arrow_column(gt, "teamId", pa.int64()), 0)
+    dated = np.fromiter(game_dates, dtype=np.int64, count=len(game_dates))
+    rows = np.flatnonzero(~gid_null & ~tid_null & np.isin(gt_gids, dated))
+    take = pa.array(rows)
+    gt_gids = gt_gids[rows].tolist()
+    gt_tids = gt_tids[rows].tolist()
+    gt_stats = pydict_get_arr(gt, "teamStats").take(take).to_pylist()
+    gt_opp_stats = pydict_get_arr(gt, "opponentStats").take(take).to_pylist()
 
     games_by_date: Dict[str, List[GameObs]] = {}
 
-    for i in range(len(gt_gids)):
-        gid = gt_gids[i]
+    for i, gid in enumerate(gt_gids):
         tid = gt_tids[i]
-        if gid is None or tid is None:
-            continue
-        gid = int(gid)
-        tid = int(tid)
-
-        # Only D1 games (already filtered at fct_games level)
-        if gid not in game_dates:
-            continue
-
         team_poss, team_pts = _parse_team_stats(gt_stats[i])
         opp_poss, opp_pts = _parse_team_stats(gt_opp_stats[i])
 
@@ -421,19 +440,11 @@ def _load_pbp_no_garbage_games(
     d1_game_ids: Set[int] = set()
 
     if fct_games.num_rows > 0:
-        g_ids = pydict_get(fct_games, "gameId")
-        g_neutral = pydict_get(fct_games, "neutralSite")
-        g_home = pydict_get(fct_games, "homeTeamId")
-        g_away = pydict_get(fct_games, "awayTeamId")
-        for i, gid in enumerate(g_ids):
-            if gid is None:
-                continue
-            gid_int = int(gid)
-            home_id = int(g_home[i]) if g_home[i] is not None else 0
-            away_id = int(g_away[i]) if g_away[i] is not None else 0
-            if home_id in d1_ids and away_id in d1_ids:
-                d1_game_ids.add(gid_int)
-                game_neutral[gid_int] = bool(g_neutral[i]) if g_neutral[i] is not None else False
+        rows, g_ids, _, _ = _d1_game_rows(fct_games, d1_ids)
+        g_neutral = pydict_get_arr(fct_games, "neutralSite").take(pa.array(rows)).to_pylist()
+        for i, gid in enumerate(g_ids.tolist()):
+            d1_game_ids.add(gid)
+            game_neutral[gid] = bool(g_neutral[i]) if g_neutral[i] is not None else False
 
     # Read PBP garbage-removed flat table
     pbp = dedup_by(
@@ -445,68 +456,60 @@ def _load_pbp_no_garbage_games(
     if pbp.num_rows == 0:
         return {}
 
-    p_gids = pydict_get(pbp, "gameid")
-    p_tids = pydict_get(pbp, "teamid")
-    p_opp = pydict_get(pbp, "opponentid")
-    p_dates = pydict_get(pbp, "startdate")
-    p_home = pydict_get(pbp, "ishometeam")
-    p_tpts = pydict_get(pbp, "team_points_total")
-    p_opts = pydict_get(pbp, "opp_points_total")
+    # Numeric columns stay in NumPy (value, null-mask) pairs so the ID, D1
+    # and possession guards run vectorized; only surviving rows are boxed.
+    gids, gid_null = values_and_mask(arrow_column(pbp, "gameid", pa.int64()), 0)
+    tids, tid_null = values_and_mask(arrow_column(pbp, "teamid", pa.int64()), 0)
+    tpts, tpts_null = values_and_mask(arrow_column(pbp, "team_points_total", pa.float64()), 0.0)
+    opts, _ = values_and_mask(arrow_column(pbp, "opp_points_total", pa.float64()), 0.0)
 
     # Use formula-based possessions (FGA - OREB + TOV + 0.44*FTA) to match
     # box-score methodology. Fall back to event-counted if formula unavailable.
     has_formula = "team_possessions_formula" in pbp.column_names
     if has_formula:
-        p_tposs = pydict_get(pbp, "team_possessions_formula")
-        p_oposs = pydict_get(pbp, "opp_possessions_formula")
+        tposs_col = arrow_column(pbp, "team_possessions_formula", pa.float64())
+        oposs_col = arrow_column(pbp, "opp_possessions_formula", pa.float64())
         logger.info("pbp_no_garbage: using team_possessions_formula")
     else:
-        p_tposs = pydict_get(pbp, "team_possessions")
-        p_oposs = pydict_get(pbp, "opp_possessions")
+        tposs_col = arrow_column(pbp, "team_possessions", pa.float64())
+        oposs_col = arrow_column(pbp, "opp_possessions", pa.float64())
         logger.warning("pbp_no_garbage: team_possessions_formula not found, falling back to event count")
+    tposs, tposs_null = values_and_mask(tposs_col, 0.0)
+    oposs, oposs_null = values_and_mask(oposs_col, 0.0)
 
-    games_by_date: Dict[str, List[GameObs]] = {}
+    d1_games = np.fromiter(d1_game_ids, dtype=np.int64, count=len(d1_game_ids))
+    keep = (
+        ~gid_null & ~tid_null & np.isin(gids, d1_games)
+        & ~tposs_null & ~(tposs <= 0) & ~tpts_null
+    )
+    oposs = np.where(oposs_null | (oposs <= 0), tposs, oposs)
 
-    for i in range(len(p_gids)):
-        gid = p_gids[i]
-        tid = p_tids[i]
-        if gid is None or tid is None:
-            continue
-        gid = int(gid)
-        tid = int(tid)
+    rows = np.flatnonzero(keep)
+    take = pa.array(rows)
+    p_dates = pydict_get_arr(pbp, "startdate").take(take).to_pylist()
+    p_opp = pydict_get_arr(pbp, "opponentid").take(take).to_pylist()
+    p_home = pydict_get_arr(pbp, "ishometeam").take(take).to_pylist()
 
-        # D1 filter
-        if gid not in d1_game_ids:
-            continue
+    games_by_date: Dict[str, List[GameObs]] = {}
 
-        dt_str = _parse_date_str(p_dates[i])
+    for j, i in enumerate(rows.tolist()):
+        dt_str = _parse_date_str(p_dates[j])
         if dt_str is None:
             continue
 
-        team_poss = p_tposs[i]
-        team_pts = p_tpts[i]
-        opp_poss = p_oposs[i]
-        opp_pts = p_opts[i]
-
-        if team_poss is None or team_poss <= 0 or team_pts is None:
-            continue
-        if opp_poss is None or opp_poss <= 0:
-            opp_poss = team_poss
-        if opp_pts is None:
-            opp_pts = 0.0
-
-        opp_id = int(p_opp[i]) if p_opp[i] is not None else 0
-        is_home = bool(p_home[i]) if p_home[i] is not None else False
+        gid = int(gids[i])
+        opp_id = int(p_opp[j]) if p_opp[j] is not None else 0
+        is_home = bool(p_home[j]) if p_home[j] is not None else False
         is_neutral = game_neutral.get(gid, False)
 
         obs = GameObs(
             game_id=gid,
-            team_id=tid,
+            team_id=int(tids[i]),
             opp_id=opp_id,
-            team_pts=float(team_pts),
-            team_poss=float(team_poss),
-            opp_pts=float(opp_pts),
-            opp_poss=float(opp_poss),
+            team_pts=float(tpts[i]),
+            team_poss=float(tposs[i]),
+            opp_pts=float(opts[i]),
+            opp_poss=float(oposs[i]),
             is_home=is_home,
             is_neutral=is_neutral,
             game_date=dt_str,
@@ -552,36 +555,55 @@ def _run_per_date_ratings(
     max_iters_seen = 0
     total_iters = 0
 
+    # Flatten the whole season once into parallel arrays (in the same order
+    # the per-date loop used to visit games) and tag each game with its
+    # date, so each rating date only selects rows and sets weights.
+    season_games: List[GameObs] = []
+    game_day: List[int] = []
+    for dt_str, day_games in games_by_date.items():
+        gd = _parse_date_obj(dt_str)
+        if gd is None:
+            continue
+        season_games.extend(day_games)
+        game_day.extend([gd.toordinal()] * len(day_games))
+    season_arr = GameObsArray.from_list(season_games)
+    game_day_arr = np.asarray(game_day, dtype=np.int64)
+
     for rating_date in sorted_dates:
         rd = _parse_date_obj(rating_date)
         if rd is None:
             continue
 
-        # Collect all games on or before rating_date, apply recency weighting
-        all_games: List[GameObs] = []
-        for dt_str, day_games in games_by_date.items():
-            gd = _parse_date_obj(dt_str)
-            if gd is None or gd > rd:
-                continue
-            days_ago = (rd - gd).days
-            w = exponential_decay_weight(days_ago, half_life=half_life) if half_life else 1.0
-            for g in day_games:
-                all_games.append(GameObs(
-                    game_id=g.game_id,
-                    team_id=g.team_id,
-                    opp_id=g.opp_id,
-                    team_pts=g.team_pts,
-                    team_poss=g.team_poss,
-                    opp_pts=g.opp_pts,
-                    opp_poss=g.opp_poss,
-                    is_home=g.is_home,
-                    is_neutral=g.is_neutral,
-                    game_date=g.game_date,
-                    weight=w,
-                ))
-
-        if not all_games:
+        # Select all games on or before rating_date, apply recency weighting
+        rd_ord = rd.toordinal()
+        in_window = game_day_arr <= rd_ord
+        if not in_window.any():
             continue
+        window_days = game_day_arr[in_window]
+        if half_life:
+            day_weights = {
+                day: exponential_decay_weight(rd_ord - day, half_life=half_life)
+                for day in np.unique(window_days).tolist()
+            }
+            weights = np.fromiter(
+                (day_weights[day] for day in window_days.tolist()),
+                dtype=np.float64,
+                count=len(window_days),
+            )
+        else:
+            weights = np.ones(len(window_days), dtype=np.float64)
+        all_games = GameObsArray(
+            game_id=season_arr.game_id[in_window],
+            team_id=season_arr.team_id[in_window],
+            opp_id=season_arr.opp_id[in_window],
+            team_pts=season_arr.team_pts[in_window],
+            team_poss=season_arr.team_poss[in_window],
+            opp_pts=season_arr.opp_pts[in_window],
+            opp_poss=season_arr.opp_poss[in_window],
+            is_home=season_arr.is_home[in_window],
+            is_neutral=season_arr.is_neutral[in_window],
+            weight=weights,
+        )
 
         result = solve_ratings(
             all_games, prior=prior, hca_oe=hca_oe, hca_de=hca_de,
@@ -603,9 +625,15 @@ def _run_per_date_ratings(
         }
 
         # Emit records for teams that have played games
-        for tid, vals in result.items():
-            if vals["games_played"] == 0:
-                continue
+        played = [
+            (tid, vals) for tid, vals in result.items() if vals["games_played"] > 0
+        ]
+        barthags = compute_barthag_batch(
+            [vals["adj_oe"] for _, vals in played],
+            [vals["adj_de"] for _, vals in played],
+            exp=barthag_exp,
+        )
+        for (tid, vals), barthag in zip(played, barthags.tolist()):
             info = team_info.get(tid, {})
             adj_oe = vals["adj_oe"]
             adj_de = vals["adj_de"]
@@ -618,7 +646,7 @@ def _run_per_date_ratings(
                 "adj_oe": round(adj_oe, 4),
                 "adj_de": round(adj_de, 4),
                 "adj_tempo": round(vals["adj_tempo"], 4),
-                "barthag": round(compute_barthag(adj_oe, adj_de, exp=barthag_exp), 6),
+                "barthag": round(barthag, 6),
                 "adj_margin": round(adj_oe - adj_de, 4),
                 "games_played": vals["games_played"],
                 "raw_oe": round(vals["raw_oe"], 4),
@@ -645,18 +673,8 @@ def _run_per_date_ratings(
 def _load_team_info(
     s3: S3IO, cfg: Config
 ) -> Dict[int, Dict[str, Optional[str]]]:
-    """Load dim_teams into a {teamId: {school, conference}} lookup."""
-    dim = read_silver_table(s3, cfg, "dim_teams")
-    result: Dict[int, Dict[str, Optional[str]]] = {}
-    if dim.num_rows == 0:
-        return result
-    tids = pydict_get(dim, "teamId")
-    schools = pydict_get(dim, "school")
-    confs = pydict_get(dim, "conference")
-    for i, tid in enumerate(tids):
-        if tid is not None:
-            result[int(tid)] = {"school": schools[i], "conference": confs[i]}
-    return result
+    """Load dim_teams into a {teamId: {school, conference}} lookup (cached)."""
+    return dim_team_lookup(s3, cfg)
 
 
 def _parse_team_stats(stats_str: Any) -> Tuple[Optional[float], Optional[float]]:
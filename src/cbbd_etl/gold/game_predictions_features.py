@@ -6,28 +6,42 @@ Merges team ratings, season-to-date stats, and lines into a single ML-ready tabl
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..config import Config
 from ..normalize import normalize_records
 from ..s3_io import S3IO
-from ._io_helpers import dedup_by, filter_by_season, pydict_get, pydict_get_first, read_silver_table
-
-
-def build(cfg: Config, season: int) -> pa.Table:
+from ._io_helpers import (
+    arrow_column,
+    dedup_by,
+    dim_team_lookup,
+    pydict_get,
+    pydict_get_arr,
+    pydict_get_first,
+    pydict_get_ints,
+    read_silver_table,
+)
+
+
+def build(cfg: Config, season: int, s3: Optional[S3IO] = None) -> pa.Table:
     """Build the game_predictions_features gold table for a given season.
 
     Args:
         cfg: Pipeline configuration.
         season: Season year (e.g. 2024).
+        s3: S3 client to read through; the runner shares one across
+            transforms. A new client is created when omitted.
 
     Returns:
         A ``pyarrow.Table`` with two rows per game (one home, one away),
         containing pre-game features and outcome labels.
     """
-    s3 = S3IO(cfg.bucket, cfg.region)
+    if s3 is None:
+        s3 = S3IO(cfg.bucket, cfg.region)
 
     # ------------------------------------------------------------------
     # 1. Read fct_games (spine)
@@ -36,9 +50,11 @@ def build(cfg: Config, season: int) -> pa.Table:
     if games.num_rows == 0:
         return _empty_table()
 
-    g_ids = pydict_get(games, "gameId")
-    g_home = pydict_get(games, "homeTeamId")
-    g_away = pydict_get(games, "awayTeamId")
+    # IDs are canonicalized to int once here, so the row loop and all
+    # lookups key on them directly.
+    g_ids = pydict_get_ints(games, "gameId")
+    g_home = pydict_get_ints(games, "homeTeamId")
+    g_away = pydict_get_ints(games, "awayTeamId")
     g_home_score = pydict_get_first(games, ["homeScore", "homePoints"])
     g_away_score = pydict_get_first(games, ["awayScore", "awayPoints"])
     g_dates: List[Optional[str]] = []
@@ -55,12 +71,54 @@ def build(cfg: Config, season: int) -> pa.Table:
     adj_lookup = _build_adj_lookup(s3, cfg, season)
     srs_lookup = _build_srs_lookup(s3, cfg, season)
     rollup_lookup = _build_rollup_lookup(s3, cfg, season)
-    team_lookup = _build_team_lookup(s3, cfg)
+    team_lookup = dim_team_lookup(s3, cfg)
     lines_lookup = _build_lines_lookup(s3, cfg, season)
 
     # ------------------------------------------------------------------
     # 3. Generate two rows per game
     # ------------------------------------------------------------------
+    lookups = (adj_lookup, srs_lookup, rollup_lookup, team_lookup, lines_lookup)
+    game_cols = (g_ids, g_home, g_away, g_home_score, g_away_score, g_dates)
+    table = _build_rows_table(game_cols, lookups, season)
+
+    if table.num_rows == 0:
+        return _empty_table()
+    return table
+
+
+# ------------------------------------------------------------------
+# Row construction
+# ------------------------------------------------------------------
+
+def _build_rows_table(
+    game_cols: Tuple[List, ...],
+    lookups: Tuple[Dict, ...],
+    season: int,
+) -> pa.Table:
+    """Build and normalize the feature rows for the given games."""
+    return normalize_records(
+        "game_predictions_features", _build_game_rows(game_cols, lookups, season)
+    )
+
+
+def _build_game_rows(
+    game_cols: Tuple[List, ...],
+    lookups: Tuple[Dict, ...],
+    season: int,
+) -> List[Dict[str, Any]]:
+    """Build the two feature rows (home and away side) for each game.
+
+    Args:
+        game_cols: Parallel ``(gameId, homeTeamId, awayTeamId, homeScore,
+            awayScore, date)`` column lists for the games to process.
+        lookups: ``(adj, srs, rollup, team, lines)`` lookup dicts.
+        season: Season year written to every row.
+
+    Returns:
+        Feature records in game order.
+    """
+    g_ids, g_home, g_away, g_home_score, g_away_score, g_dates = game_cols
+    adj_lookup, srs_lookup, rollup_lookup, team_lookup, lines_lookup = lookups
     records: List[Dict[str, Any]] = []
     for i in range(len(g_ids)):
         gid = g_ids[i]
@@ -73,7 +131,7 @@ def build(cfg: Config, season: int) -> pa.Table:
         hs = g_home_score[i]
         aws = g_away_score[i]
 
-        line_info = lines_lookup.get(int(gid) if gid else None, {})
+        line_info = lines_lookup.get(gid, {})
 
         for is_home in (True, False):
             tid = home_tid if is_home else away_tid
@@ -81,20 +139,17 @@ def build(cfg: Config, season: int) -> pa.Table:
             if tid is None or oid is None:
                 continue
 
-            tid_int = int(tid)
-            oid_int = int(oid)
-
-            t_info = team_lookup.get(tid_int, {})
-            o_info = team_lookup.get(oid_int, {})
+            t_info = team_lookup.get(tid, {})
+            o_info = team_lookup.get(oid, {})
 
-            t_adj = adj_lookup.get(tid_int, {})
-            o_adj = adj_lookup.get(oid_int, {})
+            t_adj = adj_lookup.get(tid, {})
+            o_adj = adj_lookup.get(oid, {})
 
-            t_srs = srs_lookup.get(tid_int)
-            o_srs = srs_lookup.get(oid_int)
+            t_srs = srs_lookup.get(tid)
+            o_srs = srs_lookup.get(oid)
 
-            t_ru = rollup_lookup.get(tid_int, {})
-            o_ru = rollup_lookup.get(oid_int, {})
+            t_ru = rollup_lookup.get(tid, {})
+            o_ru = rollup_lookup.get(oid, {})
 
             # Compute team-relative spread
             spread = line_info.get("spread")
@@ -122,11 +177,11 @@ def build(cfg: Config, season: int) -> pa.Table:
             )
 
             records.append({
-                "gameId": int(gid),
+                "gameId": gid,
                 "season": season,
                 "game_date": date_str,
-                "teamId": tid_int,
-                "opponentId": oid_int,
+                "teamId": tid,
+                "opponentId": oid,
                 "is_home": is_home,
                 "team_name": t_info.get("school"),
                 "team_conference": t_conf,
@@ -164,10 +219,7 @@ def build(cfg: Config, season: int) -> pa.Table:
                 "team_win": team_win,
             })
 
-    if not records:
-        return _empty_table()
-
-    return normalize_records("game_predictions_features", records)
+    return records
 
 
 # ------------------------------------------------------------------
@@ -179,35 +231,22 @@ def _build_adj_lookup(
 ) -> Dict[int, Dict[str, Optional[float]]]:
     """Build a teamId -> {off, def, net} lookup from adjusted ratings."""
     adj = read_silver_table(s3, cfg, "fct_ratings_adjusted", season=season)
-    lookup: Dict[int, Dict[str, Optional[float]]] = {}
-    if adj.num_rows == 0:
-        return lookup
-    tids = pydict_get(adj, "teamid")
-    offs = pydict_get_first(adj, ["offenserating", "offensiveRating"])
-    defs = pydict_get_first(adj, ["defenserating", "defensiveRating"])
-    nets = pydict_get(adj, "netrating")
-    for i, tid in enumerate(tids):
-        if tid is None:
-            continue
-        lookup[int(tid)] = {"off": offs[i], "def": defs[i], "net": nets[i]}
-    return lookup
+    rows = _keyed_rows(adj, "teamid", [
+        ["offenserating", "offensiveRating"],
+        ["defenserating", "defensiveRating"],
+        "netrating",
+    ])
+    return {tid: {"off": off, "def": dfn, "net": net} for tid, off, dfn, net in rows}
 
 
 def _build_srs_lookup(
     s3: S3IO, cfg: Config, season: int,
 ) -> Dict[int, Optional[float]]:
     """Build a teamId -> srs_rating lookup."""
-    srs = filter_by_season(read_silver_table(s3, cfg, "fct_ratings_srs"), season)
-    lookup: Dict[int, Optional[float]] = {}
-    if srs.num_rows == 0:
-        return lookup
-    tids = pydict_get(srs, "teamId")
-    ratings = pydict_get(srs, "rating")
-    for i, tid in enumerate(tids):
-        if tid is None:
-            continue
-        lookup[int(tid)] = ratings[i]
-    return lookup
+    srs = read_silver_table(
+        s3, cfg, "fct_ratings_srs", filters=[("season", "=", season)]
+    )
+    return {tid: rating for tid, rating in _keyed_rows(srs, "teamId", ["rating"])}
 
 
 def _build_rollup_lookup(
@@ -215,48 +254,27 @@ def _build_rollup_lookup(
 ) -> Dict[int, Dict[str, Optional[float]]]:
     """Build a teamId -> {ppg, opp_ppg, pace, efg, tov, oreb, ftr} lookup."""
     ru = read_silver_table(s3, cfg, "fct_pbp_team_daily_rollup", season=season)
-    lookup: Dict[int, Dict[str, Optional[float]]] = {}
-    if ru.num_rows == 0:
-        return lookup
-    tids = pydict_get(ru, "teamid")
-    ppg = pydict_get(ru, "team_points_per_game")
-    opp_ppg = pydict_get(ru, "opp_points_per_game")
-    pace = pydict_get(ru, "pace")
-    efg = pydict_get(ru, "team_efg_pct")
-    tov = pydict_get(ru, "team_tov_ratio")
-    oreb = pydict_get(ru, "team_oreb_pct")
-    ftr = pydict_get(ru, "team_ft_rate")
-    for i, tid in enumerate(tids):
-        if tid is None:
-            continue
-        lookup[int(tid)] = {
-            "ppg": ppg[i],
-            "opp_ppg": opp_ppg[i],
-            "pace": pace[i],
-            "efg": efg[i],
-            "tov": tov[i],
-            "oreb": oreb[i],
-            "ftr": ftr[i],
+    rows = _keyed_rows(ru, "teamid", [
+        "team_points_per_game",
+        "opp_points_per_game",
+        "pace",
+        "team_efg_pct",
+        "team_tov_ratio",
+        "team_oreb_pct",
+        "team_ft_rate",
+    ])
+    return {
+        tid: {
+            "ppg": ppg,
+            "opp_ppg": opp_ppg,
+            "pace": pace,
+            "efg": efg,
+            "tov": tov,
+            "oreb": oreb,
+            "ftr": ftr,
         }
-    return lookup
-
-
-def _build_team_lookup(
-    s3: S3IO, cfg: Config,
-) -> Dict[int, Dict[str, Optional[str]]]:
-    """Build a teamId -> {school, conference} lookup from dim_teams."""
-    dim = read_silver_table(s3, cfg, "dim_teams")
-    lookup: Dict[int, Dict[str, Optional[str]]] = {}
-    if dim.num_rows == 0:
-        return lookup
-    tids = pydict_get(dim, "teamId")
-    schools = pydict_get(dim, "school")
-    confs = pydict_get(dim, "conference")
-    for i, tid in enumerate(tids):
-        if tid is None:
-            continue
-        lookup[int(tid)] = {"school": schools[i], "conference": confs[i]}
-    return lookup
+        for tid, ppg, opp_ppg, pace, efg, tov, oreb, ftr in rows
+    }
 
 
 def _build_lines_lookup(
@@ -267,27 +285,50 @@ def _build_lines_lookup(
     Uses the first available provider per game.
     """
     lines = read_silver_table(s3, cfg, "fct_lines", season=season)
-    lookup: Dict[int, Dict[str, Any]] = {}
-    if lines.num_rows == 0:
-        return lookup
-    gids = pydict_get(lines, "gameId")
-    spreads = pydict_get(lines, "spread")
-    ous = pydict_get(lines, "overUnder")
-    hmls = pydict_get(lines, "homeMoneyline")
-    amls = pydict_get(lines, "awayMoneyline")
-    for i, gid in enumerate(gids):
-        if gid is None:
-            continue
-        gid_int = int(gid)
-        if gid_int in lookup:
-            continue  # first provider wins
-        lookup[gid_int] = {
-            "spread": spreads[i] if i < len(spreads) else None,
-            "overUnder": ous[i] if i < len(ous) else None,
-            "homeMoneyline": hmls[i] if i < len(hmls) else None,
-            "awayMoneyline": amls[i] if i < len(amls) else None,
+    if lines.num_rows == 0 or "gameId" not in lines.column_names:
+        return {}
+
+    # First provider wins: find each game's first row index with an Arrow
+    # group-by (single-threaded, so order is deterministic) and take those
+    # rows, so the Python loop below runs once per game instead of per line.
+    row_index = pa.table({
+        "gameId": lines.column("gameId"),
+        "row": pa.array(np.arange(lines.num_rows, dtype=np.int64)),
+    })
+    first_rows = row_index.group_by("gameId", use_threads=False).aggregate([("row", "min")])
+    firsts = lines.take(first_rows.column("row_min"))
+
+    rows = _keyed_rows(firsts, "gameId", [
+        "spread", "overUnder", "homeMoneyline", "awayMoneyline",
+    ])
+    return {
+        gid: {
+            "spread": spread,
+            "overUnder": ou,
+            "homeMoneyline": hml,
+            "awayMoneyline": aml,
         }
-    return lookup
+        for gid, spread, ou, hml, aml in rows
+    }
+
+
+def _keyed_rows(
+    table: pa.Table,
+    key_col: str,
+    value_cols: List[Union[str, List[str]]],
+) -> Iterator[Tuple]:
+    """Yield ``(key, *values)`` tuples for rows with a non-null integer key.
+
+    The key column is cast to int64 and null-key rows are dropped in Arrow,
+    so only the surviving values are converted to Python objects. Each
+    ``value_cols`` entry is a column name or a list of aliases.
+    """
+    if table.num_rows == 0:
+        return iter(())
+    keys = arrow_column(table, key_col, pa.int64())
+    valid = pc.is_valid(keys)
+    columns = [keys] + [pydict_get_arr(table, col) for col in value_cols]
+    return zip(*(pc.filter(col, valid).to_pylist() for col in columns))
 
 
 def _empty_table() -> pa.Table:
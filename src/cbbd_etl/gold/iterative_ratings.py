@@ -18,15 +18,25 @@ Key design:
 
 from __future__ import annotations
 
+import functools
 import math
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 # Reasonable bounds for per-100-possession efficiency. Values outside this
 # range indicate bad possession data (e.g. 7 possessions → 685 OE).
 _EFF_FLOOR = 40.0
 _EFF_CEIL = 200.0
 
+# Solver arrays are float32: ratings of order 40-200 keep ~1e-5 absolute
+# precision, far below the convergence tolerance, at half the memory traffic.
+# Per-team sums are still accumulated in float64 by np.bincount.
+_DTYPE = np.float32
+_EFF_FLOOR_32 = np.float32(_EFF_FLOOR)
+_EFF_CEIL_32 = np.float32(_EFF_CEIL)
+
 
 @dataclass
 class GameObs:
@@ -45,10 +55,58 @@ class GameObs:
     weight: float  # recency decay weight
 
 
+@dataclass(frozen=True)
+class GameObsArray:
+    """Column-oriented (struct-of-arrays) form of a list of ``GameObs``.
+
+    Each field is a NumPy array with one entry per team-game observation.
+    ``game_date`` is not carried: the solver never reads it, and callers
+    apply recency through ``weight``.
+    """
+
+    game_id: np.ndarray  # int64
+    team_id: np.ndarray  # int64
+    opp_id: np.ndarray  # int64
+    team_pts: np.ndarray  # float64
+    team_poss: np.ndarray  # float64
+    opp_pts: np.ndarray  # float64
+    opp_poss: np.ndarray  # float64
+    is_home: np.ndarray  # bool
+    is_neutral: np.ndarray  # bool
+    weight: np.ndarray  # float64
+
+    def __len__(self) -> int:
+        return len(self.team_id)
+
+    @classmethod
+    def from_list(cls, games: List[GameObs]) -> "GameObsArray":
+        """Convert a list of ``GameObs`` into parallel arrays."""
+        count = len(games)
+
+        def col(attr: str, dtype: type) -> np.ndarray:
+            return np.fromiter((getattr(g, attr) for g in games), dtype=dtype, count=count)
+
+        return cls(
+            game_id=col("game_id", np.int64),
+            team_id=col("team_id", np.int64),
+            opp_id=col("opp_id", np.int64),
+            team_pts=col("team_pts", np.float64),
+            team_poss=col("team_poss", np.float64),
+            opp_pts=col("opp_pts", np.float64),
+            opp_poss=col("opp_poss", np.float64),
+            is_home=col("is_home", np.bool_),
+            is_neutral=col("is_neutral", np.bool_),
+            weight=col("weight", np.float64),
+        )
+
+
+@functools.lru_cache(maxsize=512)
 def exponential_decay_weight(days_ago: int, half_life: float = 30.0) -> float:
     """Compute recency weight using exponential decay.
 
     w = 0.5^(days_ago / half_life). Returns 1.0 for days_ago <= 0.
+    Memoized: a season only spans a few hundred distinct integer
+    ``days_ago`` values, so repeated calls are a cache lookup.
     """
     if days_ago <= 0:
         return 1.0
@@ -77,8 +135,27 @@ def compute_barthag(adj_oe: float, adj_de: float, exp: float = 11.5) -> float:
     return result if math.isfinite(result) else 0.5
 
 
+def compute_barthag_batch(
+    adj_oe: np.ndarray, adj_de: np.ndarray, exp: float = 11.5
+) -> np.ndarray:
+    """Vectorized :func:`compute_barthag` over arrays of team ratings.
+
+    Computed in float64 (``adj ** 11.5`` overflows float32). Entries that
+    are non-finite, both non-positive, or overflow are 0.5.
+    """
+    adj_oe = np.asarray(adj_oe, dtype=np.float64)
+    adj_de = np.asarray(adj_de, dtype=np.float64)
+    ok = np.isfinite(adj_oe) & np.isfinite(adj_de) & ((adj_oe > 0) | (adj_de > 0))
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        oe_pow = np.power(adj_oe, exp)
+        de_pow = np.power(adj_de, exp)
+        result = oe_pow / (oe_pow + de_pow)
+    result[~ok | ~np.isfinite(result)] = 0.5
+    return result
+
+
 def solve_ratings(
-    games: List[GameObs],
+    games: Union[List[GameObs], GameObsArray],
     prior: Optional[Dict[int, Tuple[float, float]]] = None,
     hca_oe: float = 1.4,
     hca_de: float = 1.4,
@@ -96,7 +173,8 @@ def solve_ratings(
     occurs with aggregate-then-adjust approaches.
 
     Args:
-        games: List of game observations (already filtered to desired window).
+        games: Game observations (already filtered to desired window), either
+            as a ``GameObsArray`` or a list of ``GameObs``.
         prior: Optional warm-start from previous date: {team_id: (adj_oe, adj_de)}.
         hca_oe: Home court advantage added to home team OE (pts/100 poss).
         hca_de: Home court advantage subtracted from home team DE (pts/100 poss).
@@ -113,241 +191,249 @@ def solve_ratings(
         Dict keyed by team_id with keys: adj_oe, adj_de, raw_oe, raw_de,
         sos_oe, sos_de, games_played, adj_tempo, iterations.
     """
-    if not games:
+    if not isinstance(games, GameObsArray):
+        games = GameObsArray.from_list(games)
+    if len(games) == 0:
         return {}
 
-    # Collect all team IDs
-    team_ids_set = set()
-    for g in games:
-        team_ids_set.add(g.team_id)
-        team_ids_set.add(g.opp_id)
-    team_ids = sorted(team_ids_set)
+    # Collect all team IDs; a team's dense index is its position in the
+    # sorted ID array, so edge endpoints map with one searchsorted call.
+    team_ids_arr = np.unique(np.concatenate((games.team_id, games.opp_id)))
+    team_ids: List[int] = team_ids_arr.tolist()
+    n = len(team_ids)
 
-    # Index games by team
-    team_games: Dict[int, List[GameObs]] = {tid: [] for tid in team_ids}
-    for g in games:
-        team_games[g.team_id].append(g)
+    # Only games with possessions contribute to any aggregate, so invalid
+    # games are dropped here and the solver never has to test for them.
+    valid = games.team_poss > 0
 
     # Compute weighted league averages
-    total_w_pts = 0.0
-    total_w_poss = 0.0
-    for g in games:
-        if g.team_poss > 0:
-            total_w_pts += g.weight * g.team_pts
-            total_w_poss += g.weight * g.team_poss
-
+    total_w_pts = float(np.dot(games.weight[valid], games.team_pts[valid]))
+    total_w_poss = float(np.dot(games.weight[valid], games.team_poss[valid]))
     league_avg = (total_w_pts / total_w_poss * 100.0) if total_w_poss > 0 else 100.0
 
-    # Pre-compute per-game HCA-adjusted OE and DE.
-    # game_oe[tid][i] corresponds to team_games[tid][i].
-    game_oe: Dict[int, List[float]] = {tid: [] for tid in team_ids}
-    game_de: Dict[int, List[float]] = {tid: [] for tid in team_ids}
-    game_valid: Dict[int, List[bool]] = {tid: [] for tid in team_ids}
-
-    for tid in team_ids:
-        for g in team_games[tid]:
-            if g.team_poss <= 0:
-                game_oe[tid].append(0.0)
-                game_de[tid].append(0.0)
-                game_valid[tid].append(False)
-                continue
-
-            hca_off = 0.0
-            hca_def = 0.0
-            if not g.is_neutral:
-                if g.is_home:
-                    hca_off = hca_oe
-                    hca_def = -hca_de
-                else:
-                    hca_off = -hca_oe
-                    hca_def = hca_de
-
-            adj_team_pts = g.team_pts - hca_off * g.team_poss / 100.0
-            adj_opp_pts = g.opp_pts - hca_def * g.opp_poss / 100.0
-
-            oe = adj_team_pts / g.team_poss * 100.0
-            de = (adj_opp_pts / g.opp_poss * 100.0) if g.opp_poss > 0 else league_avg
-
-            # Clamp extreme values from bad possession data
-            oe = max(_EFF_FLOOR, min(_EFF_CEIL, oe))
-            de = max(_EFF_FLOOR, min(_EFF_CEIL, de))
-
-            game_oe[tid].append(oe)
-            game_de[tid].append(de)
-            game_valid[tid].append(True)
+    # Home court sign per game: +1 home, -1 away, 0 neutral
+    hca_sign = np.where(
+        games.is_neutral[valid], 0.0, np.where(games.is_home[valid], 1.0, -1.0)
+    )
+
+    # Sort edges by team so each team's games are contiguous (stable, so the
+    # per-team accumulation order matches the input order).
+    edge_team_idx = np.searchsorted(team_ids_arr, games.team_id[valid])
+    edge_opp_idx = np.searchsorted(team_ids_arr, games.opp_id[valid])
+    order = np.argsort(edge_team_idx, kind="stable")
+    game_team_idx_flat = edge_team_idx[order]
+    game_opp_idx_flat = edge_opp_idx[order]
+    game_weight_flat = games.weight[valid][order]
+    team_pts = games.team_pts[valid][order]
+    team_poss = games.team_poss[valid][order]
+    opp_pts = games.opp_pts[valid][order]
+    opp_poss = games.opp_poss[valid][order]
+    hca_off_flat = hca_sign[order] * hca_oe
+    hca_def_flat = hca_sign[order] * -hca_de
+
+    # Pre-compute per-game HCA-adjusted OE and DE
+    adj_team_pts = team_pts - hca_off_flat * team_poss / 100.0
+    adj_opp_pts = opp_pts - hca_def_flat * opp_poss / 100.0
+    game_oe_flat = adj_team_pts / team_poss * 100.0
+    game_de_flat = np.full(len(opp_poss), league_avg)
+    has_opp_poss = opp_poss > 0
+    game_de_flat[has_opp_poss] = adj_opp_pts[has_opp_poss] / opp_poss[has_opp_poss] * 100.0
+
+    # Clamp extreme values from bad possession data
+    game_oe_flat = np.clip(game_oe_flat, _EFF_FLOOR, _EFF_CEIL).astype(_DTYPE)
+    game_de_flat = np.clip(game_de_flat, _EFF_FLOOR, _EFF_CEIL).astype(_DTYPE)
+    game_weight_flat = game_weight_flat.astype(_DTYPE)
+
+    # Weighted per-game values are constant across iterations
+    w_game_oe = game_weight_flat * game_oe_flat
+    w_game_de = game_weight_flat * game_de_flat
+
+    def _team_sum(values: np.ndarray) -> np.ndarray:
+        return np.bincount(game_team_idx_flat, weights=values, minlength=n)
 
     # Compute raw aggregates (weighted average of per-game values)
-    raw: Dict[int, Dict] = {}
-    team_total_weight: Dict[int, float] = {}
-
-    for tid in team_ids:
-        w_oe = 0.0
-        w_de = 0.0
-        w_total = 0.0
-        w_tempo_poss = 0.0
-        w_tempo_weight = 0.0
-        gp = 0
-        for i, g in enumerate(team_games[tid]):
-            if not game_valid[tid][i]:
-                continue
-            w_oe += g.weight * game_oe[tid][i]
-            w_de += g.weight * game_de[tid][i]
-            w_total += g.weight
-            w_tempo_poss += g.weight * g.team_poss
-            w_tempo_weight += g.weight
-            gp += 1
-
-        raw_oe = (w_oe / w_total) if w_total > 0 else league_avg
-        raw_de = (w_de / w_total) if w_total > 0 else league_avg
-        raw_tempo = (w_tempo_poss / w_tempo_weight) if w_tempo_weight > 0 else 0.0
-
-        raw[tid] = {
-            "raw_oe": raw_oe,
-            "raw_de": raw_de,
-            "raw_tempo": raw_tempo,
-            "games_played": gp,
-        }
-        team_total_weight[tid] = w_tempo_weight
+    games_played = np.bincount(game_team_idx_flat, minlength=n)
+    w_total = _team_sum(game_weight_flat)
+    has_weight = w_total > 0
+    has_games = games_played > 0
+
+    raw_oe = _safe_ratio(_team_sum(w_game_oe), w_total, has_weight, league_avg)
+    raw_de = _safe_ratio(_team_sum(w_game_de), w_total, has_weight, league_avg)
+    raw_tempo = _safe_ratio(
+        _team_sum(game_weight_flat * team_poss), w_total, has_weight, 0.0, np.float64
+    )
+
+    # Opponent tempo only depends on raw tempo, so it is accumulated here
+    # with the other static aggregates rather than after the solver.
+    tempo_mask = has_games & (raw_tempo > 0)
+    league_avg_tempo = float(raw_tempo[tempo_mask].mean()) if tempo_mask.any() else 0.0
+    avg_opp_tempo = _safe_ratio(
+        _team_sum(game_weight_flat * raw_tempo[game_opp_idx_flat]),
+        w_total,
+        has_weight,
+        league_avg_tempo,
+        np.float64,
+    )
 
     # Initialize adjusted ratings
-    adj_oe_map: Dict[int, float] = {}
-    adj_de_map: Dict[int, float] = {}
-    for tid in team_ids:
-        if prior and tid in prior:
-            p_oe, p_de = prior[tid]
-            # Guard against NaN/inf warm-start values
-            adj_oe_map[tid] = p_oe if math.isfinite(p_oe) else league_avg
-            adj_de_map[tid] = p_de if math.isfinite(p_de) else league_avg
-        else:
-            adj_oe_map[tid] = raw[tid]["raw_oe"]
-            adj_de_map[tid] = raw[tid]["raw_de"]
+    adj_oe = raw_oe.copy()
+    adj_de = raw_de.copy()
+    if prior:
+        for i, tid in enumerate(team_ids):
+            if tid in prior:
+                p_oe, p_de = prior[tid]
+                # Guard against NaN/inf warm-start values
+                adj_oe[i] = p_oe if math.isfinite(p_oe) else league_avg
+                adj_de[i] = p_de if math.isfinite(p_de) else league_avg
+
+    # Parameters at their neutral defaults (damping=1.0, sos_exponent=1.0,
+    # shrinkage=0.0) skip the corresponding array passes entirely; decide
+    # once here rather than inside the loop.
+    blend = damping != 1.0
+
+    # Solver work buffers, allocated once and reused by every iteration.
+    # new_* and adj_* are double-buffered: swapped instead of reallocated.
+    n_edges = len(game_opp_idx_flat)
+    sos_mult_oe = np.empty(n, dtype=_DTYPE)
+    sos_mult_de = np.empty(n, dtype=_DTYPE)
+    edge_oe = np.empty(n_edges, dtype=_DTYPE)
+    edge_de = np.empty(n_edges, dtype=_DTYPE)
+    new_oe = np.empty(n, dtype=_DTYPE)
+    new_de = np.empty(n, dtype=_DTYPE)
+    delta_oe = np.empty(n, dtype=_DTYPE)
+    delta_de = np.empty(n, dtype=_DTYPE)
+    reset = np.empty(n, dtype=bool)
+    no_games = ~has_games
 
     # Iterative solver with per-game SOS adjustments
     iterations_used = 0
     for iteration in range(max_iter):
         iterations_used = iteration + 1
-        new_oe: Dict[int, float] = {}
-        new_de: Dict[int, float] = {}
-
-        for tid in team_ids:
-            tg = team_games[tid]
-            if not tg or raw[tid]["games_played"] == 0:
-                new_oe[tid] = league_avg
-                new_de[tid] = league_avg
-                continue
-
-            w_adj_oe = 0.0
-            w_adj_de = 0.0
-            w_total = 0.0
-            for i, g in enumerate(tg):
-                if not game_valid[tid][i]:
-                    continue
-
-                opp_de = adj_de_map.get(g.opp_id, league_avg)
-                opp_oe = adj_oe_map.get(g.opp_id, league_avg)
-
-                # Per-game SOS adjustment:
-                # adj_game_oe = game_oe * (league_avg / opp_adj_de)^alpha
-                # If opponent has strong defense (low adj_de), this boosts.
-                # If opponent has weak defense (high adj_de), this reduces.
-                # Alpha < 1 dampens the SOS effect.
-                if opp_de > 0:
-                    sos_mult_oe = (league_avg / opp_de) ** sos_exponent
-                    w_adj_oe += g.weight * game_oe[tid][i] * sos_mult_oe
-                else:
-                    w_adj_oe += g.weight * game_oe[tid][i]
-
-                if opp_oe > 0:
-                    sos_mult_de = (league_avg / opp_oe) ** sos_exponent
-                    w_adj_de += g.weight * game_de[tid][i] * sos_mult_de
-                else:
-                    w_adj_de += g.weight * game_de[tid][i]
-
-                w_total += g.weight
-
-            computed_oe = (w_adj_oe / w_total) if w_total > 0 else league_avg
-            computed_de = (w_adj_de / w_total) if w_total > 0 else league_avg
-
-            # Clamp to reasonable range
-            computed_oe = max(_EFF_FLOOR, min(_EFF_CEIL, computed_oe))
-            computed_de = max(_EFF_FLOOR, min(_EFF_CEIL, computed_de))
-
-            # Damped update: blend computed with previous (damping=1.0 means no blending)
-            val_oe = damping * computed_oe + (1.0 - damping) * adj_oe_map[tid]
-            val_de = damping * computed_de + (1.0 - damping) * adj_de_map[tid]
-
-            # Guard against NaN/inf from numerical instability
-            new_oe[tid] = val_oe if math.isfinite(val_oe) else league_avg
-            new_de[tid] = val_de if math.isfinite(val_de) else league_avg
-
-        # Check convergence.
-        max_delta = 0.0
-        for tid in team_ids:
-            d_oe = abs(new_oe[tid] - adj_oe_map[tid])
-            d_de = abs(new_de[tid] - adj_de_map[tid])
-            if math.isfinite(d_oe):
-                max_delta = max(max_delta, d_oe)
-            if math.isfinite(d_de):
-                max_delta = max(max_delta, d_de)
-
-        adj_oe_map = new_oe
-        adj_de_map = new_de
+
+        # Per-opponent SOS multipliers, gathered onto each game edge:
+        # adj_game_oe = game_oe * (league_avg / opp_adj_de)^alpha
+        # If opponent has strong defense (low adj_de), this boosts.
+        # If opponent has weak defense (high adj_de), this reduces.
+        # Alpha < 1 dampens the SOS effect. Non-positive ratings get no
+        # adjustment (multiplier 1.0).
+        _sos_multiplier(adj_de, league_avg, sos_exponent, out=sos_mult_oe)
+        _sos_multiplier(adj_oe, league_avg, sos_exponent, out=sos_mult_de)
+
+        np.take(sos_mult_oe, game_opp_idx_flat, out=edge_oe)
+        np.take(sos_mult_de, game_opp_idx_flat, out=edge_de)
+        edge_oe *= w_game_oe
+        edge_de *= w_game_de
+
+        new_oe.fill(league_avg)
+        new_de.fill(league_avg)
+        np.divide(_team_sum(edge_oe), w_total, out=new_oe, where=has_weight)
+        np.divide(_team_sum(edge_de), w_total, out=new_de, where=has_weight)
+
+        # Clamp to reasonable range
+        np.clip(new_oe, _EFF_FLOOR_32, _EFF_CEIL_32, out=new_oe)
+        np.clip(new_de, _EFF_FLOOR_32, _EFF_CEIL_32, out=new_de)
+
+        # Damped update: blend computed with previous (damping=1.0 means no blending)
+        if blend:
+            new_oe *= damping
+            new_de *= damping
+            np.multiply(adj_oe, 1.0 - damping, out=delta_oe)
+            np.multiply(adj_de, 1.0 - damping, out=delta_de)
+            new_oe += delta_oe
+            new_de += delta_de
+
+        # Guard against NaN/inf from numerical instability; teams without
+        # any valid games sit at the league average.
+        for new in (new_oe, new_de):
+            np.isfinite(new, out=reset)
+            np.logical_not(reset, out=reset)
+            reset |= no_games
+            np.copyto(new, league_avg, where=reset)
+
+        # Check convergence. Both buffers are finite after the guard above.
+        np.subtract(new_oe, adj_oe, out=delta_oe)
+        np.subtract(new_de, adj_de, out=delta_de)
+        np.abs(delta_oe, out=delta_oe)
+        np.abs(delta_de, out=delta_de)
+        max_delta = max(float(delta_oe.max()), float(delta_de.max()))
+
+        adj_oe, new_oe = new_oe, adj_oe
+        adj_de, new_de = new_de, adj_de
 
         if max_delta < tol:
             break
 
     # Apply post-convergence shrinkage toward league average
     if shrinkage > 0:
-        for tid in team_ids:
-            adj_oe_map[tid] = (1.0 - shrinkage) * adj_oe_map[tid] + shrinkage * league_avg
-            adj_de_map[tid] = (1.0 - shrinkage) * adj_de_map[tid] + shrinkage * league_avg
-
-    # Compute adjusted tempo
-    league_avg_tempo = 0.0
-    tempo_count = 0
-    for tid in team_ids:
-        if raw[tid]["games_played"] > 0 and raw[tid]["raw_tempo"] > 0:
-            league_avg_tempo += raw[tid]["raw_tempo"]
-            tempo_count += 1
-    if tempo_count > 0:
-        league_avg_tempo /= tempo_count
+        adj_oe = (1.0 - shrinkage) * adj_oe + shrinkage * league_avg
+        adj_de = (1.0 - shrinkage) * adj_de + shrinkage * league_avg
+
+    # Strength of schedule: weighted average of final opponent ratings,
+    # gathered into the solver's edge buffers (no new per-edge arrays)
+    np.take(adj_de, game_opp_idx_flat, out=edge_oe)
+    np.take(adj_oe, game_opp_idx_flat, out=edge_de)
+    edge_oe *= game_weight_flat
+    edge_de *= game_weight_flat
+    sos_oe = _safe_ratio(_team_sum(edge_oe), w_total, has_weight, league_avg)
+    sos_de = _safe_ratio(_team_sum(edge_de), w_total, has_weight, league_avg)
 
     # Build results
     result: Dict[int, Dict] = {}
-    for tid in team_ids:
-        tg = team_games[tid]
-        w_opp_de = 0.0
-        w_opp_oe = 0.0
-        w_total = 0.0
-        w_opp_tempo = 0.0
-        for g in tg:
-            if g.team_poss <= 0:
-                continue
-            w_opp_de += g.weight * adj_de_map.get(g.opp_id, league_avg)
-            w_opp_oe += g.weight * adj_oe_map.get(g.opp_id, league_avg)
-            w_opp_tempo += g.weight * raw.get(g.opp_id, {}).get("raw_tempo", league_avg_tempo)
-            w_total += g.weight
-
-        sos_oe = (w_opp_de / w_total) if w_total > 0 else league_avg
-        sos_de = (w_opp_oe / w_total) if w_total > 0 else league_avg
-        avg_opp_tempo = (w_opp_tempo / w_total) if w_total > 0 else league_avg_tempo
-
-        raw_tempo = raw[tid]["raw_tempo"]
-        if league_avg_tempo > 0 and avg_opp_tempo > 0:
-            adj_tempo = raw_tempo * (league_avg_tempo / avg_opp_tempo)
+    for i, tid in enumerate(team_ids):
+        team_raw_tempo = float(raw_tempo[i])
+        opp_tempo = float(avg_opp_tempo[i])
+        if league_avg_tempo > 0 and opp_tempo > 0:
+            adj_tempo = team_raw_tempo * (league_avg_tempo / opp_tempo)
         else:
-            adj_tempo = raw_tempo
+            adj_tempo = team_raw_tempo
 
         result[tid] = {
-            "adj_oe": adj_oe_map[tid],
-            "adj_de": adj_de_map[tid],
+            "adj_oe": float(adj_oe[i]),
+            "adj_de": float(adj_de[i]),
             "adj_tempo": adj_tempo,
-            "raw_oe": raw[tid]["raw_oe"],
-            "raw_de": raw[tid]["raw_de"],
-            "sos_oe": sos_oe,
-            "sos_de": sos_de,
-            "games_played": raw[tid]["games_played"],
+            "raw_oe": float(raw_oe[i]),
+            "raw_de": float(raw_de[i]),
+            "sos_oe": float(sos_oe[i]),
+            "sos_de": float(sos_de[i]),
+            "games_played": int(games_played[i]),
             "iterations": iterations_used,
         }
 
     return result
+
+
+def _safe_ratio(
+    numer: np.ndarray,
+    denom: np.ndarray,
+    mask: np.ndarray,
+    default: float,
+    dtype: type = _DTYPE,
+) -> np.ndarray:
+    """Element-wise ``numer / denom`` where ``mask`` is set, else ``default``."""
+    out = np.full(len(numer), default, dtype=dtype)
+    np.divide(numer, denom, out=out, where=mask)
+    return out
+
+
+def _sos_multiplier(
+    opp_rating: np.ndarray, league_avg: float, sos_exponent: float, out: np.ndarray
+) -> np.ndarray:
+    """Per-team SOS multiplier ``(league_avg / rating)^alpha`` written into ``out``.
+
+    Teams with a non-positive rating get a multiplier of 1.0.
+    """
+    # Fast path: ratings are clipped to [_EFF_FLOOR, _EFF_CEIL] after the
+    # first iteration, so the masked form is only needed for odd priors.
+    if opp_rating.min() > 0:
+        np.divide(league_avg, opp_rating, out=out)
+        # The default exponent of 1.0 is the identity; skip the pow entirely
+        if sos_exponent != 1.0:
+            np.power(out, sos_exponent, out=out)
+        return out
+
+    positive = opp_rating > 0
+    out.fill(1.0)
+    np.divide(league_avg, opp_rating, out=out, where=positive)
+    if sos_exponent != 1.0:
+        np.power(out, sos_exponent, out=out, where=positive)
+    return out
@@ -6,204 +6,230 @@ analysis and market efficiency research. One row per game per provider.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..config import Config
-from ..normalize import normalize_records
 from ..s3_io import S3IO
-from ._io_helpers import dedup_by, pydict_get, pydict_get_first, read_silver_table
-
-
-def build(cfg: Config, season: int) -> pa.Table:
+from ._io_helpers import (
+    arrow_column,
+    dedup_by,
+    dim_team_table,
+    read_silver_table,
+    values_and_mask,
+)
+
+# Only these columns are decoded from the silver Parquet files.
+_LINES_COLUMNS = [
+    "gameId", "provider", "spread", "overUnder", "homeMoneyline", "awayMoneyline",
+]
+_GAMES_COLUMNS = [
+    "gameId", "homeTeamId", "awayTeamId", "homeScore", "homePoints",
+    "awayScore", "awayPoints", "startDate", "startTime", "date",
+]
+
+# Low-cardinality string columns are dictionary-encoded (int32 codes).
+_DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+
+# Output layout, matching what normalize_records("market_lines_analysis", ...)
+# produces for a full record: columns sorted by name with the TableSpec types
+# (string columns below that repeat per row are stored as _DICT_STRING).
+_SCHEMA = pa.schema([
+    pa.field("ats_margin", pa.float64()),
+    pa.field("away_conference", _DICT_STRING),
+    pa.field("away_moneyline", pa.float64()),
+    pa.field("away_score", pa.int64()),
+    pa.field("away_team", _DICT_STRING),
+    pa.field("gameId", pa.int64()),
+    pa.field("game_date", pa.string()),
+    pa.field("home_conference", _DICT_STRING),
+    pa.field("home_covered", pa.bool_()),
+    pa.field("home_margin", pa.int64()),
+    pa.field("home_moneyline", pa.float64()),
+    pa.field("home_score", pa.int64()),
+    pa.field("home_team", _DICT_STRING),
+    pa.field("home_win", pa.bool_()),
+    pa.field("over_hit", pa.bool_()),
+    pa.field("over_under", pa.float64()),
+    pa.field("provider", _DICT_STRING),
+    pa.field("season", pa.int32()),
+    pa.field("spread", pa.float64()),
+    pa.field("spread_error", pa.float64()),
+    pa.field("total_points", pa.int64()),
+    pa.field("total_vs_line", pa.float64()),
+])
+_EMPTY_TABLE = _SCHEMA.empty_table()
+
+
+def build(cfg: Config, season: int, s3: Optional[S3IO] = None) -> pa.Table:
     """Build the market_lines_analysis gold table for a given season.
 
     Args:
         cfg: Pipeline configuration.
         season: Season year (e.g. 2024).
+        s3: S3 client to read through; the runner shares one across
+            transforms. A new client is created when omitted.
 
     Returns:
         A ``pyarrow.Table`` with one row per game per provider, containing
         lines/spreads merged with actual outcomes.
     """
-    s3 = S3IO(cfg.bucket, cfg.region)
+    if s3 is None:
+        s3 = S3IO(cfg.bucket, cfg.region)
+
+    # The three silver reads are independent and S3-latency bound, so
+    # issue them concurrently.
+    season_filter = [("season", "=", season)]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        lines_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_lines",
+            season=season, columns=_LINES_COLUMNS, filters=season_filter,
+        )
+        games_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_games",
+            season=season, columns=_GAMES_COLUMNS, filters=season_filter,
+        )
+        teams_fut = pool.submit(dim_team_table, s3, cfg)
+        lines_raw = lines_fut.result()
+        games_raw = games_fut.result()
+        teams = teams_fut.result()
 
     # ------------------------------------------------------------------
-    # 1. Read fct_lines
+    # 1. Lines
     # ------------------------------------------------------------------
-    lines = dedup_by(
-        read_silver_table(s3, cfg, "fct_lines", season=season),
-        ["gameId", "provider"],
-    )
+    lines = dedup_by(lines_raw, ["gameId", "provider"])
     if lines.num_rows == 0:
         return _empty_table()
 
-    l_gids = pydict_get(lines, "gameId")
-    l_providers = pydict_get(lines, "provider")
-    l_spreads = pydict_get(lines, "spread")
-    l_ous = pydict_get(lines, "overUnder")
-    l_hmls = pydict_get(lines, "homeMoneyline")
-    l_amls = pydict_get(lines, "awayMoneyline")
+    # _row preserves the input line order through the joins below.
+    lines_tbl = pa.table({
+        "_row": pa.array(np.arange(lines.num_rows, dtype=np.int64)),
+        "gameId": arrow_column(lines, "gameId", pa.int64()),
+        "provider": arrow_column(lines, "provider", pa.string()),
+        "spread": arrow_column(lines, "spread", pa.float64()),
+        "over_under": arrow_column(lines, "overUnder", pa.float64()),
+        "home_moneyline": arrow_column(lines, "homeMoneyline", pa.float64()),
+        "away_moneyline": arrow_column(lines, "awayMoneyline", pa.float64()),
+    })
 
     # ------------------------------------------------------------------
-    # 2. Read fct_games for outcomes
+    # 2. Game outcomes
     # ------------------------------------------------------------------
-    games = dedup_by(read_silver_table(s3, cfg, "fct_games", season=season), ["gameId"])
-    game_lookup: Dict[int, Dict[str, Any]] = {}
-    if games.num_rows > 0:
-        g_ids = pydict_get(games, "gameId")
-        g_home = pydict_get(games, "homeTeamId")
-        g_away = pydict_get(games, "awayTeamId")
-        g_hs = pydict_get_first(games, ["homeScore", "homePoints"])
-        g_as = pydict_get_first(games, ["awayScore", "awayPoints"])
-
-        g_dates: List[Optional[str]] = [None] * games.num_rows
-        for col_name in ("startDate", "startTime", "date"):
-            if col_name in games.column_names:
-                g_dates = pydict_get(games, col_name)
-                break
-
-        for i, gid in enumerate(g_ids):
-            if gid is None:
-                continue
-            game_lookup[int(gid)] = {
-                "homeTeamId": g_home[i],
-                "awayTeamId": g_away[i],
-                "homeScore": g_hs[i],
-                "awayScore": g_as[i],
-                "date": str(g_dates[i])[:10] if g_dates[i] else None,
-            }
+    games = dedup_by(games_raw, ["gameId"])
+    if games.num_rows == 0:
+        return _empty_table()
+
+    games_tbl = pa.table({
+        "gameId": arrow_column(games, "gameId", pa.int64()),
+        "homeTeamId": arrow_column(games, "homeTeamId", pa.int64()),
+        "awayTeamId": arrow_column(games, "awayTeamId", pa.int64()),
+        "home_score": arrow_column(games, ["homeScore", "homePoints"], pa.int64()),
+        "away_score": arrow_column(games, ["awayScore", "awayPoints"], pa.int64()),
+        "game_date": _date_column(games),
+    })
+
+    # Inner join: only games with both lines and outcomes
+    joined = lines_tbl.join(games_tbl, keys="gameId", join_type="inner")
+    if joined.num_rows == 0:
+        return _empty_table()
 
     # ------------------------------------------------------------------
-    # 3. Team lookup
+    # 3. Team names/conferences (left joins on home and away team)
     # ------------------------------------------------------------------
-    team_lookup = _build_team_lookup(s3, cfg)
+    for side in ("home", "away"):
+        side_teams = teams.rename_columns(
+            [f"{side}TeamId", f"{side}_team", f"{side}_conference"]
+        )
+        joined = joined.join(side_teams, keys=f"{side}TeamId", join_type="left outer")
+    joined = joined.sort_by("_row")
 
     # ------------------------------------------------------------------
-    # 4. Build output rows
+    # 4. Derived columns (nulls propagate from missing scores/lines)
     # ------------------------------------------------------------------
-    records: List[Dict[str, Any]] = []
-    for i in range(len(l_gids)):
-        gid = l_gids[i]
-        if gid is None:
-            continue
-        gid_int = int(gid)
-        game = game_lookup.get(gid_int)
-        if game is None:
-            continue  # inner join: only games with both lines and outcomes
-
-        spread = _to_float(l_spreads[i])
-        ou = _to_float(l_ous[i])
-        home_ml = _to_float(l_hmls[i])
-        away_ml = _to_float(l_amls[i])
-
-        hs = _to_int(game.get("homeScore"))
-        aws = _to_int(game.get("awayScore"))
-
-        home_tid = game.get("homeTeamId")
-        away_tid = game.get("awayTeamId")
-
-        h_info = team_lookup.get(int(home_tid), {}) if home_tid else {}
-        a_info = team_lookup.get(int(away_tid), {}) if away_tid else {}
-
-        # Derived columns
-        total_pts: Optional[int] = None
-        home_margin: Optional[int] = None
-        home_win: Optional[bool] = None
-        home_covered: Optional[bool] = None
-        over_hit: Optional[bool] = None
-        ats_margin: Optional[float] = None
-        total_vs_line: Optional[float] = None
-        spread_error: Optional[float] = None
-
-        if hs is not None and aws is not None:
-            total_pts = hs + aws
-            home_margin = hs - aws
-            home_win = hs > aws
-
-            if spread is not None:
-                ats_margin = float(home_margin) + spread
-                home_covered = ats_margin > 0
-                spread_error = abs(float(home_margin) - (-spread))
-
-            if ou is not None:
-                total_vs_line = float(total_pts) - ou
-                over_hit = float(total_pts) > ou
-
-        records.append({
-            "gameId": gid_int,
-            "season": season,
-            "game_date": game.get("date"),
-            "provider": l_providers[i],
-            "home_team": h_info.get("school"),
-            "away_team": a_info.get("school"),
-            "home_conference": h_info.get("conference"),
-            "away_conference": a_info.get("conference"),
-            "spread": spread,
-            "over_under": ou,
-            "home_moneyline": home_ml,
-            "away_moneyline": away_ml,
-            "home_score": hs,
-            "away_score": aws,
-            "total_points": total_pts,
-            "home_margin": home_margin,
-            "home_win": home_win,
-            "home_covered": home_covered,
-            "over_hit": over_hit,
-            "ats_margin": ats_margin,
-            "total_vs_line": total_vs_line,
-            "spread_error": spread_error,
-        })
-
-    if not records:
-        return _empty_table()
-
-    return normalize_records("market_lines_analysis", records)
+    hs = joined.column("home_score")
+    aws = joined.column("away_score")
+    spread = joined.column("spread")
+    ou = joined.column("over_under")
+
+    columns = {
+        "gameId": joined.column("gameId"),
+        "season": pa.array(np.full(joined.num_rows, season, dtype=np.int32)),
+        "game_date": joined.column("game_date"),
+        "provider": pc.dictionary_encode(joined.column("provider")),
+        "home_team": joined.column("home_team"),
+        "away_team": joined.column("away_team"),
+        "home_conference": joined.column("home_conference"),
+        "away_conference": joined.column("away_conference"),
+        "spread": spread,
+        "over_under": ou,
+        "home_moneyline": joined.column("home_moneyline"),
+        "away_moneyline": joined.column("away_moneyline"),
+        "home_score": hs,
+        "away_score": aws,
+        **_derived_columns(hs, aws, spread, ou),
+    }
+    return pa.Table.from_arrays([columns[name] for name in _SCHEMA.names], schema=_SCHEMA)
 
 
 # ------------------------------------------------------------------
 # Private helpers
 # ------------------------------------------------------------------
 
-def _to_float(val: Any) -> Optional[float]:
-    """Convert to float, returning None on failure."""
-    if val is None:
-        return None
-    try:
-        return float(val)
-    except (TypeError, ValueError):
-        return None
-
-
-def _to_int(val: Any) -> Optional[int]:
-    """Convert to int, returning None on failure."""
-    if val is None:
-        return None
-    try:
-        return int(val)
-    except (TypeError, ValueError):
-        return None
-
-
-def _build_team_lookup(
-    s3: S3IO, cfg: Config,
-) -> Dict[int, Dict[str, Optional[str]]]:
-    """Build teamId -> {school, conference} from dim_teams."""
-    dim = read_silver_table(s3, cfg, "dim_teams")
-    lookup: Dict[int, Dict[str, Optional[str]]] = {}
-    if dim.num_rows == 0:
-        return lookup
-    tids = pydict_get(dim, "teamId")
-    schools = pydict_get(dim, "school")
-    confs = pydict_get(dim, "conference")
-    for i, tid in enumerate(tids):
-        if tid is None:
-            continue
-        lookup[int(tid)] = {"school": schools[i], "conference": confs[i]}
-    return lookup
+def _date_column(games: pa.Table) -> pa.ChunkedArray:
+    """First available game date column as a ``YYYY-MM-DD`` string (empty -> null)."""
+    for col_name in ("startDate", "startTime", "date"):
+        if col_name in games.column_names:
+            dates = pc.utf8_slice_codeunits(
+                arrow_column(games, col_name, pa.string()), 0, 10
+            )
+            return pc.if_else(pc.equal(dates, ""), pa.scalar(None, pa.string()), dates)
+    return pa.chunked_array([pa.nulls(games.num_rows, type=pa.string())])
+
+
+def _derived_columns(
+    hs: pa.ChunkedArray,
+    aws: pa.ChunkedArray,
+    spread: pa.ChunkedArray,
+    ou: pa.ChunkedArray,
+) -> Dict[str, pa.Array]:
+    """Compute the outcome-vs-line columns in one NumPy pass.
+
+    Each input is split once into a null-filled value array and a null mask;
+    every output is null wherever one of its inputs is.
+    """
+    hs_v, hs_null = values_and_mask(hs, 0)
+    aws_v, aws_null = values_and_mask(aws, 0)
+    spread_v, spread_null = values_and_mask(spread, 0.0)
+    ou_v, ou_null = values_and_mask(ou, 0.0)
+
+    score_null = hs_null | aws_null
+    ats_null = score_null | spread_null
+    line_null = score_null | ou_null
+
+    total = hs_v + aws_v
+    margin = hs_v - aws_v
+    total_f = total.astype(np.float64)
+    ats_margin = margin.astype(np.float64) + spread_v
+    total_vs_line = total_f - ou_v
+    return {
+        "total_points": pa.array(total, mask=score_null),
+        "home_margin": pa.array(margin, mask=score_null),
+        "home_win": pa.array(hs_v > aws_v, mask=score_null),
+        "home_covered": pa.array(ats_margin > 0.0, mask=ats_null),
+        "over_hit": pa.array(total_f > ou_v, mask=line_null),
+        "ats_margin": pa.array(ats_margin, mask=ats_null),
+        "total_vs_line": pa.array(total_vs_line, mask=line_null),
+        "spread_error": pa.array(np.abs(ats_margin), mask=ats_null),
+    }
 
 
 def _empty_table() -> pa.Table:
-    """Return an empty table with the market_lines_analysis schema."""
-    return normalize_records("market_lines_analysis", [])
+    """Return an empty table with the market_lines_analysis schema.
+
+    Tables are immutable, so one instance built at import is shared.
+    """
+    return _EMPTY_TABLE
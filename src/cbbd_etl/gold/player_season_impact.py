@@ -6,244 +6,362 @@ stats, shooting breakdown, and recruiting rank context.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..config import Config
-from ..normalize import normalize_records
 from ..s3_io import S3IO
-from ._io_helpers import filter_by_season, pydict_get, pydict_get_first, read_silver_table
-
-
-def build(cfg: Config, season: int) -> pa.Table:
+from ._io_helpers import (
+    arrow_column,
+    dedup_by,
+    first_column_name,
+    float_to_int,
+    parse_stat_dict,
+    parse_stat_total,
+    read_silver_table,
+    values_and_mask,
+)
+
+# Rows per tile for the derived-metric pass (~64 KiB per float64 column).
+_TILE_ROWS = 8192
+
+# Low-cardinality string columns are dictionary-encoded (int32 codes).
+_DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+
+# Output layout, matching what normalize_records("player_season_impact", ...)
+# produces for a full record: columns sorted by name with the TableSpec types
+# (team and conference are stored as _DICT_STRING).
+_SCHEMA = pa.schema([
+    pa.field("apg", pa.float64()),
+    pa.field("assists", pa.float64()),
+    pa.field("ast_to_ratio", pa.float64()),
+    pa.field("blocks", pa.float64()),
+    pa.field("conference", _DICT_STRING),
+    pa.field("efg_pct", pa.float64()),
+    pa.field("fg3_pct", pa.float64()),
+    pa.field("fg3a", pa.float64()),
+    pa.field("fg3m", pa.float64()),
+    pa.field("fg_pct", pa.float64()),
+    pa.field("fga", pa.float64()),
+    pa.field("fgm", pa.float64()),
+    pa.field("ft_pct", pa.float64()),
+    pa.field("fta", pa.float64()),
+    pa.field("ftm", pa.float64()),
+    pa.field("games", pa.int64()),
+    pa.field("minutes", pa.float64()),
+    pa.field("mpg", pa.float64()),
+    pa.field("per_40_ast", pa.float64()),
+    pa.field("per_40_pts", pa.float64()),
+    pa.field("per_40_reb", pa.float64()),
+    pa.field("playerId", pa.int64()),
+    pa.field("points", pa.float64()),
+    pa.field("ppg", pa.float64()),
+    pa.field("rebounds", pa.float64()),
+    pa.field("recruiting_rank", pa.int64()),
+    pa.field("recruiting_rating", pa.float64()),
+    pa.field("recruiting_stars", pa.int64()),
+    pa.field("rpg", pa.float64()),
+    pa.field("season", pa.int32()),
+    pa.field("steals", pa.float64()),
+    pa.field("team", _DICT_STRING),
+    pa.field("true_shooting", pa.float64()),
+    pa.field("turnovers", pa.float64()),
+    pa.field("usage_rate", pa.float64()),
+])
+_EMPTY_TABLE = _SCHEMA.empty_table()
+
+_RECRUIT_COLUMNS = ["playerId", "athleteId", "id", "ranking", "rank", "stars", "rating"]
+
+
+def build(cfg: Config, season: int, s3: Optional[S3IO] = None) -> pa.Table:
     """Build the player_season_impact gold table for a given season.
 
     Args:
         cfg: Pipeline configuration.
         season: Season year (e.g. 2024).
+        s3: S3 client to read through; the runner shares one across
+            transforms. A new client is created when omitted.
 
     Returns:
         A ``pyarrow.Table`` with one row per player per season containing
         efficiency metrics, per-40-min stats, and recruiting context.
     """
-    s3 = S3IO(cfg.bucket, cfg.region)
+    if s3 is None:
+        s3 = S3IO(cfg.bucket, cfg.region)
 
     # ------------------------------------------------------------------
     # 1. Read player season stats (spine)
     # ------------------------------------------------------------------
-    stats = read_silver_table(s3, cfg, "fct_player_season_stats", season=season)
+    # Stats and recruiting reads are independent; overlap their S3 latency.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        season_filter = [("season", "=", season)]
+        stats_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_player_season_stats",
+            season=season, filters=season_filter,
+        )
+        rec_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_recruiting_players",
+            season=season, columns=_RECRUIT_COLUMNS, filters=season_filter,
+        )
+        stats = stats_fut.result()
+        rec = rec_fut.result()
     if stats.num_rows == 0:
         return _empty_table()
 
-    pids = pydict_get_first(stats, ["playerId", "athleteId", "id"])
+    n = stats.num_rows
+    f64 = pa.float64()
+    pid_arr = arrow_column(stats, ["playerId", "athleteId", "id"], pa.int64())
     # Try multiple column name conventions
-    games_col = _first_available(stats, ["games", "gamesPlayed", "gp", "g"])
-    mins_col = _first_available(stats, ["minutes", "minutesPlayed", "min", "mpg"])
-    pts_col = _first_available(stats, ["points", "pts"])
-    reb_col = _first_available(stats, ["rebounds", "totalRebounds", "reb", "trb"])
-    ast_col = _first_available(stats, ["assists", "ast"])
-    stl_col = _first_available(stats, ["steals", "stl"])
-    blk_col = _first_available(stats, ["blocks", "blk"])
-    tov_col = _first_available(stats, ["turnovers", "to", "tov"])
-    team_col = _first_available(stats, ["team", "school", "teamName"])
-    conf_col = _first_available(stats, ["conference", "conf"])
+    gp = arrow_column(stats, ["games", "gamesPlayed", "gp", "g"], f64)
+    mins = arrow_column(stats, ["minutes", "minutesPlayed", "min", "mpg"], f64)
+    pts = arrow_column(stats, ["points", "pts"], f64)
+    ast = arrow_column(stats, ["assists", "ast"], f64)
+    stl = arrow_column(stats, ["steals", "stl"], f64)
+    blk = arrow_column(stats, ["blocks", "blk"], f64)
+    tov = arrow_column(stats, ["turnovers", "to", "tov"], f64)
+    team = _string_column(stats, ["team", "school", "teamName"])
+    conf = _string_column(stats, ["conference", "conf"])
 
     # Shooting fields may be stored as string dicts like "{'made': 175, 'attempted': 367, 'pct': 47.7}"
     # Parse them into separate made/attempted columns
-    fg_raw = _first_available(stats, ["fieldGoals"])
-    fgm_col = _first_available(stats, ["fieldGoalsMade", "fgm", "fg"])
-    fga_col = _first_available(stats, ["fieldGoalsAttempted", "fga"])
-    if fgm_col is None and fg_raw is not None:
-        fgm_col, fga_col = _parse_made_attempted(fg_raw)
-
-    fg3_raw = _first_available(stats, ["threePointFieldGoals"])
-    fg3m_col = _first_available(stats, ["threePointFieldGoalsMade", "fg3m", "threeFGM", "threesMade"])
-    fg3a_col = _first_available(stats, ["threePointFieldGoalsAttempted", "fg3a", "threeFGA", "threesAttempted"])
-    if fg3m_col is None and fg3_raw is not None:
-        fg3m_col, fg3a_col = _parse_made_attempted(fg3_raw)
-
-    ft_raw = _first_available(stats, ["freeThrows"])
-    ftm_col = _first_available(stats, ["freeThrowsMade", "ftm", "ft"])
-    fta_col = _first_available(stats, ["freeThrowsAttempted", "fta"])
-    if ftm_col is None and ft_raw is not None:
-        ftm_col, fta_col = _parse_made_attempted(ft_raw)
+    fgm, fga, fg3m, fg3a, ftm, fta = _shooting_columns(stats)
 
     # Rebounds may also be a string dict like "{'offensive': 31, 'defensive': 110, 'total': 141}"
-    if reb_col is not None and reb_col and isinstance(reb_col[0], str):
-        reb_col = _parse_stat_total(reb_col)
-
-    # ------------------------------------------------------------------
-    # 2. Recruiting data
-    # ------------------------------------------------------------------
-    recruit_lookup = _build_recruit_lookup(s3, cfg, season)
+    reb_name = first_column_name(stats, ["rebounds", "totalRebounds", "reb", "trb"])
+    if reb_name is not None and pa.types.is_string(stats.column(reb_name).type):
+        reb = _float_array(parse_stat_total(stats.column(reb_name).to_pylist()))
+    else:
+        reb = arrow_column(stats, ["rebounds", "totalRebounds", "reb", "trb"], f64)
 
     # ------------------------------------------------------------------
-    # 3. Team enrichment
+    # 2. Recruiting data (matched on playerId, kept in row order)
     # ------------------------------------------------------------------
-    team_lookup = _build_team_lookup(s3, cfg)
+    recruits = _match_recruits(pid_arr, _build_recruit_table(rec))
 
     # ------------------------------------------------------------------
-    # 4. Compute derived metrics
+    # 3. Compute derived metrics (NumPy values + null masks, in tiles)
     # ------------------------------------------------------------------
-    records: List[Dict[str, Any]] = []
-    for i, pid in enumerate(pids):
-        if pid is None:
-            continue
-
-        pid_int = int(pid)
-        gp = _to_float(games_col[i]) if games_col else None
-        mins = _to_float(mins_col[i]) if mins_col else None
-        pts = _to_float(pts_col[i]) if pts_col else None
-        reb = _to_float(reb_col[i]) if reb_col else None
-        ast = _to_float(ast_col[i]) if ast_col else None
-        stl = _to_float(stl_col[i]) if stl_col else None
-        blk = _to_float(blk_col[i]) if blk_col else None
-        tov = _to_float(tov_col[i]) if tov_col else None
-        fgm = _to_float(fgm_col[i]) if fgm_col else None
-        fga = _to_float(fga_col[i]) if fga_col else None
-        fg3m = _to_float(fg3m_col[i]) if fg3m_col else None
-        fg3a = _to_float(fg3a_col[i]) if fg3a_col else None
-        ftm = _to_float(ftm_col[i]) if ftm_col else None
-        fta = _to_float(fta_col[i]) if fta_col else None
-        team = team_col[i] if team_col else None
-        conf = conf_col[i] if conf_col else None
-
-        mpg = _safe_div(mins, gp)
-        ppg = _safe_div(pts, gp)
-        rpg = _safe_div(reb, gp)
-        apg = _safe_div(ast, gp)
-
-        fg_pct = _safe_div(fgm, fga) if fga and fga > 0 else None
-        fg3_pct = _safe_div(fg3m, fg3a) if fg3a and fg3a > 0 else None
-        ft_pct = _safe_div(ftm, fta) if fta and fta > 0 else None
-
-        efg_pct = None
-        if fgm is not None and fg3m is not None and fga is not None and fga > 0:
-            efg_pct = (fgm + 0.5 * fg3m) / fga
-
-        true_shooting = None
-        if pts is not None and fga is not None and fta is not None:
-            denom = 2 * (fga + 0.44 * fta)
-            if denom > 0:
-                true_shooting = pts / denom
-
-        # Approximate usage rate: (FGA + 0.44*FTA + TOV) / minutes * mpg_factor
-        # This is a simplified per-minute usage proxy
-        usage_rate = None
-        if fga is not None and fta is not None and tov is not None and mins is not None and mins > 0:
-            usage_rate = (fga + 0.44 * fta + (tov or 0)) / mins
-
-        per_40_pts = _safe_div(pts, mins, scale=40.0) if mins and mins > 0 else None
-        per_40_reb = _safe_div(reb, mins, scale=40.0) if mins and mins > 0 else None
-        per_40_ast = _safe_div(ast, mins, scale=40.0) if mins and mins > 0 else None
-
-        ast_to = None
-        if ast is not None and tov is not None and tov > 0:
-            ast_to = ast / tov
-
-        # Recruiting info
-        rec_info = recruit_lookup.get(pid_int, {})
-
-        # Team enrichment if not in stats
-        if team is None or conf is None:
-            # We cannot easily link playerId to teamId without additional data
-            pass
-
-        records.append({
-            "playerId": pid_int,
-            "season": season,
-            "team": str(team) if team is not None else None,
-            "conference": str(conf) if conf is not None else None,
-            "games": int(gp) if gp is not None else None,
-            "minutes": mins,
-            "mpg": mpg,
-            "points": pts,
-            "ppg": ppg,
-            "rebounds": reb,
-            "rpg": rpg,
-            "assists": ast,
-            "apg": apg,
-            "steals": stl,
-            "blocks": blk,
-            "turnovers": tov,
-            "fgm": fgm,
-            "fga": fga,
-            "fg_pct": fg_pct,
-            "fg3m": fg3m,
-            "fg3a": fg3a,
-            "fg3_pct": fg3_pct,
-            "ftm": ftm,
-            "fta": fta,
-            "ft_pct": ft_pct,
-            "efg_pct": efg_pct,
-            "true_shooting": true_shooting,
-            "usage_rate": usage_rate,
-            "per_40_pts": per_40_pts,
-            "per_40_reb": per_40_reb,
-            "per_40_ast": per_40_ast,
-            "ast_to_ratio": ast_to,
-            "recruiting_rank": rec_info.get("rank"),
-            "recruiting_stars": rec_info.get("stars"),
-            "recruiting_rating": rec_info.get("rating"),
+    inputs = {
+        name: values_and_mask(col, 0.0)
+        for name, col in (
+            ("gp", gp), ("mins", mins), ("pts", pts), ("reb", reb),
+            ("ast", ast), ("tov", tov), ("fgm", fgm), ("fga", fga),
+            ("fg3m", fg3m), ("fg3a", fg3a), ("ftm", ftm), ("fta", fta),
+        )
+    }
+    # Tiles keep each stage's working set cache-resident on large seasons.
+    tiles = [
+        _derived_metrics({
+            name: (values[start:start + _TILE_ROWS], mask[start:start + _TILE_ROWS])
+            for name, (values, mask) in inputs.items()
         })
-
-    if not records:
+        for start in range(0, n, _TILE_ROWS)
+    ]
+    derived = {name: pa.chunked_array([t[name] for t in tiles]) for name in tiles[0]}
+
+    columns = {
+        "playerId": pid_arr,
+        "season": pa.array(np.full(n, season, dtype=np.int32)),
+        "team": pc.dictionary_encode(team),
+        "conference": pc.dictionary_encode(conf),
+        "games": float_to_int(gp),
+        "minutes": mins,
+        "mpg": derived["mpg"],
+        "points": pts,
+        "ppg": derived["ppg"],
+        "rebounds": reb,
+        "rpg": derived["rpg"],
+        "assists": ast,
+        "apg": derived["apg"],
+        "steals": stl,
+        "blocks": blk,
+        "turnovers": tov,
+        "fgm": fgm,
+        "fga": fga,
+        "fg_pct": derived["fg_pct"],
+        "fg3m": fg3m,
+        "fg3a": fg3a,
+        "fg3_pct": derived["fg3_pct"],
+        "ftm": ftm,
+        "fta": fta,
+        "ft_pct": derived["ft_pct"],
+        "efg_pct": derived["efg_pct"],
+        "true_shooting": derived["true_shooting"],
+        "usage_rate": derived["usage_rate"],
+        "per_40_pts": derived["per_40_pts"],
+        "per_40_reb": derived["per_40_reb"],
+        "per_40_ast": derived["per_40_ast"],
+        "ast_to_ratio": derived["ast_to_ratio"],
+        "recruiting_rank": recruits.column("recruiting_rank"),
+        "recruiting_stars": recruits.column("recruiting_stars"),
+        "recruiting_rating": recruits.column("recruiting_rating"),
+    }
+    out = pa.Table.from_arrays([columns[name] for name in _SCHEMA.names], schema=_SCHEMA)
+    out = out.filter(pc.is_valid(pid_arr))
+    if out.num_rows == 0:
         return _empty_table()
-
-    return normalize_records("player_season_impact", records)
+    return out
 
 
 # ------------------------------------------------------------------
 # Private helpers
 # ------------------------------------------------------------------
 
-def _first_available(table: pa.Table, candidates: List[str]) -> Optional[List]:
-    """Return the first column found in the table as a Python list, or None."""
-    for col in candidates:
-        if col in table.column_names:
-            return table.column(col).to_pylist()
-    return None
-
+def _string_column(table: pa.Table, candidates: List[str]) -> pa.ChunkedArray:
+    """Return the first available column as strings (``str()`` per value)."""
+    name = first_column_name(table, candidates)
+    if name is None:
+        return pa.chunked_array([pa.nulls(table.num_rows, type=pa.string())])
+    column = table.column(name)
+    if pa.types.is_string(column.type):
+        return column
+    return pa.chunked_array([pa.array(
+        [str(v) if v is not None else None for v in column.to_pylist()],
+        type=pa.string(),
+    )])
+
+
+def _float_array(values: List) -> pa.ChunkedArray:
+    """Convert a list of Python values to float64, nulling unconvertible ones."""
+    return pa.chunked_array([pa.array([_to_float(v) for v in values], type=pa.float64())])
+
+
+# (raw dict column, made aliases, attempted aliases) per shooting category.
+_SHOOTING_COLUMNS = [
+    ("fieldGoals", ["fieldGoalsMade", "fgm", "fg"], ["fieldGoalsAttempted", "fga"]),
+    (
+        "threePointFieldGoals",
+        ["threePointFieldGoalsMade", "fg3m", "threeFGM", "threesMade"],
+        ["threePointFieldGoalsAttempted", "fg3a", "threeFGA", "threesAttempted"],
+    ),
+    ("freeThrows", ["freeThrowsMade", "ftm", "ft"], ["freeThrowsAttempted", "fta"]),
+]
+
+
+def _shooting_columns(table: pa.Table) -> List[pa.ChunkedArray]:
+    """Return float (fgm, fga, fg3m, fg3a, ftm, fta) columns.
+
+    Pre-split made/attempted columns are used when present. Otherwise the
+    raw dict column is read: struct columns via their ``made``/``attempted``
+    fields, string dicts in a single pass shared by all three categories.
+    """
+    out: List[Optional[pa.ChunkedArray]] = [None] * (2 * len(_SHOOTING_COLUMNS))
+    to_parse: List[Tuple[int, List]] = []
+    for i, (raw_name, made_candidates, attempted_candidates) in enumerate(_SHOOTING_COLUMNS):
+        if first_column_name(table, made_candidates) is not None or first_column_name(table, raw_name) is None:
+            out[2 * i] = arrow_column(table, made_candidates, pa.float64())
+            out[2 * i + 1] = arrow_column(table, attempted_candidates, pa.float64())
+            continue
+        raw = table.column(raw_name)
+        if pa.types.is_struct(raw.type):
+            out[2 * i] = _struct_field(raw, "made")
+            out[2 * i + 1] = _struct_field(raw, "attempted")
+        else:
+            to_parse.append((i, raw.to_pylist()))
+
+    if to_parse:
+        parsed: List[List[List]] = [[[], []] for _ in to_parse]
+        for values in zip(*(raw for _, raw in to_parse)):
+            for (made, attempted), val in zip(parsed, values):
+                d = parse_stat_dict(val)
+                if d is not None:
+                    made.append(d.get("made"))
+                    attempted.append(d.get("attempted"))
+                else:
+                    made.append(None)
+                    attempted.append(None)
+        for (i, _), (made, attempted) in zip(to_parse, parsed):
+            out[2 * i] = _float_array(made)
+            out[2 * i + 1] = _float_array(attempted)
+    return out
+
+
+def _struct_field(column: pa.ChunkedArray, name: str) -> pa.ChunkedArray:
+    """Return a struct column's field as float64 (all-null if the field is absent)."""
+    if column.type.get_field_index(name) < 0:
+        return pa.chunked_array([pa.nulls(len(column), type=pa.float64())])
+    field = pc.struct_field(column, name)
+    return arrow_column(pa.table({name: field}), name, pa.float64())
+
+
+def _derived_metrics(m: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> Dict[str, pa.Array]:
+    """Compute the derived rate columns from (values, null mask) input pairs."""
+    # Approximate usage rate: (FGA + 0.44*FTA + TOV) / minutes
+    # This is a simplified per-minute usage proxy
+    attempts = _combine(m["fga"], m["fta"], lambda a, b: a + 0.44 * b)
+    usage_numer = _combine(attempts, m["tov"], np.add)
+    ts_denom = (2 * attempts[0], attempts[1])
+    efg_numer = _combine(m["fgm"], m["fg3m"], lambda a, b: a + 0.5 * b)
+
+    # Each denominator's invalid-row mask is computed once and shared by
+    # every rate that divides by it.
+    per_game = _denominator(m["gp"])
+    per_min = _denominator(m["mins"], positive=True)
+    fga = _denominator(m["fga"], positive=True)
+    return {
+        "mpg": _ratio(m["mins"], per_game),
+        "ppg": _ratio(m["pts"], per_game),
+        "rpg": _ratio(m["reb"], per_game),
+        "apg": _ratio(m["ast"], per_game),
+        "fg_pct": _ratio(m["fgm"], fga),
+        "fg3_pct": _ratio(m["fg3m"], _denominator(m["fg3a"], positive=True)),
+        "ft_pct": _ratio(m["ftm"], _denominator(m["fta"], positive=True)),
+        "efg_pct": _ratio(efg_numer, fga),
+        "true_shooting": _ratio(m["pts"], _denominator(ts_denom, positive=True)),
+        "usage_rate": _ratio(usage_numer, per_min),
+        "per_40_pts": _ratio(m["pts"], per_min, scale=40.0),
+        "per_40_reb": _ratio(m["reb"], per_min, scale=40.0),
+        "per_40_ast": _ratio(m["ast"], per_min, scale=40.0),
+        "ast_to_ratio": _ratio(m["ast"], _denominator(m["tov"], positive=True)),
+    }
+
+
+def _combine(
+    left: Tuple[np.ndarray, np.ndarray],
+    right: Tuple[np.ndarray, np.ndarray],
+    op: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Apply ``op`` to two (values, null mask) pairs; nulls propagate."""
+    return op(left[0], right[0]), left[1] | right[1]
+
+
+def _denominator(
+    pair: Tuple[np.ndarray, np.ndarray],
+    positive: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Turn a (values, null mask) pair into (values, invalid mask) for division.
+
+    A row is invalid when it is null or zero (any non-positive value when
+    ``positive`` is set).
+    """
+    den, den_null = pair
+    valid = den > 0 if positive else den != 0
+    return den, den_null | ~valid
 
-def _parse_stat_dict(val: Any) -> Optional[dict]:
-    """Parse a string dict like "{'made': 175, 'attempted': 367, 'pct': 47.7}"."""
-    if val is None:
-        return None
-    if isinstance(val, dict):
-        return val
-    try:
-        import ast
-        return ast.literal_eval(str(val))
-    except (ValueError, SyntaxError):
-        return None
 
+def _ratio(
+    numerator: Tuple[np.ndarray, np.ndarray],
+    denominator: Tuple[np.ndarray, np.ndarray],
+    scale: float = 1.0,
+) -> pa.Array:
+    """Vectorised ``(numerator / denominator) * scale``, written in place.
 
-def _parse_made_attempted(raw_col: List) -> tuple:
-    """Parse a list of string dicts into (made_list, attempted_list)."""
-    made = []
-    attempted = []
-    for val in raw_col:
-        d = _parse_stat_dict(val)
-        if d is not None:
-            made.append(d.get("made"))
-            attempted.append(d.get("attempted"))
-        else:
-            made.append(None)
-            attempted.append(None)
-    return made, attempted
-
-
-def _parse_stat_total(raw_col: List) -> List:
-    """Parse a list of string dicts and extract 'total' key."""
-    result = []
-    for val in raw_col:
-        d = _parse_stat_dict(val)
-        if d is not None:
-            result.append(d.get("total"))
-        else:
-            result.append(None)
-    return result
+    ``denominator`` comes from :func:`_denominator`; rows with a null
+    numerator or an invalid denominator are null.
+    """
+    num, num_null = numerator
+    den, den_invalid = denominator
+    null = num_null | den_invalid
+    keep = ~null
+    ratio = np.zeros(len(num))
+    np.divide(num, den, out=ratio, where=keep)
+    if scale != 1.0:
+        np.multiply(ratio, scale, out=ratio, where=keep)
+    return pa.array(ratio, mask=null)
 
 
 def _to_float(val: Any) -> Optional[float]:
@@ -256,58 +374,46 @@ def _to_float(val: Any) -> Optional[float]:
         return None
 
 
-def _safe_div(
-    numerator: Optional[float],
-    denominator: Optional[float],
-    scale: float = 1.0,
-) -> Optional[float]:
-    """Safely divide, returning None if denominator is zero or inputs are None."""
-    if numerator is None or denominator is None or denominator == 0:
-        return None
-    return (numerator / denominator) * scale
-
-
-def _build_recruit_lookup(
-    s3: S3IO, cfg: Config, season: int,
-) -> Dict[int, Dict[str, Any]]:
-    """Build playerId -> {rank, stars, rating} from fct_recruiting_players."""
-    rec = read_silver_table(s3, cfg, "fct_recruiting_players", season=season)
-    lookup: Dict[int, Dict[str, Any]] = {}
-    if rec.num_rows == 0:
-        return lookup
-    pids = pydict_get_first(rec, ["playerId", "athleteId", "id"])
-    ranks = pydict_get(rec, "ranking") if "ranking" in rec.column_names else pydict_get(rec, "rank")
-    stars = pydict_get(rec, "stars")
-    ratings = pydict_get(rec, "rating")
-    for i, pid in enumerate(pids):
-        if pid is None:
-            continue
-        lookup[int(pid)] = {
-            "rank": ranks[i] if ranks else None,
-            "stars": stars[i] if stars else None,
-            "rating": ratings[i] if ratings else None,
-        }
-    return lookup
-
-
-def _build_team_lookup(
-    s3: S3IO, cfg: Config,
-) -> Dict[int, Dict[str, Optional[str]]]:
-    """Build teamId -> {school, conference} from dim_teams."""
-    dim = read_silver_table(s3, cfg, "dim_teams")
-    lookup: Dict[int, Dict[str, Optional[str]]] = {}
-    if dim.num_rows == 0:
-        return lookup
-    tids = pydict_get(dim, "teamId")
-    schools = pydict_get(dim, "school")
-    confs = pydict_get(dim, "conference")
-    for i, tid in enumerate(tids):
-        if tid is None:
-            continue
-        lookup[int(tid)] = {"school": schools[i], "conference": confs[i]}
-    return lookup
+def _build_recruit_table(rec: pa.Table) -> pa.Table:
+    """Build a (playerId, rank, stars, rating) table from fct_recruiting_players.
+
+    Later rows win for duplicate player IDs, so each player joins at most once.
+    """
+    recruits = pa.table({
+        "playerId": arrow_column(rec, ["playerId", "athleteId", "id"], pa.int64()),
+        "recruiting_rank": arrow_column(rec, ["ranking", "rank"], pa.int64()),
+        "recruiting_stars": arrow_column(rec, "stars", pa.int64()),
+        "recruiting_rating": arrow_column(rec, "rating", pa.float64()),
+    })
+    return dedup_by(recruits, ["playerId"], keep="last")
+
+
+def _match_recruits(pid_arr: pa.ChunkedArray, recruits: pa.Table) -> pa.Table:
+    """Align recruit rows to ``pid_arr`` (null rows where a player has none).
+
+    Recruit IDs are unique after dedup, so a sorted-ID ``np.searchsorted``
+    finds each player's row directly; unlike a hash join this needs no
+    re-sort to restore the stats row order.
+    """
+    recruits = recruits.filter(pc.is_valid(recruits.column("playerId")))
+    rec_pids = recruits.column("playerId").to_numpy()
+    order = np.argsort(rec_pids, kind="stable")
+    sorted_pids = rec_pids[order]
+
+    pids, pid_null = values_and_mask(pid_arr, 0)
+    pos = np.minimum(np.searchsorted(sorted_pids, pids), max(len(sorted_pids) - 1, 0))
+    if len(sorted_pids):
+        matched = ~pid_null & (sorted_pids[pos] == pids)
+        rows = order[pos]
+    else:
+        matched = np.zeros(len(pids), dtype=bool)
+        rows = np.zeros(len(pids), dtype=np.int64)
+    return recruits.take(pa.array(rows, mask=~matched))
 
 
 def _empty_table() -> pa.Table:
-    """Return an empty table with the player_season_impact schema."""
-    return normalize_records("player_season_impact", [])
+    """Return an empty table with the player_season_impact schema.
+
+    Tables are immutable, so one instance built at import is shared.
+    """
+    return _EMPTY_TABLE
@@ -15,18 +15,25 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
-from ..config import load_config
-from ..glue_catalog import GlueCatalog
+from ..config import Config, load_config
 from ..logging_utils import log_json, setup_logging
-from ..s3_io import S3IO, make_part_key
 from ..utils import stable_hash
-from . import GOLD_TRANSFORMS
+
+if TYPE_CHECKING:
+    from ..glue_catalog import GlueCatalog
+    from ..s3_io import S3IO
 
 GOLD_GLUE_DB = "cbbd_gold"
 
+# Gold files are written as one object per table/season, split into row
+# groups of this many rows so readers filtering on column statistics can
+# skip whole groups of the larger tables.
+GOLD_ROW_GROUP_ROWS = 50_000
+
 
 def main(argv: Optional[List[str]] = None) -> None:
     """Entry point for the gold layer CLI runner.
@@ -63,6 +70,11 @@ def main(argv: Optional[List[str]] = None) -> None:
     )
     args = parser.parse_args(argv)
 
+    # Deferred so argument errors and --help return without loading
+    # pyarrow, boto3 and the transform modules.
+    from . import GOLD_TRANSFORMS
+    from ._io_helpers import clear_silver_cache
+
     logger = setup_logging()
     cfg = load_config(args.config)
     season = args.season
@@ -78,8 +90,16 @@ def main(argv: Optional[List[str]] = None) -> None:
     else:
         tables_to_build = list(GOLD_TRANSFORMS.keys())
 
+    from ..s3_io import S3IO, make_part_key
+
+    # One S3 client is shared by every transform's reads and the writes;
+    # the Glue client is only needed to register written tables.
     s3 = S3IO(cfg.bucket, cfg.region)
-    glue = GlueCatalog(cfg.region)
+    glue: Optional[GlueCatalog] = None
+    if not args.dry_run:
+        from ..glue_catalog import GlueCatalog
+
+        glue = GlueCatalog(cfg.region)
     gold_prefix = cfg.s3_layout["gold_prefix"]
 
     log_json(
@@ -91,86 +111,125 @@ def main(argv: Optional[List[str]] = None) -> None:
         asof=asof,
     )
 
-    for table_name in tables_to_build:
-        build_fn = GOLD_TRANSFORMS[table_name]
-        log_json(logger, "gold_build_start", table=table_name, season=season)
+    if glue is not None:
+        glue.ensure_database(GOLD_GLUE_DB)
 
-        try:
-            result_table = build_fn(cfg, season)
-        except Exception as exc:
-            log_json(
-                logger,
-                "gold_build_error",
-                table=table_name,
-                season=season,
-                error=str(exc),
+    # Each table reads its own silver inputs and writes its own S3 key and
+    # Glue table, so the per-table pipelines run concurrently.
+    partition = f"season={season}/asof={asof}"
+    with ThreadPoolExecutor(max_workers=min(len(tables_to_build), 8)) as pool:
+        futures = []
+        for table_name in tables_to_build:
+            payload_hash = stable_hash({"table": table_name, "season": season})
+            s3_key = make_part_key(
+                gold_prefix,
+                table_name,
+                partition,
+                f"part-{payload_hash[:8]}.parquet",
             )
-            continue
+            futures.append(
+                pool.submit(
+                    _run_one, cfg, s3, glue, logger, table_name,
+                    GOLD_TRANSFORMS[table_name], season, s3_key, gold_prefix,
+                    args.dry_run,
+                )
+            )
+        try:
+            for future in as_completed(futures):
+                future.result()
+        finally:
+            # Silver tables are shared between the transforms of this run
+            # only; release them once every table has been built.
+            clear_silver_cache()
 
-        num_rows = result_table.num_rows
+    log_json(logger, "gold_run_done", season=season, tables_built=len(tables_to_build))
+
+
+def _run_one(
+    cfg: Config,
+    s3: S3IO,
+    glue: Optional[GlueCatalog],
+    logger: logging.Logger,
+    table_name: str,
+    build_fn: Callable[..., Any],
+    season: int,
+    s3_key: str,
+    gold_prefix: str,
+    dry_run: bool,
+) -> None:
+    """Build one gold table, then write it to S3 and register it in Glue.
+
+    ``s3_key`` is the object key the caller built for this table/season.
+    ``glue`` is None for a dry run, which stops after the build. Build
+    errors are logged and swallowed so the other tables still run; write
+    and catalog errors propagate to the caller.
+    """
+    log_json(logger, "gold_build_start", table=table_name, season=season)
+
+    try:
+        result_table = build_fn(cfg, season, s3=s3)
+    except Exception as exc:
         log_json(
             logger,
-            "gold_build_done",
+            "gold_build_error",
             table=table_name,
             season=season,
-            rows=num_rows,
+            error=str(exc),
         )
+        return
 
-        if num_rows == 0:
-            log_json(logger, "gold_skip_empty", table=table_name, season=season)
-            continue
-
-        if args.dry_run:
-            log_json(
-                logger,
-                "gold_dry_run_skip_write",
-                table=table_name,
-                season=season,
-                rows=num_rows,
-            )
-            continue
-
-        # Write to S3
-        payload_hash = stable_hash({"table": table_name, "season": season})
-        partition = f"season={season}/asof={asof}"
-        s3_key = make_part_key(
-            gold_prefix,
-            table_name,
-            partition,
-            f"part-{payload_hash[:8]}.parquet",
-        )
+    num_rows = result_table.num_rows
+    log_json(
+        logger,
+        "gold_build_done",
+        table=table_name,
+        season=season,
+        rows=num_rows,
+    )
 
-        s3.put_parquet(s3_key, result_table)
+    if num_rows == 0:
+        log_json(logger, "gold_skip_empty", table=table_name, season=season)
+        return
+
+    if dry_run:
         log_json(
             logger,
-            "gold_s3_write",
+            "gold_dry_run_skip_write",
             table=table_name,
-            key=s3_key,
+            season=season,
             rows=num_rows,
         )
+        return
 
-        # Register in Glue
-        location = f"s3://{cfg.bucket}/{gold_prefix}/{table_name}/"
-        schema = result_table.schema
-        partition_keys = ["season", "asof"]
+    # Write to S3
+    s3.put_parquet(s3_key, result_table, row_group_size=GOLD_ROW_GROUP_ROWS)
+    log_json(
+        logger,
+        "gold_s3_write",
+        table=table_name,
+        key=s3_key,
+        rows=num_rows,
+    )
 
-        # Remove partition columns from schema to avoid duplicates in Glue
-        for pk in partition_keys:
-            if pk in schema.names:
-                idx = schema.get_field_index(pk)
-                if idx >= 0:
-                    schema = schema.remove(idx)
+    # Register in Glue
+    location = f"s3://{cfg.bucket}/{gold_prefix}/{table_name}/"
+    schema = result_table.schema
+    partition_keys = ["season", "asof"]
 
-        glue.ensure_database(GOLD_GLUE_DB)
-        glue.ensure_table(GOLD_GLUE_DB, table_name, location, schema, partition_keys)
-        log_json(
-            logger,
-            "gold_glue_registered",
-            database=GOLD_GLUE_DB,
-            table=table_name,
-        )
+    # Remove partition columns from schema to avoid duplicates in Glue
+    for pk in partition_keys:
+        if pk in schema.names:
+            idx = schema.get_field_index(pk)
+            if idx >= 0:
+                schema = schema.remove(idx)
 
-    log_json(logger, "gold_run_done", season=season, tables_built=len(tables_to_build))
+    glue.ensure_table(GOLD_GLUE_DB, table_name, location, schema, partition_keys)
+    log_json(
+        logger,
+        "gold_glue_registered",
+        database=GOLD_GLUE_DB,
+        table=table_name,
+    )
 
 
 if __name__ == "__main__":
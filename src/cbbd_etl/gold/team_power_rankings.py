@@ -6,296 +6,374 @@ SRS ratings, and poll rankings. One row per team per season.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..config import Config
-from ..normalize import normalize_records
 from ..s3_io import S3IO
-from ._io_helpers import dedup_by, filter_by_season, pydict_get, pydict_get_first, read_silver_table, safe_divide
-
-
-def build(cfg: Config, season: int) -> pa.Table:
+from ._io_helpers import arrow_column, read_dim_teams, read_silver_table, values_and_mask
+
+# Output layout, identical to what normalize_records("team_power_rankings", ...)
+# produces for a full record: columns sorted by name with the TableSpec types.
+# Shared by build() and _empty_table().
+_SCHEMA = pa.schema([
+    pa.field("adj_def_rating", pa.float64()),
+    pa.field("adj_net_rating", pa.float64()),
+    pa.field("adj_off_rating", pa.float64()),
+    pa.field("ap_rank", pa.int64()),
+    pa.field("coaches_rank", pa.int64()),
+    pa.field("composite_rank", pa.float64()),
+    pa.field("conference", pa.string()),
+    pa.field("games_played", pa.int64()),
+    pa.field("pbp_adj_def_eff", pa.float64()),
+    pa.field("pbp_adj_net_eff", pa.float64()),
+    pa.field("pbp_adj_off_eff", pa.float64()),
+    pa.field("pbp_def_eff", pa.float64()),
+    pa.field("pbp_net_eff", pa.float64()),
+    pa.field("pbp_off_eff", pa.float64()),
+    pa.field("pbp_pace", pa.float64()),
+    pa.field("ranking_defense", pa.int64()),
+    pa.field("ranking_net", pa.int64()),
+    pa.field("ranking_offense", pa.int64()),
+    pa.field("season", pa.int32()),
+    pa.field("srs_rating", pa.float64()),
+    pa.field("team", pa.string()),
+    pa.field("teamId", pa.int64()),
+])
+_EMPTY_TABLE = _SCHEMA.empty_table()
+
+
+def build(cfg: Config, season: int, s3: Optional[S3IO] = None) -> pa.Table:
     """Build the team_power_rankings gold table for a given season.
 
     Args:
         cfg: Pipeline configuration.
         season: Season year (e.g. 2024).
+        s3: S3 client to read through; the runner shares one across
+            transforms. A new client is created when omitted.
 
     Returns:
         A ``pyarrow.Table`` with one row per team containing composite rankings.
     """
-    s3 = S3IO(cfg.bucket, cfg.region)
+    if s3 is None:
+        s3 = S3IO(cfg.bucket, cfg.region)
+
+    # The six silver reads are independent and S3-latency bound, so
+    # issue them concurrently.
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        adj_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_ratings_adjusted", season=season,
+        )
+        srs_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_ratings_srs",
+            filters=[("season", "=", season)],
+        )
+        rankings_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_rankings", season=season,
+        )
+        rollup_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_pbp_team_daily_rollup", season=season,
+        )
+        adj_pbp_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_pbp_team_daily_rollup_adj", season=season,
+        )
+        dim_fut = pool.submit(read_dim_teams, s3, cfg)
+        adj = adj_fut.result()
+        srs = srs_fut.result()
+        rankings = rankings_fut.result()
+        rollup = rollup_fut.result()
+        adj_pbp = adj_pbp_fut.result()
+        dim = dim_fut.result()
 
     # ------------------------------------------------------------------
-    # 1. Read API adjusted ratings (spine table)
+    # 1. API adjusted ratings (spine table)
     # ------------------------------------------------------------------
-    adj = read_silver_table(s3, cfg, "fct_ratings_adjusted", season=season)
     if adj.num_rows == 0:
         return _empty_table()
 
-    adj_team_ids = pydict_get(adj, "teamid")
-    adj_teams = pydict_get(adj, "team")
-    adj_conferences = pydict_get(adj, "conference")
-    adj_off = pydict_get_first(adj, ["offenserating", "offensiveRating"])
-    adj_def = pydict_get_first(adj, ["defenserating", "defensiveRating"])
-    adj_net = pydict_get(adj, "netrating")
-    adj_rank_off = pydict_get(adj, "ranking_offense")
-    adj_rank_def = pydict_get(adj, "ranking_defense")
-    adj_rank_net = pydict_get(adj, "ranking_net")
-
-    # Build team index
-    team_ids_list: List[int] = []
-    team_idx: Dict[int, int] = {}
-    for i, tid in enumerate(adj_team_ids):
-        if tid is None:
-            continue
-        tid_int = int(tid)
-        if tid_int not in team_idx:
-            team_idx[tid_int] = len(team_ids_list)
-            team_ids_list.append(tid_int)
-
-    n = len(team_ids_list)
-
-    # Initialize output arrays
-    out_team: List[Optional[str]] = [None] * n
-    out_conf: List[Optional[str]] = [None] * n
-    out_adj_off: List[Optional[float]] = [None] * n
-    out_adj_def: List[Optional[float]] = [None] * n
-    out_adj_net: List[Optional[float]] = [None] * n
-    out_rank_off: List[Optional[int]] = [None] * n
-    out_rank_def: List[Optional[int]] = [None] * n
-    out_rank_net: List[Optional[int]] = [None] * n
-
-    for i, tid in enumerate(adj_team_ids):
-        if tid is None:
-            continue
-        idx = team_idx.get(int(tid))
-        if idx is None:
-            continue
-        out_team[idx] = adj_teams[i]
-        out_conf[idx] = adj_conferences[i]
-        out_adj_off[idx] = adj_off[i]
-        out_adj_def[idx] = adj_def[i]
-        out_adj_net[idx] = adj_net[i]
-        out_rank_off[idx] = adj_rank_off[i]
-        out_rank_def[idx] = adj_rank_def[i]
-        out_rank_net[idx] = adj_rank_net[i]
+    f64 = pa.float64()
+    i64 = pa.int64()
+    # One row per team: ordered by first appearance, values from the last row.
+    spine = _spine(pa.table({
+        "teamId": arrow_column(adj, "teamid", i64),
+        "team": arrow_column(adj, "team", pa.string()),
+        "conference": arrow_column(adj, "conference", pa.string()),
+        "adj_off_rating": arrow_column(adj, ["offenserating", "offensiveRating"], f64),
+        "adj_def_rating": arrow_column(adj, ["defenserating", "defensiveRating"], f64),
+        "adj_net_rating": arrow_column(adj, "netrating", f64),
+        "ranking_offense": arrow_column(adj, "ranking_offense", i64),
+        "ranking_defense": arrow_column(adj, "ranking_defense", i64),
+        "ranking_net": arrow_column(adj, "ranking_net", i64),
+    }))
+    n = spine.num_rows
+    if n == 0:
+        return _empty_table()
 
     # ------------------------------------------------------------------
     # 2. SRS ratings
     # ------------------------------------------------------------------
-    out_srs: List[Optional[float]] = [None] * n
-    srs = filter_by_season(read_silver_table(s3, cfg, "fct_ratings_srs"), season)
-    if srs.num_rows > 0:
-        srs_tids = pydict_get(srs, "teamId")
-        srs_ratings = pydict_get(srs, "rating")
-        for i, tid in enumerate(srs_tids):
-            if tid is None:
-                continue
-            idx = team_idx.get(int(tid))
-            if idx is not None:
-                out_srs[idx] = srs_ratings[i]
+    spine = _join_per_team(spine, pa.table({
+        "teamId": arrow_column(srs, "teamId", i64),
+        "srs_rating": arrow_column(srs, "rating", f64),
+    }))
 
     # ------------------------------------------------------------------
     # 3. Poll rankings (latest poll date per type)
     # ------------------------------------------------------------------
-    out_ap: List[Optional[int]] = [None] * n
-    out_coaches: List[Optional[int]] = [None] * n
-    rankings = read_silver_table(s3, cfg, "fct_rankings", season=season)
-    if rankings.num_rows > 0:
-        r_tids = pydict_get(rankings, "teamId")
-        r_polls = pydict_get(rankings, "pollType")
-        r_dates = pydict_get(rankings, "pollDate")
-        r_ranks = pydict_get(rankings, "ranking")
-
-        # Find latest date per poll type
-        latest_dates: Dict[str, str] = {}
-        for poll, d in zip(r_polls, r_dates):
-            if poll is None or d is None:
-                continue
-            poll_s = str(poll)
-            d_s = str(d)
-            if poll_s not in latest_dates or d_s > latest_dates[poll_s]:
-                latest_dates[poll_s] = d_s
-
-        for i, (tid, poll, d, rank) in enumerate(zip(r_tids, r_polls, r_dates, r_ranks)):
-            if tid is None or poll is None or d is None:
-                continue
-            poll_s = str(poll)
-            if str(d) != latest_dates.get(poll_s):
-                continue
-            idx = team_idx.get(int(tid))
-            if idx is None:
-                continue
-            if poll_s.lower() in ("ap top 25", "ap"):
-                out_ap[idx] = rank
-            elif poll_s.lower() in ("coaches poll", "coaches"):
-                out_coaches[idx] = rank
+    polls = pa.table({
+        "teamId": arrow_column(rankings, "teamId", i64),
+        "poll": arrow_column(rankings, "pollType", pa.string()),
+        "date": arrow_column(rankings, "pollDate", pa.string()),
+        "rank": arrow_column(rankings, "ranking", i64),
+    })
+    polls = polls.filter(pc.and_(pc.is_valid(polls["poll"]), pc.is_valid(polls["date"])))
+    # Poll types are few: work on their dictionary codes, and lower-case and
+    # classify each distinct type once rather than once per row.
+    poll_types = pc.dictionary_encode(polls["poll"]).combine_chunks()
+    poll_codes = poll_types.indices.to_numpy(zero_copy_only=False)
+    date_rank = pc.rank(
+        polls["date"].combine_chunks(), sort_keys="ascending", tiebreaker="dense"
+    ).to_numpy()
+    latest_rank = np.zeros(len(poll_types.dictionary), dtype=date_rank.dtype)
+    np.maximum.at(latest_rank, poll_codes, date_rank)
+    is_latest = date_rank == latest_rank[poll_codes]
+    poll_kind = pc.utf8_lower(poll_types.dictionary)
+    # Both polls pivot onto the spine in one grouping pass and one join: each
+    # column takes a team's last row from the latest date of that poll.
+    poll_ranks = {}
+    for out_col, names in (
+        ("ap_rank", ["ap top 25", "ap"]),
+        ("coaches_rank", ["coaches poll", "coaches"]),
+    ):
+        is_kind = pc.is_in(poll_kind, value_set=pa.array(names)).to_numpy(zero_copy_only=False)
+        defined = pa.chunked_array([is_latest & is_kind[poll_codes]], type=pa.bool_())
+        poll_ranks[out_col] = (polls["rank"], defined)
+    spine = _join_last_defined(spine, polls["teamId"], poll_ranks)
 
     # ------------------------------------------------------------------
-    # 4. PBP rollup stats
+    # 4. PBP rollup stats (each metric from the last row it is defined on)
     # ------------------------------------------------------------------
-    out_pbp_off: List[Optional[float]] = [None] * n
-    out_pbp_def: List[Optional[float]] = [None] * n
-    out_pbp_net: List[Optional[float]] = [None] * n
-    out_pbp_pace: List[Optional[float]] = [None] * n
-    out_games: List[Optional[int]] = [None] * n
-
-    rollup = read_silver_table(s3, cfg, "fct_pbp_team_daily_rollup", season=season)
-    if rollup.num_rows > 0:
-        ru_tids = pydict_get(rollup, "teamid")
-        ru_team_pts = pydict_get(rollup, "team_points_total")
-        ru_opp_pts = pydict_get(rollup, "opp_points_total")
-        ru_team_poss = pydict_get(rollup, "team_possessions")
-        ru_opp_poss = pydict_get(rollup, "opp_possessions")
-        ru_games = pydict_get(rollup, "games_played")
-        ru_minutes = pydict_get(rollup, "game_minutes_total")
-
-        for i, tid in enumerate(ru_tids):
-            if tid is None:
-                continue
-            idx = team_idx.get(int(tid))
-            if idx is None:
-                continue
-
-            tp = ru_team_pts[i]
-            tposs = ru_team_poss[i]
-            op = ru_opp_pts[i]
-            oposs = ru_opp_poss[i]
-            gp = ru_games[i]
-            mins = ru_minutes[i]
-
-            if tposs and tposs > 0:
-                out_pbp_off[idx] = (tp / tposs) * 100 if tp is not None else None
-            if oposs and oposs > 0:
-                out_pbp_def[idx] = (op / oposs) * 100 if op is not None else None
-            if out_pbp_off[idx] is not None and out_pbp_def[idx] is not None:
-                out_pbp_net[idx] = out_pbp_off[idx] - out_pbp_def[idx]
-            if gp and gp > 0 and tposs is not None:
-                avg_poss = tposs / gp
-                avg_mins = (mins / gp) if mins and mins > 0 else 40.0
-                out_pbp_pace[idx] = avg_poss * (40.0 / avg_mins) if avg_mins > 0 else None
-            out_games[idx] = int(gp) if gp is not None else None
+    team_pts = arrow_column(rollup, "team_points_total", f64)
+    opp_pts = arrow_column(rollup, "opp_points_total", f64)
+    team_poss = arrow_column(rollup, "team_possessions", f64)
+    opp_poss = arrow_column(rollup, "opp_possessions", f64)
+    games = arrow_column(rollup, "games_played", f64)
+    minutes = arrow_column(rollup, "game_minutes_total", f64)
+    ru_tids = arrow_column(rollup, "teamid", i64)
+
+    # Average minutes default to a 40-minute game when not recorded.
+    avg_mins = pc.if_else(
+        pc.fill_null(pc.greater(minutes, 0.0), False),
+        pc.divide(minutes, games),
+        40.0,
+    )
+    avg_poss = pc.divide(team_poss, games)
+    spine = _join_last_defined(spine, ru_tids, {
+        "pbp_off_eff": (
+            pc.multiply(pc.divide(team_pts, team_poss), 100.0),
+            pc.greater(team_poss, 0.0),
+        ),
+        "pbp_def_eff": (
+            pc.multiply(pc.divide(opp_pts, opp_poss), 100.0),
+            pc.greater(opp_poss, 0.0),
+        ),
+        "pbp_pace": (
+            pc.multiply(avg_poss, pc.divide(40.0, avg_mins)),
+            pc.and_(pc.greater(games, 0.0), pc.is_valid(team_poss)),
+        ),
+        "games_played": (arrow_column(rollup, "games_played", i64), None),
+    })
 
     # ------------------------------------------------------------------
     # 5. PBP adjusted efficiency
     # ------------------------------------------------------------------
-    out_pbp_adj_off: List[Optional[float]] = [None] * n
-    out_pbp_adj_def: List[Optional[float]] = [None] * n
-    out_pbp_adj_net: List[Optional[float]] = [None] * n
-
-    adj_pbp = read_silver_table(s3, cfg, "fct_pbp_team_daily_rollup_adj", season=season)
-    if adj_pbp.num_rows > 0:
-        ap_tids = pydict_get(adj_pbp, "teamid")
-        ap_off = pydict_get(adj_pbp, "adj_off_eff")
-        ap_def = pydict_get(adj_pbp, "adj_def_eff")
-        ap_net = pydict_get(adj_pbp, "adj_net_eff")
-
-        for i, tid in enumerate(ap_tids):
-            if tid is None:
-                continue
-            idx = team_idx.get(int(tid))
-            if idx is None:
-                continue
-            out_pbp_adj_off[idx] = ap_off[i]
-            out_pbp_adj_def[idx] = ap_def[i]
-            out_pbp_adj_net[idx] = ap_net[i]
+    spine = _join_per_team(spine, pa.table({
+        "teamId": arrow_column(adj_pbp, "teamid", i64),
+        "pbp_adj_off_eff": arrow_column(adj_pbp, "adj_off_eff", f64),
+        "pbp_adj_def_eff": arrow_column(adj_pbp, "adj_def_eff", f64),
+        "pbp_adj_net_eff": arrow_column(adj_pbp, "adj_net_eff", f64),
+    }))
 
     # ------------------------------------------------------------------
-    # 6. Composite rank (percentile-normalized average of net ratings)
+    # 6. Enrich with dim_teams if names are missing (first non-null wins)
     # ------------------------------------------------------------------
-    out_composite = _compute_composite(out_adj_net, out_pbp_adj_net, out_srs)
+    dim_tids = arrow_column(dim, "teamId", i64)
+    for out_col, dim_col in (("team", "school"), ("conference", "conference")):
+        names = pa.table({
+            "teamId": dim_tids,
+            "_dim": arrow_column(dim, dim_col, pa.string()),
+        })
+        names = names.filter(pc.is_valid(names["_dim"]))
+        spine = _join_per_team(spine, names, keep="first")
+        filled = pc.coalesce(spine[out_col], spine["_dim"])
+        spine = spine.drop_columns(["_dim"]).set_column(
+            spine.schema.get_field_index(out_col), out_col, filled
+        )
+
+    spine = spine.sort_by("_row")
 
     # ------------------------------------------------------------------
-    # 7. Enrich with dim_teams if names are missing
+    # 7. Composite rank (percentile-normalized average of net ratings)
     # ------------------------------------------------------------------
-    dim = read_silver_table(s3, cfg, "dim_teams")
-    if dim.num_rows > 0:
-        d_tids = pydict_get(dim, "teamId")
-        d_schools = pydict_get(dim, "school")
-        d_confs = pydict_get(dim, "conference")
-        for i, tid in enumerate(d_tids):
-            if tid is None:
-                continue
-            idx = team_idx.get(int(tid))
-            if idx is None:
-                continue
-            if out_team[idx] is None:
-                out_team[idx] = d_schools[i]
-            if out_conf[idx] is None:
-                out_conf[idx] = d_confs[i]
+    composite = _compute_composite(
+        spine["adj_net_rating"], spine["pbp_adj_net_eff"], spine["srs_rating"]
+    )
 
     # ------------------------------------------------------------------
-    # Assemble output records
+    # Assemble output table
     # ------------------------------------------------------------------
-    records: List[Dict[str, Any]] = []
-    for i in range(n):
-        records.append({
-            "teamId": team_ids_list[i],
-            "season": season,
-            "team": out_team[i],
-            "conference": out_conf[i],
-            "adj_off_rating": out_adj_off[i],
-            "adj_def_rating": out_adj_def[i],
-            "adj_net_rating": out_adj_net[i],
-            "ranking_offense": out_rank_off[i],
-            "ranking_defense": out_rank_def[i],
-            "ranking_net": out_rank_net[i],
-            "srs_rating": out_srs[i],
-            "ap_rank": out_ap[i],
-            "coaches_rank": out_coaches[i],
-            "pbp_off_eff": out_pbp_off[i],
-            "pbp_def_eff": out_pbp_def[i],
-            "pbp_net_eff": out_pbp_net[i],
-            "pbp_adj_off_eff": out_pbp_adj_off[i],
-            "pbp_adj_def_eff": out_pbp_adj_def[i],
-            "pbp_adj_net_eff": out_pbp_adj_net[i],
-            "pbp_pace": out_pbp_pace[i],
-            "games_played": out_games[i],
-            "composite_rank": out_composite[i],
-        })
+    columns = {name: spine[name] for name in spine.column_names}
+    columns["season"] = pa.array(np.full(n, season, dtype=np.int32))
+    columns["pbp_net_eff"] = pc.subtract(spine["pbp_off_eff"], spine["pbp_def_eff"])
+    columns["composite_rank"] = composite
+    return pa.Table.from_arrays([columns[name] for name in _SCHEMA.names], schema=_SCHEMA)
 
-    return normalize_records("team_power_rankings", records)
 
+# ------------------------------------------------------------------
+# Private helpers
+# ------------------------------------------------------------------
 
-def _compute_composite(
-    adj_net: List[Optional[float]],
-    pbp_adj_net: List[Optional[float]],
-    srs: List[Optional[float]],
-) -> List[Optional[float]]:
-    """Compute a composite rank by averaging percentile-normalized net ratings.
+def _spine(table: pa.Table) -> pa.Table:
+    """One row per non-null teamId, ordered by first appearance.
+
+    Values come from each team's last row; ``_row`` records the output order.
+    """
+    table = table.filter(pc.is_valid(table["teamId"]))
+    first, last = _team_bounds(table["teamId"].to_numpy())
+    spine = table.take(last)
+    return spine.append_column("_row", pa.array(first))
+
+
+def _team_bounds(tids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (first, last) row index of each distinct team ID.
+
+    One stable sort keeps equal IDs in input order, so each run's first and
+    last sorted position map back to the team's first and last row.
+    """
+    order = np.argsort(tids, kind="stable")
+    if len(tids) == 0:
+        return order, order
+    ordered = tids[order]
+    starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+    ends = np.append(starts[1:], len(tids)) - 1
+    return order[starts], order[ends]
+
+
+def _spine_positions(spine: pa.Table, tids: pa.ChunkedArray) -> np.ndarray:
+    """Map each team ID to its spine row (-1 for null IDs and non-spine teams).
 
-    Each input is independently percentile-ranked (0-100 scale), then averaged.
-    Teams missing all three inputs receive ``None``.
+    The spine IDs are unique, so one binary search per row against them
+    replaces a hash join; arbitrary (sparse or negative) IDs are fine.
     """
-    def _percentile_rank(values: List[Optional[float]]) -> List[Optional[float]]:
-        valid = [(i, v) for i, v in enumerate(values) if v is not None]
-        if not valid:
-            return [None] * len(values)
-        sorted_vals = sorted(set(v for _, v in valid))
-        rank_map = {v: (r / (len(sorted_vals) - 1)) * 100 if len(sorted_vals) > 1 else 50.0
-                    for r, v in enumerate(sorted_vals)}
-        result: List[Optional[float]] = [None] * len(values)
-        for i, v in valid:
-            result[i] = rank_map[v]
-        return result
-
-    p_adj = _percentile_rank(adj_net)
-    p_pbp = _percentile_rank(pbp_adj_net)
-    p_srs = _percentile_rank(srs)
-
-    composite: List[Optional[float]] = []
-    for a, b, c in zip(p_adj, p_pbp, p_srs):
-        vals = [v for v in (a, b, c) if v is not None]
-        if vals:
-            composite.append(sum(vals) / len(vals))
+    spine_ids = spine["teamId"].to_numpy()
+    order = np.argsort(spine_ids)
+    sorted_ids = spine_ids[order]
+    ids, null = values_and_mask(tids, 0)
+    at = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+    found = ~null & (sorted_ids[at] == ids)
+    return np.where(found, order[at], -1)
+
+
+def _pick_rows(pos: np.ndarray, n: int, keep: str = "last") -> pa.Array:
+    """Return, per spine row, the first or last input row mapped onto it.
+
+    ``pos`` is :func:`_spine_positions` output with excluded rows set to -1.
+    Spine rows with no input row get a null index, which ``take`` turns
+    into a null value.
+    """
+    rows = np.flatnonzero(pos >= 0)
+    if keep == "first":
+        picked = np.full(n, len(pos), dtype=np.int64)
+        np.minimum.at(picked, pos[rows], rows)
+        picked[picked == len(pos)] = -1
+    else:
+        picked = np.full(n, -1, dtype=np.int64)
+        np.maximum.at(picked, pos[rows], rows)
+    return pa.array(np.maximum(picked, 0), mask=picked < 0)
+
+
+def _join_per_team(spine: pa.Table, table: pa.Table, keep: str = "last") -> pa.Table:
+    """Left-join one row per spine team from ``table`` (its first or last row).
+
+    Rows are scattered straight onto spine positions, so the spine keeps its
+    row order; rows for teams outside the spine (and null IDs) are ignored.
+    """
+    rows = _pick_rows(_spine_positions(spine, table["teamId"]), spine.num_rows, keep)
+    for name in table.column_names:
+        if name != "teamId":
+            spine = spine.append_column(name, table[name].take(rows))
+    return spine
+
+
+def _join_last_defined(
+    spine: pa.Table,
+    tids: pa.ChunkedArray,
+    metrics: Dict[str, Tuple[pa.ChunkedArray, Optional[pa.ChunkedArray]]],
+) -> pa.Table:
+    """Left-join each metric's value from the last row on which it is defined.
+
+    ``metrics`` maps an output column to ``(values, defined)``, both aligned
+    with ``tids``; a ``defined`` of None takes each team's last row. All
+    metrics share one spine-position lookup.
+    """
+    pos = _spine_positions(spine, tids)
+    for name, (values, defined) in metrics.items():
+        if defined is None:
+            marked = pos
         else:
-            composite.append(None)
-    return composite
+            ok = pc.fill_null(defined, False).to_numpy(zero_copy_only=False)
+            marked = np.where(ok, pos, -1)
+        spine = spine.append_column(name, values.take(_pick_rows(marked, spine.num_rows)))
+    return spine
+
+
+def _compute_composite(*ratings: pa.ChunkedArray) -> pa.Array:
+    """Compute a composite rank by averaging percentile-normalized net ratings.
+
+    Each input is independently percentile-ranked (0-100 scale) over its
+    distinct values, then averaged. Teams missing all inputs receive null.
+    """
+    total = np.zeros(len(ratings[0]))
+    count = np.zeros(len(ratings[0]), dtype=np.int64)
+    for rating in ratings:
+        values, null = values_and_mask(rating, 0.0)
+        valid = ~null
+        pct = _percentile_rank(values[valid])
+        total[valid] += pct
+        count[valid] += 1
+    has_any = count > 0
+    composite = np.divide(total, count, out=np.zeros(len(total)), where=has_any)
+    return pa.array(composite, mask=~has_any)
+
+
+def _percentile_rank(values: np.ndarray) -> np.ndarray:
+    """Dense percentile rank (0-100) of each value among the distinct values.
+
+    One argsort orders the values; a running count of value changes along
+    that order is each value's dense rank, scattered back through the sort
+    indices. A single distinct value ranks at 50.
+    """
+    order = np.argsort(values, kind="stable")
+    ordered = values[order]
+    dense = np.zeros(len(values))
+    if len(values) > 1:
+        np.cumsum(ordered[1:] != ordered[:-1], out=dense[1:])
+    distinct = dense[-1] + 1 if len(values) else 0
+    pct = np.empty(len(values))
+    if distinct > 1:
+        pct[order] = dense / (distinct - 1) * 100
+    else:
+        pct[:] = 50.0
+    return pct
 
 
 def _empty_table() -> pa.Table:
-    """Return an empty table with the team_power_rankings schema."""
-    return normalize_records("team_power_rankings", [])
+    """Return an empty table with the team_power_rankings schema.
+
+    Tables are immutable, so one instance built at import is shared.
+    """
+    return _EMPTY_TABLE
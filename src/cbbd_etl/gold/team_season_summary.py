@@ -7,359 +7,432 @@ class quality. One row per team per season.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..config import Config
-from ..normalize import normalize_records
 from ..s3_io import S3IO
-from ._io_helpers import dedup_by, filter_by_season, pydict_get, pydict_get_first, read_silver_table
-
-
-def build(cfg: Config, season: int) -> pa.Table:
+from ._io_helpers import (
+    arrow_column,
+    dedup_by,
+    dim_team_lookup,
+    dim_team_table,
+    first_column_name,
+    pydict_get_arr,
+    read_silver_table,
+    values_and_mask,
+)
+
+# fct_ratings_srs is not season-partitioned: the season predicate is pushed
+# down to the Parquet reader and only these columns are decoded.
+_SRS_COLUMNS = ["teamId", "rating"]
+
+# Fill value of the top-star output for teams with no starred recruits.
+_NO_STARS = np.iinfo(np.int64).min
+
+# Rollup metrics taken as-is from each team's last rollup row
+# (output column -> fct_pbp_team_daily_rollup column).
+_ROLLUP_COLUMNS = {
+    "ppg": "team_points_per_game",
+    "opp_ppg": "opp_points_per_game",
+    "efg_pct": "team_efg_pct",
+    "opp_efg_pct": "opp_efg_pct",
+    "tov_ratio": "team_tov_ratio",
+    "opp_tov_ratio": "opp_tov_ratio",
+    "oreb_pct": "team_oreb_pct",
+    "opp_oreb_pct": "opp_oreb_pct",
+    "ft_rate": "team_ft_rate",
+    "opp_ft_rate": "opp_ft_rate",
+    "pace": "pace",
+}
+
+# Output layout, identical to what normalize_records("team_season_summary", ...)
+# produces for a full record: columns sorted by name with the TableSpec types.
+# Shared by build() and _empty_table().
+_SCHEMA = pa.schema([
+    pa.field("adj_def_rating", pa.float64()),
+    pa.field("adj_net_rating", pa.float64()),
+    pa.field("adj_off_rating", pa.float64()),
+    pa.field("conf_losses", pa.int64()),
+    pa.field("conf_win_pct", pa.float64()),
+    pa.field("conf_wins", pa.int64()),
+    pa.field("conference", pa.string()),
+    pa.field("efg_pct", pa.float64()),
+    pa.field("ft_rate", pa.float64()),
+    pa.field("losses", pa.int64()),
+    pa.field("margin", pa.float64()),
+    pa.field("opp_efg_pct", pa.float64()),
+    pa.field("opp_ft_rate", pa.float64()),
+    pa.field("opp_oreb_pct", pa.float64()),
+    pa.field("opp_ppg", pa.float64()),
+    pa.field("opp_tov_ratio", pa.float64()),
+    pa.field("oreb_pct", pa.float64()),
+    pa.field("pace", pa.float64()),
+    pa.field("ppg", pa.float64()),
+    pa.field("recruiting_avg_rating", pa.float64()),
+    pa.field("recruiting_class_size", pa.int64()),
+    pa.field("recruiting_top_star", pa.int64()),
+    pa.field("season", pa.int32()),
+    pa.field("srs_rating", pa.float64()),
+    pa.field("team", pa.string()),
+    pa.field("teamId", pa.int64()),
+    pa.field("tov_ratio", pa.float64()),
+    pa.field("win_pct", pa.float64()),
+    pa.field("wins", pa.int64()),
+])
+_EMPTY_TABLE = _SCHEMA.empty_table()
+
+
+def build(cfg: Config, season: int, s3: Optional[S3IO] = None) -> pa.Table:
     """Build the team_season_summary gold table for a given season.
 
     Args:
         cfg: Pipeline configuration.
         season: Season year (e.g. 2024).
+        s3: S3 client to read through; the runner shares one across
+            transforms. A new client is created when omitted.
 
     Returns:
         A ``pyarrow.Table`` with one row per team containing season record,
         ratings, key stats, and recruiting class information.
     """
-    s3 = S3IO(cfg.bucket, cfg.region)
+    if s3 is None:
+        s3 = S3IO(cfg.bucket, cfg.region)
 
     # ------------------------------------------------------------------
-    # 1. Read dim_teams to build team spine and conference membership
+    # 1. Read dim_teams and the silver inputs. The reads are independent
+    #    and S3-latency bound, so issue them concurrently.
     # ------------------------------------------------------------------
-    dim = read_silver_table(s3, cfg, "dim_teams")
-    team_lookup: Dict[int, Dict[str, Optional[str]]] = {}
-    if dim.num_rows > 0:
-        d_tids = pydict_get(dim, "teamId")
-        d_schools = pydict_get(dim, "school")
-        d_confs = pydict_get(dim, "conference")
-        for i, tid in enumerate(d_tids):
-            if tid is None:
-                continue
-            team_lookup[int(tid)] = {"school": d_schools[i], "conference": d_confs[i]}
+    with ThreadPoolExecutor(max_workers=7) as pool:
+        lookup_fut = pool.submit(dim_team_lookup, s3, cfg)
+        teams_fut = pool.submit(dim_team_table, s3, cfg)
+        games_fut = pool.submit(read_silver_table, s3, cfg, "fct_games", season=season)
+        adj_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_ratings_adjusted", season=season,
+        )
+        srs_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_ratings_srs",
+            columns=_SRS_COLUMNS, filters=[("season", "=", season)],
+        )
+        rollup_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_pbp_team_daily_rollup", season=season,
+        )
+        recruiting_fut = pool.submit(
+            read_silver_table, s3, cfg, "fct_recruiting_players", season=season,
+        )
+        team_lookup = lookup_fut.result()
+        teams = teams_fut.result()
+        games = games_fut.result()
+        adj = adj_fut.result()
+        srs = srs_fut.result()
+        rollup = rollup_fut.result()
+        recruiting = recruiting_fut.result()
 
     # ------------------------------------------------------------------
     # 2. Compute W/L record from fct_games
     # ------------------------------------------------------------------
-    games = dedup_by(read_silver_table(s3, cfg, "fct_games", season=season), ["gameId"])
-    record = _compute_records(games, team_lookup)
+    games = dedup_by(games, ["gameId"])
+    rec_ids, *tallies = _compute_records(games, teams)
 
     # Build D1 team set from fct_ratings_adjusted (only D1 teams have ratings)
-    adj = read_silver_table(s3, cfg, "fct_ratings_adjusted", season=season)
-    d1_team_ids: Set[int] = set()
-    if adj.num_rows > 0:
-        adj_tids = pydict_get(adj, "teamid")
-        for tid in adj_tids:
-            if tid is not None:
-                d1_team_ids.add(int(tid))
-
-    # If no games found, use ratings as spine
-    if not record:
-        if not d1_team_ids:
-            return _empty_table()
-        for tid in d1_team_ids:
-            if tid not in record:
-                record[tid] = _default_record()
+    adj_tids, adj_null = values_and_mask(arrow_column(adj, "teamid", pa.int64()), 0)
+    d1_team_ids = np.unique(adj_tids[~adj_null])
 
     # Restrict to D1 teams (those with adjusted ratings) to avoid inflating
-    # the table with D2/D3/NAIA teams that appear in exhibition games
-    if d1_team_ids:
-        record = {tid: rec for tid, rec in record.items() if tid in d1_team_ids}
-        # Ensure all D1 teams have a record entry even if they had no games
-        for tid in d1_team_ids:
-            if tid not in record:
-                record[tid] = _default_record()
-
-    team_ids = sorted(record.keys())
-    n = len(team_ids)
-    tid_idx = {tid: i for i, tid in enumerate(team_ids)}
-
-    # Initialize output arrays from records
-    out_wins = [record[tid]["wins"] for tid in team_ids]
-    out_losses = [record[tid]["losses"] for tid in team_ids]
-    out_conf_wins = [record[tid]["conf_wins"] for tid in team_ids]
-    out_conf_losses = [record[tid]["conf_losses"] for tid in team_ids]
+    # the table with D2/D3/NAIA teams that appear in exhibition games; every
+    # D1 team gets a row even without games. With no ratings, the teams
+    # with games form the spine.
+    if len(d1_team_ids):
+        spine_ids = d1_team_ids
+    elif len(rec_ids):
+        spine_ids = rec_ids
+    else:
+        return _empty_table()
+
+    n = len(spine_ids)
+    # Sections 3-5 map each source table's team IDs onto output positions
+    # against this one index and gather each team's last row from there.
+    team_index = pa.array(spine_ids, type=pa.int64())
+
+    # Initialize output arrays from the tallies (0 for teams without games)
+    out_counts = np.zeros((len(tallies), n), dtype=np.int64)
+    if len(rec_ids):
+        rec_pos = np.minimum(np.searchsorted(rec_ids, spine_ids), len(rec_ids) - 1)
+        has_rec = rec_ids[rec_pos] == spine_ids
+        for k, counts in enumerate(tallies):
+            out_counts[k, has_rec] = counts[rec_pos[has_rec]]
+
+    # Output columns, filled section by section. A section whose source is
+    # empty is skipped outright: its columns are absent here and assembled
+    # as all-null arrays.
+    f64 = pa.float64()
+    columns: Dict[str, Any] = {}
 
     # ------------------------------------------------------------------
     # 3. Adjusted ratings (reuse adj already loaded above for D1 filtering)
     # ------------------------------------------------------------------
-    out_adj_off: List[Optional[float]] = [None] * n
-    out_adj_def: List[Optional[float]] = [None] * n
-    out_adj_net: List[Optional[float]] = [None] * n
-
     if adj.num_rows > 0:
-        a_tids = pydict_get(adj, "teamid")
-        a_off = pydict_get_first(adj, ["offenserating", "offensiveRating"])
-        a_def = pydict_get_first(adj, ["defenserating", "defensiveRating"])
-        a_net = pydict_get(adj, "netrating")
-        for i, tid in enumerate(a_tids):
-            if tid is None:
-                continue
-            idx = tid_idx.get(int(tid))
-            if idx is not None:
-                out_adj_off[idx] = a_off[i]
-                out_adj_def[idx] = a_def[i]
-                out_adj_net[idx] = a_net[i]
+        rows = _last_rows(_positions(adj, "teamid", team_index), n)
+        columns["adj_off_rating"] = arrow_column(adj, ["offenserating", "offensiveRating"], f64).take(rows)
+        columns["adj_def_rating"] = arrow_column(adj, ["defenserating", "defensiveRating"], f64).take(rows)
+        columns["adj_net_rating"] = arrow_column(adj, "netrating", f64).take(rows)
 
     # ------------------------------------------------------------------
     # 4. SRS
     # ------------------------------------------------------------------
-    out_srs: List[Optional[float]] = [None] * n
-    srs = filter_by_season(read_silver_table(s3, cfg, "fct_ratings_srs"), season)
     if srs.num_rows > 0:
-        s_tids = pydict_get(srs, "teamId")
-        s_ratings = pydict_get(srs, "rating")
-        for i, tid in enumerate(s_tids):
-            if tid is None:
-                continue
-            idx = tid_idx.get(int(tid))
-            if idx is not None:
-                out_srs[idx] = s_ratings[i]
+        rows = _last_rows(_positions(srs, "teamId", team_index), n)
+        columns["srs_rating"] = arrow_column(srs, "rating", f64).take(rows)
 
     # ------------------------------------------------------------------
     # 5. PBP rollup for Four Factors and pace
     # ------------------------------------------------------------------
-    out_ppg: List[Optional[float]] = [None] * n
-    out_opp_ppg: List[Optional[float]] = [None] * n
-    out_margin: List[Optional[float]] = [None] * n
-    out_efg: List[Optional[float]] = [None] * n
-    out_opp_efg: List[Optional[float]] = [None] * n
-    out_tov: List[Optional[float]] = [None] * n
-    out_opp_tov: List[Optional[float]] = [None] * n
-    out_oreb: List[Optional[float]] = [None] * n
-    out_opp_oreb: List[Optional[float]] = [None] * n
-    out_ftr: List[Optional[float]] = [None] * n
-    out_opp_ftr: List[Optional[float]] = [None] * n
-    out_pace: List[Optional[float]] = [None] * n
-
-    rollup = read_silver_table(s3, cfg, "fct_pbp_team_daily_rollup", season=season)
     if rollup.num_rows > 0:
-        ru_tids = pydict_get(rollup, "teamid")
-        ru_ppg = pydict_get(rollup, "team_points_per_game")
-        ru_opp_ppg = pydict_get(rollup, "opp_points_per_game")
-        ru_efg = pydict_get(rollup, "team_efg_pct")
-        ru_opp_efg = pydict_get(rollup, "opp_efg_pct")
-        ru_tov = pydict_get(rollup, "team_tov_ratio")
-        ru_opp_tov = pydict_get(rollup, "opp_tov_ratio")
-        ru_oreb = pydict_get(rollup, "team_oreb_pct")
-        ru_opp_oreb = pydict_get(rollup, "opp_oreb_pct")
-        ru_ftr = pydict_get(rollup, "team_ft_rate")
-        ru_opp_ftr = pydict_get(rollup, "opp_ft_rate")
-        ru_pace = pydict_get(rollup, "pace")
-
-        for i, tid in enumerate(ru_tids):
-            if tid is None:
-                continue
-            idx = tid_idx.get(int(tid))
-            if idx is None:
-                continue
-            out_ppg[idx] = ru_ppg[i]
-            out_opp_ppg[idx] = ru_opp_ppg[i]
-            if ru_ppg[i] is not None and ru_opp_ppg[i] is not None:
-                out_margin[idx] = ru_ppg[i] - ru_opp_ppg[i]
-            out_efg[idx] = ru_efg[i]
-            out_opp_efg[idx] = ru_opp_efg[i]
-            out_tov[idx] = ru_tov[i]
-            out_opp_tov[idx] = ru_opp_tov[i]
-            out_oreb[idx] = ru_oreb[i]
-            out_opp_oreb[idx] = ru_opp_oreb[i]
-            out_ftr[idx] = ru_ftr[i]
-            out_opp_ftr[idx] = ru_opp_ftr[i]
-            out_pace[idx] = ru_pace[i]
+        # Every metric comes from each team's last rollup row: gather that
+        # row's values per team instead of overwriting row by row.
+        ru_pos = _positions(rollup, "teamid", team_index)
+        rows = _last_rows(ru_pos, n)
+        for out_col, src_col in _ROLLUP_COLUMNS.items():
+            columns[out_col] = arrow_column(rollup, src_col, f64).take(rows)
+        # The margin is only set from rows where both averages are present.
+        margin = pc.subtract(
+            arrow_column(rollup, "team_points_per_game", f64),
+            arrow_column(rollup, "opp_points_per_game", f64),
+        )
+        margin_rows = _last_rows(
+            ru_pos, n, margin.is_valid().to_numpy(zero_copy_only=False)
+        )
+        columns["margin"] = margin.take(margin_rows)
 
     # ------------------------------------------------------------------
     # 6. Recruiting class aggregation
     # ------------------------------------------------------------------
-    out_rec_avg: List[Optional[float]] = [None] * n
-    out_rec_top: List[Optional[int]] = [None] * n
-    out_rec_size: List[Optional[int]] = [None] * n
-
-    recruiting = read_silver_table(s3, cfg, "fct_recruiting_players", season=season)
     if recruiting.num_rows > 0:
-        _aggregate_recruiting(recruiting, team_lookup, tid_idx, out_rec_avg, out_rec_top, out_rec_size)
+        # Preallocated NumPy outputs; a class size of 0 and the _NO_STARS
+        # sentinel mark teams without rated / starred recruits (-> null).
+        out_rec_avg = np.full(n, np.nan, dtype=np.float64)
+        out_rec_top = np.full(n, _NO_STARS, dtype=np.int64)
+        out_rec_size = np.zeros(n, dtype=np.int64)
+
+        school_keys, school_tids = _school_index(team_lookup)
+        tid_idx = {tid: i for i, tid in enumerate(spine_ids.tolist())}
+        _aggregate_recruiting(
+            recruiting, school_keys, school_tids, tid_idx,
+            out_rec_avg, out_rec_top, out_rec_size,
+        )
+        unrated = out_rec_size == 0
+        columns["recruiting_avg_rating"] = pa.array(out_rec_avg, mask=unrated)
+        columns["recruiting_top_star"] = pa.array(out_rec_top, mask=out_rec_top == _NO_STARS)
+        columns["recruiting_class_size"] = pa.array(out_rec_size, mask=unrated)
 
     # ------------------------------------------------------------------
-    # 7. Assemble records
+    # 7. Assemble the output columns
     # ------------------------------------------------------------------
-    records: List[Dict[str, Any]] = []
-    for i, tid in enumerate(team_ids):
-        t_info = team_lookup.get(tid, {})
-        w = out_wins[i] or 0
-        l = out_losses[i] or 0
-        cw = out_conf_wins[i] or 0
-        cl = out_conf_losses[i] or 0
-        records.append({
-            "teamId": tid,
-            "season": season,
-            "team": t_info.get("school"),
-            "conference": t_info.get("conference"),
-            "wins": w,
-            "losses": l,
-            "win_pct": w / (w + l) if (w + l) > 0 else None,
-            "conf_wins": cw,
-            "conf_losses": cl,
-            "conf_win_pct": cw / (cw + cl) if (cw + cl) > 0 else None,
-            "ppg": out_ppg[i],
-            "opp_ppg": out_opp_ppg[i],
-            "margin": out_margin[i],
-            "adj_off_rating": out_adj_off[i],
-            "adj_def_rating": out_adj_def[i],
-            "adj_net_rating": out_adj_net[i],
-            "srs_rating": out_srs[i],
-            "efg_pct": out_efg[i],
-            "opp_efg_pct": out_opp_efg[i],
-            "tov_ratio": out_tov[i],
-            "opp_tov_ratio": out_opp_tov[i],
-            "oreb_pct": out_oreb[i],
-            "opp_oreb_pct": out_opp_oreb[i],
-            "ft_rate": out_ftr[i],
-            "opp_ft_rate": out_opp_ftr[i],
-            "pace": out_pace[i],
-            "recruiting_avg_rating": out_rec_avg[i],
-            "recruiting_top_star": out_rec_top[i],
-            "recruiting_class_size": out_rec_size[i],
-        })
-
-    if not records:
-        return _empty_table()
-
-    return normalize_records("team_season_summary", records)
+    wins, losses, conf_wins, conf_losses = out_counts
+    columns["teamId"] = team_index
+    columns["season"] = pa.array(np.full(n, season, dtype=np.int32))
+    # School and conference names come from dim_teams' dictionary-encoded
+    # columns: one position lookup, then a gather of int32 codes per column
+    # rather than a dict lookup per team.
+    dim_pos = pc.index_in(team_index, value_set=teams["teamId"].combine_chunks())
+    columns["team"] = teams["school"].take(dim_pos).cast(pa.string())
+    columns["conference"] = teams["conference"].take(dim_pos).cast(pa.string())
+    columns["wins"] = pa.array(wins)
+    columns["losses"] = pa.array(losses)
+    columns["win_pct"] = _win_pct(wins, losses)
+    columns["conf_wins"] = pa.array(conf_wins)
+    columns["conf_losses"] = pa.array(conf_losses)
+    columns["conf_win_pct"] = _win_pct(conf_wins, conf_losses)
+
+    return pa.Table.from_arrays(
+        [columns.get(f.name, pa.nulls(n, type=f.type)) for f in _SCHEMA],
+        schema=_SCHEMA,
+    )
 
 
 # ------------------------------------------------------------------
 # Private helpers
 # ------------------------------------------------------------------
 
-def _default_record() -> Dict[str, int]:
-    """Return default record counters."""
-    return {"wins": 0, "losses": 0, "conf_wins": 0, "conf_losses": 0}
+def _win_pct(wins: np.ndarray, losses: np.ndarray) -> pa.Array:
+    """Return wins / games played, null for teams without decided games."""
+    games = wins + losses
+    return pa.array(wins / np.maximum(games, 1), mask=games == 0)
+
+
+def _positions(table: pa.Table, col: str, team_index: pa.Array) -> np.ndarray:
+    """Map each row's team ID to its output position (-1 if absent or null)."""
+    pos = pc.index_in(arrow_column(table, col, pa.int64()), value_set=team_index)
+    return pc.fill_null(pos, -1).to_numpy()
+
+
+def _last_rows(
+    pos: np.ndarray,
+    n: int,
+    defined: Optional[np.ndarray] = None,
+) -> pa.Array:
+    """Return, per output position, the index of the last row mapped onto it.
+
+    ``pos`` comes from :func:`_positions`; ``defined`` optionally restricts
+    the candidate rows. Positions without a row get a null index, which
+    ``take`` turns into null values.
+    """
+    if defined is not None:
+        pos = np.where(defined, pos, -1)
+    rows = np.flatnonzero(pos >= 0)
+    last = np.full(n, -1, dtype=np.int64)
+    np.maximum.at(last, pos[rows], rows)
+    return pa.array(np.maximum(last, 0), mask=last < 0)
 
 
 def _compute_records(
     games: pa.Table,
-    team_lookup: Dict[int, Dict[str, Optional[str]]],
-) -> Dict[int, Dict[str, int]]:
+    teams: pa.Table,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Compute W/L and conference W/L from fct_games.
 
-    Returns a dict keyed by teamId with wins, losses, conf_wins, conf_losses.
+    ``teams`` is the :func:`dim_team_table` join table, whose dictionary-
+    encoded ``conference`` codes identify conference games.
+
+    Returns parallel int64 arrays ``(team_ids, wins, losses, conf_wins,
+    conf_losses)``, with ``team_ids`` sorted. Outcomes are tallied
+    branch-free: win/loss/conference flags are boolean masks and per-team
+    totals are integer ``np.bincount`` histograms of the masked positions.
     """
-    record: Dict[int, Dict[str, int]] = {}
+    empty = np.zeros(0, dtype=np.int64)
     if games.num_rows == 0:
-        return record
-
-    g_home = pydict_get(games, "homeTeamId")
-    g_away = pydict_get(games, "awayTeamId")
-    g_hs = pydict_get_first(games, ["homeScore", "homePoints"])
-    g_as = pydict_get_first(games, ["awayScore", "awayPoints"])
-
-    for i in range(len(g_home)):
-        h = g_home[i]
-        a = g_away[i]
-        hs = g_hs[i]
-        aws = g_as[i]
-
-        if h is None or a is None or hs is None or aws is None:
-            continue
-
-        h_int = int(h)
-        a_int = int(a)
-
-        record.setdefault(h_int, _default_record())
-        record.setdefault(a_int, _default_record())
-
-        h_conf = team_lookup.get(h_int, {}).get("conference")
-        a_conf = team_lookup.get(a_int, {}).get("conference")
-        is_conf = h_conf is not None and a_conf is not None and h_conf == a_conf
-
-        try:
-            hs_int = int(hs)
-            as_int = int(aws)
-        except (TypeError, ValueError):
-            continue
-
-        if hs_int > as_int:
-            record[h_int]["wins"] += 1
-            record[a_int]["losses"] += 1
-            if is_conf:
-                record[h_int]["conf_wins"] += 1
-                record[a_int]["conf_losses"] += 1
-        elif as_int > hs_int:
-            record[a_int]["wins"] += 1
-            record[h_int]["losses"] += 1
-            if is_conf:
-                record[a_int]["conf_wins"] += 1
-                record[h_int]["conf_losses"] += 1
-
-    return record
+        return empty, empty, empty, empty, empty
+
+    score_cols = (["homeScore", "homePoints"], ["awayScore", "awayPoints"])
+    # Games with both teams and both scores present count towards a team's
+    # entry; the score must also convert to an int for the game to be tallied.
+    # Team IDs that do not convert (e.g. NaN) drop the game entirely.
+    h, h_null = values_and_mask(arrow_column(games, "homeTeamId", pa.int64()), 0)
+    a, a_null = values_and_mask(arrow_column(games, "awayTeamId", pa.int64()), 0)
+    present = ~h_null & ~a_null
+    for candidates in score_cols:
+        present &= pydict_get_arr(games, candidates).is_valid().to_numpy(zero_copy_only=False)
+    if not present.any():
+        return empty, empty, empty, empty, empty
+
+    hs, hs_null = values_and_mask(arrow_column(games, score_cols[0], pa.int64()), 0)
+    aws, aws_null = values_and_mask(arrow_column(games, score_cols[1], pa.int64()), 0)
+    scored = (~hs_null & ~aws_null)[present]
+    h, a, hs, aws = h[present], a[present], hs[present], aws[present]
+
+    team_ids = np.unique(np.concatenate([h, a]))
+    h_idx = np.searchsorted(team_ids, h)
+    a_idx = np.searchsorted(team_ids, a)
+
+    # Conference codes per team (-1 when unknown) so conference games are an
+    # integer equality test: each team's dictionary-encoded dim_teams
+    # conference is gathered in one index_in/take.
+    dim_pos = pc.index_in(pa.array(team_ids), value_set=teams["teamId"].combine_chunks())
+    conf_codes = teams["conference"].combine_chunks().indices.take(dim_pos)
+    team_conf = pc.fill_null(conf_codes, -1).to_numpy().astype(np.int64)
+    is_conf = (team_conf[h_idx] == team_conf[a_idx]) & (team_conf[h_idx] >= 0)
+
+    home_win = scored & (hs > aws)
+    away_win = scored & (aws > hs)
+    n_teams = len(team_ids)
+
+    def _tally(idx: np.ndarray, flags: np.ndarray) -> np.ndarray:
+        # Integer histogram of the flagged games' team positions.
+        return np.bincount(idx[flags], minlength=n_teams).astype(np.int64, copy=False)
+
+    home_conf_win = home_win & is_conf
+    away_conf_win = away_win & is_conf
+    wins = _tally(h_idx, home_win) + _tally(a_idx, away_win)
+    losses = _tally(a_idx, home_win) + _tally(h_idx, away_win)
+    conf_wins = _tally(h_idx, home_conf_win) + _tally(a_idx, away_conf_win)
+    conf_losses = _tally(a_idx, home_conf_win) + _tally(h_idx, away_conf_win)
+    return team_ids, wins, losses, conf_wins, conf_losses
+
+
+def _school_index(
+    team_lookup: Dict[int, Dict[str, Optional[str]]],
+) -> Tuple[pa.Array, np.ndarray]:
+    """Lower-cased dim_teams school names and their team IDs, for matching.
+
+    Later teams win for schools that collide once lower-cased.
+    """
+    school_to_tid: Dict[str, int] = {}
+    for tid, info in team_lookup.items():
+        school = info.get("school")
+        if school:
+            school_to_tid[school.lower()] = tid
+    school_keys = pa.array(list(school_to_tid), type=pa.string())
+    school_tids = np.fromiter(school_to_tid.values(), dtype=np.int64, count=len(school_to_tid))
+    return school_keys, school_tids
 
 
 def _aggregate_recruiting(
     recruiting: pa.Table,
-    team_lookup: Dict[int, Dict[str, Optional[str]]],
+    school_keys: pa.Array,
+    school_tids: np.ndarray,
     tid_idx: Dict[int, int],
-    out_avg: List[Optional[float]],
-    out_top: List[Optional[int]],
-    out_size: List[Optional[int]],
+    out_avg: np.ndarray,
+    out_top: np.ndarray,
+    out_size: np.ndarray,
 ) -> None:
-    """Aggregate recruiting data by team using school name matching."""
+    """Aggregate recruiting data by team using school name matching.
+
+    School names are lower-cased and matched against ``school_keys`` (see
+    :func:`_school_index`) in Arrow, so only recruits of output teams reach
+    the per-team aggregation. Results are written in place: ``out_size``
+    gets each team's count of rated recruits and ``out_avg`` their mean
+    rating (where the count is non-zero); ``out_top`` is raised to each
+    team's best star rating.
+    """
     # Try to get committedTo or school column for team association
-    r_teams: Optional[List] = None
-    for col in ("committedTo", "school", "team"):
-        if col in recruiting.column_names:
-            r_teams = pydict_get(recruiting, col)
-            break
-
-    r_stars = pydict_get(recruiting, "stars") if "stars" in recruiting.column_names else None
-    r_ratings = pydict_get(recruiting, "rating") if "rating" in recruiting.column_names else None
-
-    if r_teams is None:
+    team_col = first_column_name(recruiting, ["committedTo", "school", "team"])
+    if team_col is None:
         return
 
-    # Build school -> teamId map from team_lookup
-    school_to_tid: Dict[str, int] = {}
-    for tid, info in team_lookup.items():
-        school = info.get("school")
-        if school:
-            school_to_tid[school.lower()] = tid
-
-    # Aggregate per team
-    team_ratings: Dict[int, List[float]] = {}
-    team_stars: Dict[int, List[int]] = {}
-
-    for i, team in enumerate(r_teams):
-        if team is None:
-            continue
-        tid = school_to_tid.get(str(team).lower())
-        if tid is None:
-            continue
-        idx = tid_idx.get(tid)
-        if idx is None:
-            continue
-
-        if r_ratings and r_ratings[i] is not None:
-            team_ratings.setdefault(tid, []).append(float(r_ratings[i]))
-        if r_stars and r_stars[i] is not None:
-            try:
-                team_stars.setdefault(tid, []).append(int(r_stars[i]))
-            except (TypeError, ValueError):
-                pass
-
-    for tid, ratings in team_ratings.items():
-        idx = tid_idx[tid]
-        out_avg[idx] = sum(ratings) / len(ratings) if ratings else None
-        out_size[idx] = len(ratings)
-
-    for tid, stars in team_stars.items():
-        idx = tid_idx[tid]
-        out_top[idx] = max(stars) if stars else None
+    teams_lower = pc.utf8_lower(arrow_column(recruiting, team_col, pa.string()))
+    match = pc.fill_null(pc.index_in(teams_lower, value_set=school_keys), -1).to_numpy()
+
+    # Output position of each school's team (-1 when not an output team),
+    # then of each recruit.
+    school_pos = np.fromiter(
+        (tid_idx.get(tid, -1) for tid in school_tids.tolist()),
+        dtype=np.int64, count=len(school_tids),
+    )
+    pos = np.where(match >= 0, school_pos[np.maximum(match, 0)], -1)
+    rows = np.flatnonzero(pos >= 0)
+    if not len(rows):
+        return
+    pos = pos[rows]
+    take = pa.array(rows)
+    n = len(out_avg)
+
+    # One bincount pass per statistic (np.maximum.at for stars). bincount
+    # adds the weights in row order, so each sum matches a sequential sum.
+    if "rating" in recruiting.column_names:
+        ratings, r_null = values_and_mask(
+            arrow_column(recruiting, "rating", pa.float64()).take(take), 0.0
+        )
+        r_pos = pos[~r_null]
+        counts = np.bincount(r_pos, minlength=n)
+        sums = np.bincount(r_pos, weights=ratings[~r_null], minlength=n)
+        rated = counts > 0
+        out_avg[rated] = sums[rated] / counts[rated]
+        out_size[:] = counts
+
+    if "stars" in recruiting.column_names:
+        stars, s_null = values_and_mask(
+            arrow_column(recruiting, "stars", pa.int64()).take(take), 0
+        )
+        np.maximum.at(out_top, pos[~s_null], stars[~s_null])
 
 
 def _empty_table() -> pa.Table:
-    """Return an empty table with the team_season_summary schema."""
-    return normalize_records("team_season_summary", [])
+    """Return an empty table with the team_season_summary schema.
+
+    Tables are immutable, so one instance built at import is shared.
+    """
+    return _EMPTY_TABLE
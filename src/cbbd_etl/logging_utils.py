@@ -1,19 +1,37 @@
 import json
 import logging
 import sys
+from json.encoder import encode_basestring_ascii
 from typing import Any, Dict
 
+# One encoder reused for every record; json.dumps(..., default=str) would
+# construct a fresh JSONEncoder per call.
+_dumps = json.JSONEncoder(default=str).encode
+
+
+def _dumps_base(level: str, name: str, message: str) -> str:
+    # Three string fields, written directly in the layout json.dumps
+    # produces.
+    return (
+        '{"level": ' + encode_basestring_ascii(level)
+        + ', "logger": ' + encode_basestring_ascii(name)
+        + ', "message": ' + encode_basestring_ascii(message)
+        + "}"
+    )
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
+        extra = record.__dict__.get("_json_extra")
+        if not extra:
+            return _dumps_base(record.levelname, record.name, record.getMessage())
         payload: Dict[str, Any] = {
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
-        if hasattr(record, "extra") and isinstance(record.extra, dict):
-            payload.update(record.extra)
-        return json.dumps(payload, default=str)
+        payload.update(extra)
+        return _dumps(payload)
 
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
@@ -28,4 +46,6 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
 
 
 def log_json(logger: logging.Logger, msg: str, **extra: Any) -> None:
-    logger.info(msg, extra={"extra": extra})
+    # Nested under one reserved attribute so the fields can never collide
+    # with LogRecord's own, and the formatter finds them with a dict lookup.
+    logger.info(msg, extra={"_json_extra": extra})
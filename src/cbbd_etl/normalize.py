@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 import pyarrow as pa
 from dateutil import parser
@@ -814,30 +814,64 @@ TABLE_SPECS: Dict[str, TableSpec] = {
 
 
 def _cast_value(value: Any, dtype: pa.DataType) -> Any:
+    return _caster(dtype)(value)
+
+
+def _cast_int(value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except Exception:
+        return None
+
+
+def _cast_float(value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except Exception:
+        return None
+
+
+def _cast_bool(value: Any) -> Any:
     if value is None:
         return None
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+def _cast_timestamp(value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        return parser.parse(str(value))
+    except Exception:
+        return None
+
+
+def _cast_str(value: Any) -> Any:
+    return None if value is None else str(value)
+
+
+def _caster(dtype: pa.DataType) -> Callable[[Any], Any]:
+    """Return the one-argument cast applied to values of column type ``dtype``.
+
+    The type dispatch runs once per column rather than once per value.
+    """
     if pa.types.is_int64(dtype) or pa.types.is_int32(dtype):
-        try:
-            return int(value)
-        except Exception:
-            return None
+        return _cast_int
     if pa.types.is_float64(dtype):
-        try:
-            return float(value)
-        except Exception:
-            return None
+        return _cast_float
     if pa.types.is_boolean(dtype):
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes")
-        return bool(value)
+        return _cast_bool
     if pa.types.is_timestamp(dtype):
-        try:
-            return parser.parse(str(value))
-        except Exception:
-            return None
-    return str(value)
+        return _cast_timestamp
+    return _cast_str
 
 
 def _infer_type(value: Any) -> pa.DataType:
@@ -870,14 +904,13 @@ def normalize_records(table_name: str, records: List[Dict[str, Any]]) -> pa.Tabl
         schema_fields.append(pa.field(field, dtype))
 
     schema = pa.schema(schema_fields)
-    normalized: List[Dict[str, Any]] = []
-    for rec in records:
-        row: Dict[str, Any] = {}
-        for field in schema.names:
-            dtype = schema.field(field).type
-            row[field] = _cast_value(rec.get(field), dtype)
-        normalized.append(row)
-    return pa.Table.from_pylist(normalized, schema=schema)
+    # Build each column straight from the records with a caster picked once
+    # per field, rather than boxing an intermediate row dict per record.
+    columns = []
+    for f in schema:
+        cast = _caster(f.type)
+        columns.append(pa.array([cast(rec.get(f.name)) for rec in records], type=f.type))
+    return pa.Table.from_arrays(columns, schema=schema)
 
 
 def dedupe_records(records: List[Dict[str, Any]], key_fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
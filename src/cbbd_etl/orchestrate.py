@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import ast
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import boto3
 
@@ -15,8 +16,8 @@ from .config import Config, get_api_token
 from .extractors import build_registry
 from .glue_catalog import GlueCatalog
 from .logging_utils import log_json
-from .normalize import TABLE_SPECS, dedupe_records, normalize_records
-from .s3_io import S3IO, make_part_key, new_run_id
+from .normalize import TABLE_SPECS, normalize_records
+from .s3_io import S3IO, load_json, make_part_key, new_run_id
 from .utils import stable_hash
 
 
@@ -105,6 +106,13 @@ GOLD_TABLES = {
     "lines": "market_lines_history",
 }
 
+# Silver tables checked concurrently by validate().
+_VALIDATE_WORKERS = 16
+# Tail bytes fetched first when reading a parquet footer; covers the
+# footer of typical silver files in one request.
+_FOOTER_PROBE_BYTES = 64 * 1024
+
+
 def _today() -> str:
     return datetime.utcnow().date().isoformat()
 
@@ -129,7 +137,11 @@ class Orchestrator:
         self._summary: Dict[str, Any] = {"run_id": self._run_id, "started_at": datetime.utcnow().isoformat()}
         self._request_counts: Dict[str, int] = {}
         self._log_every = int(self.config.api.get("log_every_requests", 100))
-        self._seen_keys: Dict[str, set[Tuple[Any, ...]]] = {}
+        # Primary keys already written per silver table this run: bare values
+        # for single-column keys, tuples otherwise.
+        self._seen_keys: Dict[str, Set[Any]] = {}
+        # Season-endpoint checkpoints prefetched by run_incremental.
+        self._checkpoint_cache: Dict[Tuple[str, str], Any] = {}
 
     async def close(self) -> None:
         await self.api.close()
@@ -155,16 +167,11 @@ class Orchestrator:
         skip_fanout: bool = False,
         only_endpoints: Optional[List[str]] = None,
     ) -> None:
+        _use_eager_tasks()
         self.ensure_prefixes()
         if seasons is None:
             seasons = list(range(self.config.seasons["start"], self.config.seasons["end"] + 1))
-        for name, spec in self.registry.items():
-            if only_endpoints and name not in only_endpoints:
-                continue
-            if skip_fanout and spec.type in ("game_fanout", "player_fanout"):
-                log_json(self.logger, "skip_fanout_endpoint", endpoint=name)
-                continue
-            await self._run_endpoint(name, spec, seasons=seasons, mode="backfill")
+        await self._run_endpoints(seasons, "backfill", skip_fanout, only_endpoints)
         await self._finalize_summary()
 
     async def run_incremental(
@@ -173,19 +180,64 @@ class Orchestrator:
         skip_fanout: bool = False,
         only_endpoints: Optional[List[str]] = None,
     ) -> None:
+        _use_eager_tasks()
         self.ensure_prefixes()
         if seasons is None:
             seasons = list(range(self.config.seasons["start"], self.config.seasons["end"] + 1))
+        self._prefetch_season_checkpoints(only_endpoints)
+        await self._run_endpoints(seasons, "incremental", skip_fanout, only_endpoints)
+        await self._finalize_summary()
+
+    async def _run_endpoints(
+        self,
+        seasons: List[int],
+        mode: str,
+        skip_fanout: bool,
+        only_endpoints: Optional[List[str]],
+    ) -> None:
+        independent = []
+        fanouts = []
         for name, spec in self.registry.items():
             if only_endpoints and name not in only_endpoints:
                 continue
-            if skip_fanout and spec.type in ("game_fanout", "player_fanout"):
-                log_json(self.logger, "skip_fanout_endpoint", endpoint=name)
-                continue
-            await self._run_endpoint(name, spec, seasons=seasons, mode="incremental")
-        await self._finalize_summary()
+            if spec.type in ("game_fanout", "player_fanout"):
+                if skip_fanout:
+                    log_json(self.logger, "skip_fanout_endpoint", endpoint=name)
+                    continue
+                fanouts.append((name, spec))
+            else:
+                independent.append((name, spec))
+        # Non-fanout endpoints share no inputs, so several run side by side;
+        # the ApiClient semaphore still caps in-flight HTTP requests. An
+        # endpoint error stops new endpoints and aborts the run once the
+        # in-flight ones settle, before any summary is written.
+        limit = int(self.config.api.get("endpoint_concurrency", 4))
+        await _run_bounded(
+            (
+                lambda name=name, spec=spec: self._run_endpoint(name, spec, seasons=seasons, mode=mode)
+                for name, spec in independent
+            ),
+            limit,
+        )
+        # Fanouts run afterwards and one at a time. _ensure_game_ids and
+        # _ensure_player_ids skip their fetch once the shared ID set is
+        # non-empty, so overlapping fanouts could read a set another fanout
+        # is still filling. Each fanout already keeps fanout_batch_size
+        # requests in flight on its own.
+        for name, spec in fanouts:
+            await self._run_endpoint(name, spec, seasons=seasons, mode=mode)
+
+    def _prefetch_season_checkpoints(self, only_endpoints: Optional[List[str]]) -> None:
+        keys = [
+            (name, _season_checkpoint_hash(spec))
+            for name, spec in self.registry.items()
+            if spec.type == "season" and (not only_endpoints or name in only_endpoints)
+        ]
+        found = self.checkpoints.get_many(keys)
+        self._checkpoint_cache = {key: found.get(key) for key in keys}
 
     async def run_one(self, endpoint: str, params: Dict[str, Any]) -> None:
+        _use_eager_tasks()
         self.ensure_prefixes()
         spec = self.registry[endpoint]
         await self._run_single_call(spec, params, mode="one")
@@ -193,15 +245,14 @@ class Orchestrator:
 
     async def validate(self) -> None:
         s3 = boto3.client("s3", region_name=self.config.region)
+        bucket = self.config.bucket
         prefix = f"{self.config.s3_layout['meta_prefix']}/"
-        resp = s3.list_objects_v2(Bucket=self.config.bucket, Prefix=prefix)
-        contents = resp.get("Contents", [])
-        if not contents:
+        latest = _latest_object(s3, bucket, prefix)
+        if latest is None:
             log_json(self.logger, "validate_no_meta_found")
             return
-        latest = max(contents, key=lambda x: x["LastModified"])
-        obj = s3.get_object(Bucket=self.config.bucket, Key=latest["Key"])
-        summary = json.loads(obj["Body"].read())
+        obj = s3.get_object(Bucket=bucket, Key=latest["Key"])
+        summary = load_json(obj["Body"].read())
         issues = []
         for endpoint, stats in summary.get("endpoints", {}).items():
             if stats.get("rows", 0) <= 0:
@@ -210,27 +261,25 @@ class Orchestrator:
             log_json(self.logger, "validate_failed", endpoints=issues)
             raise RuntimeError(f"Validation failed for endpoints: {issues}")
         strict_schema = self.config.raw.get("validate", {}).get("strict_schema", False)
-        missing = {}
-        for table, spec in TABLE_SPECS.items():
+
+        def check(table: str, spec) -> Optional[List[str]]:
             table_prefix = f"{self.config.s3_layout['silver_prefix']}/{table}/"
-            resp = s3.list_objects_v2(Bucket=self.config.bucket, Prefix=table_prefix)
-            contents = resp.get("Contents", [])
-            if not contents:
-                continue
-            latest_obj = max(contents, key=lambda x: x["LastModified"])
-            obj = s3.get_object(Bucket=self.config.bucket, Key=latest_obj["Key"])
-            data = obj["Body"].read()
+            latest_obj = _latest_object(s3, bucket, table_prefix)
+            if latest_obj is None:
+                return None
             try:
-                import pyarrow.parquet as pq
-                import io
-
-                table_pa = pq.read_table(io.BytesIO(data), columns=None)
-                cols = set(table_pa.schema.names)
+                cols = set(_read_parquet_schema(s3, bucket, latest_obj["Key"]).names)
                 missing_keys = [k for k in spec.primary_keys if k not in cols]
-                if missing_keys:
-                    missing[table] = missing_keys
+                return missing_keys or None
             except Exception as exc:
-                missing[table] = [f"schema_read_error:{exc}"]
+                return [f"schema_read_error:{exc}"]
+
+        # Each table's listing and latest-file read are independent S3 round
+        # trips; run them concurrently off the event loop.
+        with ThreadPoolExecutor(max_workers=_VALIDATE_WORKERS) as pool:
+            futures = {table: pool.submit(check, table, spec) for table, spec in TABLE_SPECS.items()}
+            results = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures.values()))
+        missing = {table: result for table, result in zip(futures, results) if result}
         if missing:
             log_json(self.logger, "validate_schema_failed", details=missing, strict=strict_schema)
             if strict_schema:
@@ -270,6 +319,7 @@ class Orchestrator:
         games_from_s3: bool = False,
         resume_file: Optional[str] = None,
     ) -> None:
+        _use_eager_tasks()
         self.ensure_prefixes()
         if seasons is None:
             seasons = list(range(self.config.seasons["start"], self.config.seasons["end"] + 1))
@@ -306,12 +356,20 @@ class Orchestrator:
             await self._write_layers(spec, records, params, payload_hash, mode, season=season, date=date)
             self._tick_progress(spec.name)
         except Exception as exc:
-            self._deadletter(spec.name, params, f"error:{exc}")
+            self._deadletter(spec.name, params, f"error:{exc}", payload_hash)
 
     async def _run_season_endpoint(self, spec, seasons: List[int], mode: str) -> None:
+        payload_hash = _season_checkpoint_hash(spec)
+        # Only incremental runs resume from the checkpoint, so backfills skip
+        # the lookup; incremental runs prefetch them all in one batch.
+        checkpoint = None
+        if mode == "incremental":
+            key = (spec.name, payload_hash)
+            if key in self._checkpoint_cache:
+                checkpoint = self._checkpoint_cache[key]
+            else:
+                checkpoint = self.checkpoints.get(spec.name, payload_hash)
         season_param = spec.season_param or "season"
-        payload_hash = stable_hash({"season_param": season_param})
-        checkpoint = self.checkpoints.get(spec.name, payload_hash)
         start_season = seasons[0]
         if mode == "incremental" and checkpoint:
             start_season = max(start_season, int(checkpoint.payload.get("last_completed_season", start_season)))
@@ -380,46 +438,40 @@ class Orchestrator:
 
     async def _run_game_fanout(self, spec, seasons: List[int], mode: str) -> None:
         await self._ensure_game_ids(seasons, mode)
-        game_ids = sorted(self._game_ids)
-        if self._resume_game_ids:
-            game_ids = [gid for gid in game_ids if gid not in self._resume_game_ids]
+        game_ids = self._pending_game_ids()
         total = len(game_ids)
         log_json(self.logger, "fanout_start", endpoint=spec.name, count=total)
         batch_size = self.config.api.get("fanout_batch_size", 20)
-        for i in range(0, total, batch_size):
-            batch = game_ids[i : i + batch_size]
-            tasks = []
-            for game_id in batch:
-                params = {"gameId": game_id}
-                meta = self._game_meta.get(game_id, {})
-                tasks.append(self._run_single_call(spec, params, mode, season=meta.get("season"), date=meta.get("date")))
-            await _gather(tasks)
-            log_json(self.logger, "fanout_batch_done", endpoint=spec.name, batch_end=i + len(batch), total=total)
+        calls = (
+            self._fanout_call(
+                spec,
+                {"gameId": game_id},
+                mode,
+                season=self._game_meta.get(game_id, {}).get("season"),
+                date=self._game_meta.get(game_id, {}).get("date"),
+            )
+            for game_id in game_ids
+        )
+        await _run_bounded(calls, batch_size, self._fanout_progress(spec, total, batch_size))
         log_json(self.logger, "fanout_done", endpoint=spec.name, count=total)
 
     async def _run_player_fanout(self, spec, seasons: List[int], mode: str) -> None:
         await self._ensure_player_ids(seasons, mode)
         use_pairs = self._fanout_requires_season(spec)
-        if use_pairs:
-            items = sorted(self._player_seasons)
-        else:
-            items = sorted(self._player_ids)
+        # A snapshot of the set; every call is independent, so no ordering
+        # is needed.
+        items = list(self._player_seasons if use_pairs else self._player_ids)
         total = len(items)
         log_json(self.logger, "fanout_start", endpoint=spec.name, count=total)
         batch_size = self.config.api.get("fanout_batch_size", 20)
-        for i in range(0, total, batch_size):
-            batch = items[i : i + batch_size]
-            tasks = []
-            if use_pairs:
-                for player_id, season in batch:
-                    params = {"playerId": player_id, "season": season}
-                    tasks.append(self._run_single_call(spec, params, mode, season=season))
-            else:
-                for player_id in batch:
-                    params = {"playerId": player_id}
-                    tasks.append(self._run_single_call(spec, params, mode))
-            await _gather(tasks)
-            log_json(self.logger, "fanout_batch_done", endpoint=spec.name, batch_end=i + len(batch), total=total)
+        if use_pairs:
+            calls = (
+                self._fanout_call(spec, {"playerId": player_id, "season": season}, mode, season=season)
+                for player_id, season in items
+            )
+        else:
+            calls = (self._fanout_call(spec, {"playerId": player_id}, mode) for player_id in items)
+        await _run_bounded(calls, batch_size, self._fanout_progress(spec, total, batch_size))
         log_json(self.logger, "fanout_done", endpoint=spec.name, count=total)
 
     async def _run_fanout_with_limits(
@@ -431,50 +483,81 @@ class Orchestrator:
     ) -> None:
         if spec.type == "game_fanout":
             await self._ensure_game_ids(seasons, mode="backfill")
-            ids = sorted(self._game_ids)
-            if self._resume_game_ids:
-                ids = [gid for gid in ids if gid not in self._resume_game_ids]
+            ids = self._pending_game_ids()
             meta = self._game_meta
             key_name = "gameId"
         elif spec.type == "player_fanout":
             await self._ensure_player_ids(seasons, mode="backfill")
             if self._fanout_requires_season(spec):
-                ids = sorted(self._player_seasons)
+                ids = list(self._player_seasons)
                 meta = {}
                 key_name = "playerId"
             else:
-                ids = sorted(self._player_ids)
+                ids = list(self._player_ids)
                 meta = {}
                 key_name = "playerId"
         else:
             raise ValueError("fanout limits only apply to fanout endpoints")
 
         if limit:
-            ids = ids[:limit]
+            # Still the lowest IDs, so limited runs stay repeatable, without
+            # sorting the whole set.
+            ids = heapq.nsmallest(limit, ids)
 
         total = len(ids)
         log_json(self.logger, "fanout_start", endpoint=spec.name, count=total)
         if not batch_size:
-            batch_size = total
-
-        for i in range(0, total, batch_size):
-            batch = ids[i : i + batch_size]
-            log_json(self.logger, "fanout_batch_start", endpoint=spec.name, batch_start=i, batch_size=len(batch), total=total)
-            tasks = []
-            for _id in batch:
-                if spec.type == "player_fanout" and self._fanout_requires_season(spec):
+            batch_size = self.config.api.get("fanout_batch_size", 20)
+        pairs = spec.type == "player_fanout" and self._fanout_requires_season(spec)
+
+        def calls():
+            for i, _id in enumerate(ids):
+                if i % batch_size == 0:
+                    log_json(
+                        self.logger,
+                        "fanout_batch_start",
+                        endpoint=spec.name,
+                        batch_start=i,
+                        batch_size=min(batch_size, total - i),
+                        total=total,
+                    )
+                if pairs:
                     player_id, season = _id
                     params = {key_name: player_id, "season": season}
-                    tasks.append(self._run_single_call(spec, params, mode="backfill", season=season))
+                    yield self._fanout_call(spec, params, "backfill", season=season)
                     continue
                 params = {key_name: _id}
                 season = meta.get(_id, {}).get("season") if key_name == "gameId" else None
                 date = meta.get(_id, {}).get("date") if key_name == "gameId" else None
-                tasks.append(self._run_single_call(spec, params, mode="backfill", season=season, date=date))
-            await _gather(tasks)
-            log_json(self.logger, "fanout_batch_done", endpoint=spec.name, batch_end=i + len(batch), total=total)
+                yield self._fanout_call(spec, params, "backfill", season=season, date=date)
+
+        await _run_bounded(calls(), batch_size, self._fanout_progress(spec, total, batch_size))
         log_json(self.logger, "fanout_done", endpoint=spec.name, count=total)
 
+    def _pending_game_ids(self) -> List[int]:
+        # A snapshot of the set (calls run while it is iterated), minus any
+        # IDs a resume file marks as done; no ordering is needed.
+        if self._resume_game_ids:
+            return list(self._game_ids - self._resume_game_ids)
+        return list(self._game_ids)
+
+    def _fanout_call(
+        self,
+        spec,
+        params: Dict[str, Any],
+        mode: str,
+        season: Optional[int] = None,
+        date: Optional[str] = None,
+    ) -> Callable[[], Awaitable[None]]:
+        return lambda: self._run_single_call(spec, params, mode, season=season, date=date)
+
+    def _fanout_progress(self, spec, total: int, batch_size: int) -> Callable[[int], None]:
+        def progress(done: int) -> None:
+            if done % batch_size == 0 or done == total:
+                log_json(self.logger, "fanout_batch_done", endpoint=spec.name, batch_end=done, total=total)
+
+        return progress
+
     async def _ensure_game_ids(self, seasons: List[int], mode: str) -> None:
         if self._game_ids:
             return
@@ -532,7 +615,7 @@ class Orchestrator:
 
     async def _fetch(self, spec, params: Dict[str, Any]) -> Any:
         path = spec.path.format(**params)
-        path_params = set(re.findall(r"\{([^}]+)\}", spec.path))
+        path_params = spec.path_params
         safe_params = {k: v for k, v in params.items() if k not in path_params}
         return await self.api.get_json(path, params=safe_params)
 
@@ -549,7 +632,9 @@ class Orchestrator:
         layout = self.config.s3_layout
         ingested_at = _today()
         tmp_key = make_part_key(layout["tmp_prefix"], self._run_id, f"{spec.name}-{payload_hash[:8]}.tmp")
-        self.s3.put_tmp(tmp_key, b"")
+        # S3 puts are blocking boto3 calls: run them on worker threads so the
+        # event loop keeps driving other fanout calls meanwhile.
+        await asyncio.to_thread(self.s3.put_tmp, tmp_key, b"")
         if spec.name in ("lineups_game", "lineups_team") and records:
             for rec in records:
                 if season is not None and rec.get("season") is None and rec.get("year") is None:
@@ -571,63 +656,80 @@ class Orchestrator:
             f"part-{payload_hash[:8]}.json.gz",
         )
         if records:
-            self.s3.put_json_gz(raw_key, records)
+            # Awaited before the silver steps below mutate the records.
+            await asyncio.to_thread(self.s3.put_json_gz, raw_key, records)
         else:
             self._deadletter(spec.name, params, "empty_response")
             self._record_summary(spec.name, 0)
             return
 
-        bronze_table = BRONZE_TABLES[spec.name]
-        bronze_partition = _bronze_partition(spec, season=season, date=date, asof=ingested_at)
-        bronze_key = make_part_key(
-            layout["bronze_prefix"],
-            bronze_table,
-            bronze_partition,
-            f"part-{payload_hash[:8]}.parquet",
-        )
-        bronze_table_pa = normalize_records(bronze_table, records)
-        self.s3.put_parquet(bronze_key, bronze_table_pa)
-        self._update_glue("bronze", bronze_table, bronze_table_pa.schema, bronze_partition)
-
-        if spec.name in SILVER_TABLES:
-            silver_table = SILVER_TABLES[spec.name]
-            if silver_table == "fct_lines":
-                records = _expand_lines_records(records)
-                if not records:
-                    self._record_summary(spec.name, 0)
-                    return
-            records = _apply_key_aliases(silver_table, records)
-            spec_def = TABLE_SPECS.get(silver_table)
-            if spec_def:
-                _coerce_key_fields(records, spec_def.primary_keys)
-                records = self._filter_seen_keys(silver_table, records, spec_def.primary_keys)
-                records = dedupe_records(records, spec_def.primary_keys)
-            silver_partition = _silver_partition(silver_table, season=season, date=date, asof=ingested_at)
-            silver_key = make_part_key(
-                layout["silver_prefix"],
-                silver_table,
-                silver_partition,
-                f"part-{payload_hash[:8]}.parquet",
-            )
-            silver_table_pa = normalize_records(silver_table, records)
-            self.s3.put_parquet(silver_key, silver_table_pa)
-            self._update_glue("silver", silver_table, silver_table_pa.schema, silver_partition)
-
-        if spec.name in GOLD_TABLES:
-            gold_table = GOLD_TABLES[spec.name]
-            gold_records = _gold_records(records, ingested_at)
-            gold_partition = f"asof={ingested_at}"
-            gold_key = make_part_key(
-                layout["gold_prefix"],
-                gold_table,
-                gold_partition,
+        # The bronze/silver/gold Parquet uploads overlap each other and the
+        # building of the next layer; all are awaited before returning.
+        uploads: List[asyncio.Future] = []
+        try:
+            bronze_table = BRONZE_TABLES[spec.name]
+            bronze_partition = _bronze_partition(spec, season=season, date=date, asof=ingested_at)
+            bronze_key = make_part_key(
+                layout["bronze_prefix"],
+                bronze_table,
+                bronze_partition,
                 f"part-{payload_hash[:8]}.parquet",
             )
-            gold_table_pa = normalize_records(gold_table, gold_records)
-            self.s3.put_parquet(gold_key, gold_table_pa)
-
+            uploads.append(self._put_layer("bronze", bronze_table, bronze_key, bronze_partition, normalize_records(bronze_table, records)))
+
+            if spec.name in SILVER_TABLES:
+                silver_table = SILVER_TABLES[spec.name]
+                if silver_table == "fct_lines":
+                    records = _expand_lines_records(records)
+                    if not records:
+                        self._record_summary(spec.name, 0)
+                        return
+                records = _apply_key_aliases(silver_table, records)
+                spec_def = TABLE_SPECS.get(silver_table)
+                if spec_def:
+                    _coerce_key_fields(records, spec_def.primary_keys)
+                    records = self._filter_seen_keys(silver_table, records, spec_def.primary_keys)
+                silver_partition = _silver_partition(silver_table, season=season, date=date, asof=ingested_at)
+                silver_key = make_part_key(
+                    layout["silver_prefix"],
+                    silver_table,
+                    silver_partition,
+                    f"part-{payload_hash[:8]}.parquet",
+                )
+                uploads.append(self._put_layer("silver", silver_table, silver_key, silver_partition, normalize_records(silver_table, records)))
+
+            if spec.name in GOLD_TABLES:
+                gold_table = GOLD_TABLES[spec.name]
+                gold_records = _gold_records(records, ingested_at)
+                gold_partition = f"asof={ingested_at}"
+                gold_key = make_part_key(
+                    layout["gold_prefix"],
+                    gold_table,
+                    gold_partition,
+                    f"part-{payload_hash[:8]}.parquet",
+                )
+                uploads.append(
+                    asyncio.ensure_future(
+                        asyncio.to_thread(self.s3.put_parquet, gold_key, normalize_records(gold_table, gold_records))
+                    )
+                )
+        finally:
+            if uploads:
+                await asyncio.gather(*uploads)
         self._record_summary(spec.name, len(records))
 
+    def _put_layer(self, layer: str, table: str, key: str, partition: str, table_pa) -> asyncio.Future:
+        # The upload task holds the only reference to the Arrow table, so it
+        # is freed once written rather than kept while the next layer is
+        # built from the records.
+        return asyncio.ensure_future(self._upload_layer(layer, table, key, partition, table_pa))
+
+    async def _upload_layer(self, layer: str, table: str, key: str, partition: str, table_pa) -> None:
+        await asyncio.to_thread(self.s3.put_parquet, key, table_pa)
+        # Registered only once the data exists, so a failed upload never
+        # leaves Glue pointing at a missing partition.
+        self._update_glue(layer, table, table_pa.schema, partition)
+
     def _update_glue(self, layer: str, table: str, schema, partition: str) -> None:
         db = f"cbbd_{layer}"
         self.glue.ensure_database(db)
@@ -657,23 +759,41 @@ class Orchestrator:
     def _filter_seen_keys(
         self, table: str, records: List[Dict[str, Any]], key_fields: Tuple[str, ...]
     ) -> List[Dict[str, Any]]:
+        # One pass that both drops keys already written this run and dedupes
+        # the batch (what dedupe_records would do afterwards): complete keys
+        # go through the run-wide set, while keys with a null part are only
+        # deduped within this batch.
         if not key_fields:
             return records
         seen = self._seen_keys.setdefault(table, set())
         out: List[Dict[str, Any]] = []
-        for rec in records:
-            key = []
-            missing = False
-            for k in key_fields:
-                v = rec.get(k)
+        if len(key_fields) == 1:
+            # Single-column keys (fct_plays, fct_substitutions, ...) are
+            # stored bare rather than as 1-tuples: exact, and roughly half
+            # the memory per seen key on the largest tables.
+            (field,) = key_fields
+            null_kept = False
+            for rec in records:
+                v = rec.get(field)
                 if v is None:
-                    missing = True
-                    break
-                key.append(v)
-            if missing:
+                    if not null_kept:
+                        null_kept = True
+                        out.append(rec)
+                    continue
+                if v in seen:
+                    continue
+                seen.add(v)
+                out.append(rec)
+            return out
+        partial_seen: Set[Tuple[Any, ...]] = set()
+        for rec in records:
+            t = tuple([rec.get(k) for k in key_fields])
+            if None in t:
+                if t in partial_seen:
+                    continue
+                partial_seen.add(t)
                 out.append(rec)
                 continue
-            t = tuple(key)
             if t in seen:
                 continue
             seen.add(t)
@@ -685,12 +805,21 @@ class Orchestrator:
         key = make_part_key(self.config.s3_layout["meta_prefix"], f"run_id={self._run_id}.json")
         self.s3.put_deadletter(key, self._summary)
 
-    def _deadletter(self, endpoint: str, params: Dict[str, Any], reason: str) -> None:
+    def _deadletter(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        reason: str,
+        params_hash: Optional[str] = None,
+    ) -> None:
+        # Callers that already hashed these params pass the hash along.
+        if params_hash is None:
+            params_hash = stable_hash(params)
         key = make_part_key(
             self.config.s3_layout["deadletter_prefix"],
             endpoint,
             f"ingested_at={_today()}",
-            f"part-{stable_hash(params)[:8]}.json",
+            f"part-{params_hash[:8]}.json",
         )
         self.s3.put_deadletter(key, {"reason": reason, "params": params, "endpoint": endpoint})
 
@@ -833,13 +962,13 @@ class Orchestrator:
             if self._missing_required_params(spec, params):
                 log_json(self.logger, "skip_missing_params", endpoint=spec.name, params=params)
                 continue
+            chunk_hash = stable_hash(params)
             try:
                 resp = await self._fetch(spec, params)
                 records = _coerce_records(resp)
-                chunk_hash = stable_hash(params)
                 await self._write_layers(spec, records, params, chunk_hash, mode, season=season)
             except Exception as exc:
-                self._deadletter(spec.name, params, f"error:{exc}")
+                self._deadletter(spec.name, params, f"error:{exc}", chunk_hash)
                 continue
 
     async def _fetch_games_for_season(self, spec, season: int) -> List[Dict[str, Any]]:
@@ -871,13 +1000,13 @@ class Orchestrator:
             if self._missing_required_params(spec, params):
                 log_json(self.logger, "skip_missing_params", endpoint=spec.name, params=params)
                 continue
+            chunk_hash = stable_hash(params)
             try:
                 resp = await self._fetch(spec, params)
                 records = _coerce_records(resp)
-                chunk_hash = stable_hash(params)
                 await self._write_layers(spec, records, params, chunk_hash, mode, season=season)
             except Exception as exc:
-                self._deadletter(spec.name, params, f"error:{exc}")
+                self._deadletter(spec.name, params, f"error:{exc}", chunk_hash)
                 continue
 
     async def _run_season_by_chunks(self, spec, season: int, payload_hash: str, mode: str) -> None:
@@ -893,13 +1022,13 @@ class Orchestrator:
             if self._missing_required_params(spec, params):
                 log_json(self.logger, "skip_missing_params", endpoint=spec.name, params=params)
                 continue
+            chunk_hash = stable_hash(params)
             try:
                 resp = await self._fetch(spec, params)
                 records = _coerce_records(resp)
-                chunk_hash = stable_hash(params)
                 await self._write_layers(spec, records, params, chunk_hash, mode, season=season)
             except Exception as exc:
-                self._deadletter(spec.name, params, f"error:{exc}")
+                self._deadletter(spec.name, params, f"error:{exc}", chunk_hash)
                 continue
 
     def _season_window(self, season: int) -> tuple[date, date]:
@@ -943,10 +1072,86 @@ class Orchestrator:
         return resume_ids
 
 
-async def _gather(tasks: Iterable[asyncio.Future]) -> None:
-    if not tasks:
+def _season_checkpoint_hash(spec) -> str:
+    return stable_hash({"season_param": spec.season_param or "season"})
+
+
+def _latest_object(s3, bucket: str, prefix: str) -> Optional[Dict[str, Any]]:
+    # Paginate: a single list_objects_v2 call stops at 1000 keys.
+    latest = None
+    for page in s3.get_paginator("list_objects_v2").paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            if latest is None or obj["LastModified"] > latest["LastModified"]:
+                latest = obj
+    return latest
+
+
+def _read_parquet_schema(s3, bucket: str, key: str):
+    # Only the footer is needed for the schema: fetch the file's tail with a
+    # ranged GET (a second, exact one if the footer is larger) instead of
+    # downloading and decoding the whole file.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tail = s3.get_object(Bucket=bucket, Key=key, Range=f"bytes=-{_FOOTER_PROBE_BYTES}")["Body"].read()
+    if len(tail) < 8 or tail[-4:] != b"PAR1":
+        raise ValueError("not a parquet file")
+    footer_len = int.from_bytes(tail[-8:-4], "little") + 8
+    if footer_len > len(tail):
+        tail = s3.get_object(Bucket=bucket, Key=key, Range=f"bytes=-{footer_len}")["Body"].read()
+    return pq.read_schema(pa.BufferReader(tail[-footer_len:]))
+
+
+def _use_eager_tasks() -> None:
+    # Python 3.12+: run new tasks eagerly up to their first suspension, so
+    # fanout calls that exit early (missing params, empty response) finish
+    # without a trip through the scheduler. Leaves custom factories alone.
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
         return
-    await asyncio.gather(*tasks)
+    loop = asyncio.get_running_loop()
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(factory)
+
+
+async def _run_bounded(
+    calls: Iterable[Callable[[], Awaitable[None]]],
+    limit: int,
+    on_done: Optional[Callable[[int], None]] = None,
+) -> None:
+    # Sliding window: at most `limit` calls in flight, and each completion
+    # immediately admits the next one, so one slow request never holds back
+    # the rest. Coroutines are only created as slots free up.
+    sem = asyncio.Semaphore(max(int(limit), 1))
+    pending: Set[asyncio.Task] = set()
+    done = 0
+    error: Optional[BaseException] = None
+
+    def _finished(task: asyncio.Task) -> None:
+        nonlocal done, error
+        pending.discard(task)
+        sem.release()
+        done += 1
+        # A failure is kept (and retrieved) here, since a finished task
+        # leaves `pending`; no further calls are started after it.
+        if error is None and not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+        if on_done is not None:
+            on_done(done)
+
+    for call in calls:
+        await sem.acquire()
+        if error is not None:
+            break
+        task = asyncio.create_task(call())
+        pending.add(task)
+        task.add_done_callback(_finished)
+    if pending:
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        if error is None:
+            error = next((r for r in results if isinstance(r, BaseException)), None)
+    if error is not None:
+        raise error
 
 
 def _coerce_records(resp: Any) -> List[Dict[str, Any]]:
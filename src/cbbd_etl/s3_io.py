@@ -6,13 +6,41 @@ import json
 import time
 import uuid
 from dataclasses import dataclass
-from typing import Any, Iterable, List
+from itertools import islice
+from typing import Any, Iterable, List, Optional
 
 import boto3
 import pyarrow as pa
+from boto3.s3.transfer import TransferConfig
 import pyarrow.parquet as pq
 
 
+# Bodies at or above the threshold are sent as a multipart upload with the
+# parts in flight concurrently; smaller bodies go out as a single PUT.
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_THRESHOLD,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+# Raw-layer JSON lines: one shared encoder (json.dumps(default=str) builds a
+# new one per call) and zlib's default level, which is markedly faster than
+# gzip's level 9 for files only ~1% larger.
+_JSON_ENCODER = json.JSONEncoder(default=str)
+_GZIP_LEVEL = 6
+_JSON_LINES_PER_WRITE = 1000
+
+
+def dump_json(payload: Any) -> bytes:
+    # Same bytes as json.dumps(payload, default=str), via the shared encoder.
+    return _JSON_ENCODER.encode(payload).encode("utf-8")
+
+
+load_json = json.loads
+
+
 @dataclass
 class S3Path:
     bucket: str
@@ -32,7 +60,12 @@ class S3IO:
         delay = 0.5
         for attempt in range(1, max_attempts + 1):
             try:
-                self._client.put_object(Bucket=self.bucket, Key=key, Body=body)
+                if len(body) >= _MULTIPART_THRESHOLD:
+                    self._client.upload_fileobj(
+                        io.BytesIO(body), self.bucket, key, Config=_TRANSFER_CONFIG
+                    )
+                else:
+                    self._client.put_object(Bucket=self.bucket, Key=key, Body=body)
                 return
             except Exception:
                 if attempt >= max_attempts:
@@ -47,22 +80,27 @@ class S3IO:
 
     def put_json_gz(self, key: str, records: Iterable[Any]) -> None:
         buf = io.BytesIO()
-        with gzip.GzipFile(fileobj=buf, mode="wb") as gz:
-            for rec in records:
-                line = json.dumps(rec, default=str).encode("utf-8")
-                gz.write(line + b"\n")
-        buf.seek(0)
-        self._put_with_retry(key, buf.read())
-
-    def put_parquet(self, key: str, table: pa.Table) -> None:
+        encode = _JSON_ENCODER.encode
+        it = iter(records)
+        with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=_GZIP_LEVEL) as gz:
+            # Lines are joined a batch at a time: few gzip writes, without
+            # holding the whole uncompressed page in memory.
+            while True:
+                batch = "".join(encode(rec) + "\n" for rec in islice(it, _JSON_LINES_PER_WRITE))
+                if not batch:
+                    break
+                gz.write(batch.encode("utf-8"))
+        self._put_with_retry(key, buf.getvalue())
+
+    def put_parquet(
+        self, key: str, table: pa.Table, row_group_size: Optional[int] = None
+    ) -> None:
         sink = io.BytesIO()
-        pq.write_table(table, sink, compression="snappy")
-        sink.seek(0)
-        self._put_with_retry(key, sink.read())
+        pq.write_table(table, sink, compression="snappy", row_group_size=row_group_size)
+        self._put_with_retry(key, sink.getvalue())
 
     def put_deadletter(self, key: str, payload: dict) -> None:
-        body = json.dumps(payload, default=str).encode("utf-8")
-        self._put_with_retry(key, body)
+        self._put_with_retry(key, dump_json(payload))
 
     def put_tmp(self, key: str, payload: bytes) -> None:
         self._put_with_retry(key, payload)
@@ -14,6 +14,7 @@ import pytest
 from moto import mock_aws
 
 from cbbd_etl.config import Config
+from cbbd_etl.gold._io_helpers import clear_silver_cache
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +41,14 @@ def aws_credentials():
         os.environ.pop(key, None)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_silver_cache():
+    """Clear the process-wide silver table cache around every test."""
+    clear_silver_cache()
+    yield
+    clear_silver_cache()
+
+
 # ---------------------------------------------------------------------------
 # Moto-based AWS service fixtures
 # ---------------------------------------------------------------------------
@@ -38,3 +38,17 @@ def test_checkpoint_get_put():
         cp = store.get("games", "abc")
         assert cp is not None
         assert cp.payload["last_ingested_date"] == "2026-01-28"
+
+
+def test_checkpoint_get_many(dynamodb_table):
+    store = CheckpointStore("us-east-1", table_name="cbbd_checkpoints")
+    for i in range(120):
+        store.put("ratings_srs", f"h{i}", {"last_completed_season": 2000 + i})
+
+    # More keys than one BatchGetItem request takes.
+    keys = [("ratings_srs", f"h{i}") for i in range(120)] + [("ratings_srs", "missing")]
+    found = store.get_many(keys)
+    assert len(found) == 120
+    assert ("ratings_srs", "missing") not in found
+    assert found[("ratings_srs", "h10")].payload["last_completed_season"] == 2010
+    assert store.get_many([]) == {}
@@ -126,6 +126,25 @@ class TestEnsureTable:
         resp = glue_catalog._client.get_table(DatabaseName="cbbd_test", Name="fct_games")
         assert resp["Table"]["Name"] == "fct_games"
 
+    def test_ensure_table_repeat_skips_glue_calls(self, glue_catalog: GlueCatalog):
+        """A repeat call with an unchanged definition makes no API calls."""
+        glue_catalog.ensure_database("cbbd_test")
+        schema = pa.schema([pa.field("gameId", pa.int64())])
+        location = "s3://hoops-edge/silver/fct_games/"
+        glue_catalog.ensure_table("cbbd_test", "fct_games", location, schema)
+
+        client = glue_catalog._client
+        glue_catalog._client = None  # any API call would now fail
+        glue_catalog.ensure_database("cbbd_test")
+        glue_catalog.ensure_table("cbbd_test", "fct_games", location, schema)
+        glue_catalog._client = client
+
+        # A changed schema still reaches Glue.
+        schema_v2 = schema.append(pa.field("team", pa.string()))
+        glue_catalog.ensure_table("cbbd_test", "fct_games", location, schema_v2)
+        resp = client.get_table(DatabaseName="cbbd_test", Name="fct_games")
+        assert len(resp["Table"]["StorageDescriptor"]["Columns"]) == 2
+
 
 class TestPaToGlue:
     @pytest.mark.parametrize(
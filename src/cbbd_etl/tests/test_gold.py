@@ -317,10 +317,24 @@ class TestTeamPowerRankings:
         try:
             result = build(_make_config(), 2024)
             assert result.num_rows == 0
+            assert result.schema.names == sorted(TABLE_SPECS["team_power_rankings"].type_hints)
         finally:
             for p in patches:
                 p.stop()
 
+    def test_build_uses_shared_s3(self):
+        """A caller-supplied S3 client is used instead of constructing one."""
+        from cbbd_etl.gold.team_power_rankings import build
+
+        s3 = MockS3IO({
+            "fct_ratings_adjusted": _make_ratings_adjusted(),
+            "dim_teams": _make_dim_teams(),
+        })
+        with patch("cbbd_etl.gold.team_power_rankings.S3IO") as s3_cls:
+            result = build(_make_config(), 2024, s3=s3)
+        s3_cls.assert_not_called()
+        assert result.num_rows == 3
+
     def test_missing_srs(self):
         """Build succeeds when SRS data is missing."""
         from cbbd_etl.gold.team_power_rankings import build
@@ -373,6 +387,15 @@ class TestTeamPowerRankings:
             for p in patches:
                 p.stop()
 
+    def test_schema_matches_table_spec(self):
+        """The explicit output schema agrees with the TableSpec type hints."""
+        from cbbd_etl.gold.team_power_rankings import _SCHEMA
+
+        spec = TABLE_SPECS["team_power_rankings"]
+        assert _SCHEMA.names == sorted(spec.type_hints)
+        for field in _SCHEMA:
+            assert field.type == spec.type_hints[field.name], field.name
+
 
 # ---------------------------------------------------------------------------
 # Tests: game_predictions_features
@@ -622,7 +645,7 @@ class TestPlayerSeasonImpact:
 
     def test_empty_stats(self):
         """Returns empty table with no player stats."""
-        from cbbd_etl.gold.player_season_impact import build
+        from cbbd_etl.gold.player_season_impact import _SCHEMA, build
 
         table_data = {
             "fct_player_season_stats": pa.table({}),
@@ -635,6 +658,8 @@ class TestPlayerSeasonImpact:
         try:
             result = build(_make_config(), 2024)
             assert result.num_rows == 0
+            # Same physical schema as a non-empty build
+            assert result.schema == _SCHEMA
         finally:
             for p in patches:
                 p.stop()
@@ -680,6 +705,18 @@ class TestPlayerSeasonImpact:
             for p in patches:
                 p.stop()
 
+    def test_schema_matches_table_spec(self):
+        """The explicit output schema agrees with the TableSpec type hints."""
+        from cbbd_etl.gold.player_season_impact import _SCHEMA
+
+        spec = TABLE_SPECS["player_season_impact"]
+        assert _SCHEMA.names == sorted(spec.type_hints)
+        for field in _SCHEMA:
+            dtype = field.type
+            if pa.types.is_dictionary(dtype):
+                dtype = dtype.value_type
+            assert dtype == spec.type_hints[field.name], field.name
+
 
 # ---------------------------------------------------------------------------
 # Tests: market_lines_analysis
@@ -751,7 +788,7 @@ class TestMarketLinesAnalysis:
 
     def test_empty_lines(self):
         """Returns empty table when no lines exist."""
-        from cbbd_etl.gold.market_lines_analysis import build
+        from cbbd_etl.gold.market_lines_analysis import _SCHEMA, build
 
         table_data = {
             "fct_lines": pa.table({}),
@@ -764,6 +801,8 @@ class TestMarketLinesAnalysis:
         try:
             result = build(_make_config(), 2024)
             assert result.num_rows == 0
+            # Same physical schema as a non-empty build
+            assert result.schema == _SCHEMA
         finally:
             for p in patches:
                 p.stop()
@@ -794,6 +833,18 @@ class TestMarketLinesAnalysis:
             for p in patches:
                 p.stop()
 
+    def test_schema_matches_table_spec(self):
+        """The explicit output schema agrees with the TableSpec type hints."""
+        from cbbd_etl.gold.market_lines_analysis import _SCHEMA
+
+        spec = TABLE_SPECS["market_lines_analysis"]
+        assert _SCHEMA.names == sorted(spec.type_hints)
+        for field in _SCHEMA:
+            dtype = field.type
+            if pa.types.is_dictionary(dtype):
+                dtype = dtype.value_type
+            assert dtype == spec.type_hints[field.name], field.name
+
 
 # ---------------------------------------------------------------------------
 # Tests: team_season_summary
@@ -930,6 +981,15 @@ class TestTeamSeasonSummary:
             for p in patches:
                 p.stop()
 
+    def test_schema_matches_table_spec(self):
+        """The explicit output schema agrees with the TableSpec type hints."""
+        from cbbd_etl.gold.team_season_summary import _SCHEMA
+
+        spec = TABLE_SPECS["team_season_summary"]
+        assert _SCHEMA.names == sorted(spec.type_hints)
+        for field in _SCHEMA:
+            assert field.type == spec.type_hints[field.name], field.name
+
 
 # ---------------------------------------------------------------------------
 # Tests: TABLE_SPECS
@@ -992,6 +1052,28 @@ class TestIOHelpers:
         result = safe_divide([10.0], [50.0], scale=100.0)
         assert abs(result[0] - 20.0) < 0.01
 
+    def test_parse_made_attempted(self):
+        """parse_made_attempted splits stat dict strings, tolerating bad values."""
+        from cbbd_etl.gold._io_helpers import parse_made_attempted, parse_stat_total
+
+        made, attempted = parse_made_attempted([
+            "{'made': 175, 'attempted': 367, 'pct': 47.7}",
+            None,
+            "not a dict",
+        ])
+        assert made == [175, None, None]
+        assert attempted == [367, None, None]
+        assert parse_stat_total(["{'offensive': 31, 'defensive': 110, 'total': 141}"]) == [141]
+
+    def test_first_column_name(self):
+        """first_column_name returns the first candidate present, in candidate order."""
+        from cbbd_etl.gold._io_helpers import first_column_name
+
+        table = pa.table({"pts": [1], "points": [2]})
+        assert first_column_name(table, ["points", "pts"]) == "points"
+        assert first_column_name(table, ["pts", "points"]) == "pts"
+        assert first_column_name(table, "missing") is None
+
     def test_pydict_get_missing_column(self):
         """pydict_get returns Nones for missing columns."""
         from cbbd_etl.gold._io_helpers import pydict_get
@@ -1050,6 +1132,201 @@ class TestIOHelpers:
         assert result.num_rows == 2
         assert result.column("gameId").to_pylist() == [100, 101]
 
+    def test_arrow_column_float_to_int_nulls_non_finite(self):
+        """NaN, infinities and out-of-range floats become null, not INT64_MIN."""
+        from cbbd_etl.gold._io_helpers import arrow_column
+
+        table = pa.table({"score": [71.0, -2.7, float("nan"), float("inf"), 1e30, None]})
+        result = arrow_column(table, "score", pa.int64())
+        assert result.to_pylist() == [71, -2, None, None, None, None]
+
+    def test_compute_records_skips_nan_scores_and_ids(self):
+        """A NaN score leaves the game untallied; a NaN team ID drops it."""
+        from cbbd_etl.gold.team_season_summary import _compute_records
+
+        games = pa.table({
+            "homeTeamId": [1.0, 1.0, float("nan")],
+            "awayTeamId": [2.0, 2.0, 2.0],
+            "homeScore": [80.0, float("nan"), 90.0],
+            "awayScore": [70.0, 60.0, 50.0],
+        })
+        teams = pa.table({
+            "teamId": pa.array([], type=pa.int64()),
+            "school": pa.array([], type=pa.string()),
+            "conference": pa.array([], type=pa.dictionary(pa.int32(), pa.string())),
+        })
+        team_ids, wins, losses, _, _ = _compute_records(games, teams)
+        assert team_ids.tolist() == [1, 2]
+        assert wins.tolist() == [1, 0]
+        assert losses.tolist() == [0, 1]
+
+    def test_read_silver_table_cached(self):
+        """read_silver_table decodes each table once until the cache is cleared."""
+        from cbbd_etl.gold._io_helpers import clear_silver_cache, read_silver_table
+
+        s3 = MagicMock()
+        s3.list_keys.return_value = ["silver/dim_teams/part-00000000.parquet"]
+        s3.get_object_bytes.return_value = _table_to_s3_bytes(_make_dim_teams())
+        cfg = _make_config()
+
+        first = read_silver_table(s3, cfg, "dim_teams")
+        second = read_silver_table(s3, cfg, "dim_teams")
+        assert second is first
+        assert s3.get_object_bytes.call_count == 1
+
+        read_silver_table(s3, cfg, "dim_teams", columns=["teamId"])
+        assert s3.get_object_bytes.call_count == 2
+
+        clear_silver_cache()
+        read_silver_table(s3, cfg, "dim_teams")
+        assert s3.get_object_bytes.call_count == 3
+
+    def test_read_silver_table_concurrent_single_fetch(self):
+        """Concurrent reads of the same table share one S3 fetch."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from cbbd_etl.gold._io_helpers import read_silver_table
+
+        payload = _table_to_s3_bytes(_make_dim_teams())
+
+        def slow_get(key):
+            time.sleep(0.2)
+            return payload
+
+        s3 = MagicMock()
+        s3.list_keys.return_value = ["silver/dim_teams/part-00000000.parquet"]
+        s3.get_object_bytes.side_effect = slow_get
+        cfg = _make_config()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(
+                lambda _: read_silver_table(s3, cfg, "dim_teams"), range(4)
+            ))
+        assert s3.get_object_bytes.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_read_silver_table_multiple_files_keep_key_order(self):
+        """Files fetched in parallel are concatenated in listing order."""
+        from cbbd_etl.gold._io_helpers import read_silver_table
+
+        keys = [f"silver/fct_games/part-{i:08d}.parquet" for i in range(5)]
+        payloads = {
+            key: _table_to_s3_bytes(pa.table({"gameId": pa.array([i], type=pa.int64())}))
+            for i, key in enumerate(keys)
+        }
+        s3 = MagicMock()
+        s3.list_keys.return_value = keys
+        s3.get_object_bytes.side_effect = payloads.__getitem__
+
+        result = read_silver_table(s3, _make_config(), "fct_games")
+        assert result.column("gameId").to_pylist() == [0, 1, 2, 3, 4]
+
+    def test_dim_team_lookup_cached(self):
+        """dim_team_lookup builds once per process until the cache is cleared."""
+        from cbbd_etl.gold._io_helpers import clear_silver_cache, dim_team_lookup
+
+        s3 = MagicMock()
+        s3.list_keys.return_value = ["silver/dim_teams/part-00000000.parquet"]
+        s3.get_object_bytes.return_value = _table_to_s3_bytes(_make_dim_teams())
+        cfg = _make_config()
+
+        lookup = dim_team_lookup(s3, cfg)
+        assert lookup[1] == {"school": "Duke", "conference": "ACC"}
+        assert dim_team_lookup(s3, cfg) is lookup
+
+        clear_silver_cache()
+        assert dim_team_lookup(s3, cfg) is not lookup
+        assert s3.get_object_bytes.call_count == 2
+
+    def test_read_dim_teams_survives_lru_eviction(self):
+        """dim_teams stays cached while season reads churn the silver LRU."""
+        from cbbd_etl.gold import _io_helpers
+        from cbbd_etl.gold._io_helpers import read_dim_teams, read_silver_table
+
+        s3 = MagicMock()
+        s3.list_keys.return_value = ["silver/dim_teams/part-00000000.parquet"]
+        s3.get_object_bytes.return_value = _table_to_s3_bytes(_make_dim_teams())
+        cfg = _make_config()
+
+        dim = read_dim_teams(s3, cfg)
+        for season in range(_io_helpers._SILVER_CACHE_MAXSIZE + 1):
+            read_silver_table(s3, cfg, "fct_games", season=season)
+        calls = s3.get_object_bytes.call_count
+        assert read_dim_teams(s3, cfg) is dim
+        assert s3.get_object_bytes.call_count == calls
+
+    def test_read_silver_table_pushdown(self):
+        """Projection skips absent columns; filters only apply where the column exists."""
+        from cbbd_etl.gold._io_helpers import read_silver_table
+
+        table = pa.table({
+            "gameId": pa.array([1, 2, 3], type=pa.int64()),
+            "season": pa.array([2024, 2024, 2023], type=pa.int32()),
+            "spread": pa.array([-3.5, 1.0, 2.0], type=pa.float64()),
+        })
+        s3 = MagicMock()
+        s3.list_keys.return_value = ["silver/fct_lines/part-00000000.parquet"]
+        s3.get_object_bytes.return_value = _table_to_s3_bytes(table)
+        cfg = _make_config()
+
+        result = read_silver_table(
+            s3, cfg, "fct_lines",
+            columns=["gameId", "overUnder"],
+            filters=[("season", "=", 2024), ("provider", "=", "ESPN")],
+        )
+        assert result.column_names == ["gameId"]
+        assert result.column("gameId").to_pylist() == [1, 2]
+
+    def test_read_silver_table_empty_file(self):
+        """A zero-row file yields an empty table with the projected schema."""
+        from cbbd_etl.gold._io_helpers import read_silver_table
+
+        table = pa.table({
+            "gameId": pa.array([], type=pa.int64()),
+            "spread": pa.array([], type=pa.float64()),
+        })
+        s3 = MagicMock()
+        s3.list_keys.return_value = ["silver/fct_lines/part-00000000.parquet"]
+        s3.get_object_bytes.return_value = _table_to_s3_bytes(table)
+        cfg = _make_config()
+
+        result = read_silver_table(
+            s3, cfg, "fct_lines",
+            columns=["spread", "overUnder"],
+            filters=[("season", "=", 2024)],
+        )
+        assert result.num_rows == 0
+        assert result.schema == pa.schema([pa.field("spread", pa.float64())])
+
+    def test_read_silver_table_casts_id_columns(self):
+        """Team-id columns come back as int64 even when files promote to double."""
+        from cbbd_etl.gold._io_helpers import read_silver_table
+
+        first = pa.table({
+            "teamId": pa.array([1, 2], type=pa.int32()),
+            "homeTeamId": pa.array([3, 4], type=pa.int64()),
+        })
+        second = pa.table({
+            "teamId": pa.array([5, None], type=pa.int32()),
+            "homeTeamId": pa.array([6.0, 7.0], type=pa.float64()),
+        })
+        s3 = MagicMock()
+        s3.list_keys.return_value = [
+            "silver/fct_games/part-00000000.parquet",
+            "silver/fct_games/part-00000001.parquet",
+        ]
+        s3.get_object_bytes.side_effect = [
+            _table_to_s3_bytes(first), _table_to_s3_bytes(second),
+        ]
+        cfg = _make_config()
+
+        result = read_silver_table(s3, cfg, "fct_games")
+        assert result.schema.field("teamId").type == pa.int64()
+        assert result.schema.field("homeTeamId").type == pa.int64()
+        assert result.column("teamId").to_pylist() == [1, 2, 5, None]
+        assert result.column("homeTeamId").to_pylist() == [3, 4, 6, 7]
+
 
 # ---------------------------------------------------------------------------
 # Tests: real-data column name patterns
@@ -4,7 +4,9 @@ import pytest
 
 from cbbd_etl.gold.iterative_ratings import (
     GameObs,
+    GameObsArray,
     compute_barthag,
+    compute_barthag_batch,
     exponential_decay_weight,
     solve_ratings,
 )
@@ -62,6 +64,15 @@ def test_barthag_zero():
     assert compute_barthag(0.0, 0.0) == 0.5
 
 
+def test_barthag_batch_matches_scalar():
+    """Batch BARTHAG should agree with the scalar version, including edge cases."""
+    oe = [100.0, 120.0, 85.0, 0.0, float("nan"), float("inf")]
+    de = [100.0, 90.0, 115.0, 0.0, 100.0, 100.0]
+    result = compute_barthag_batch(oe, de)
+    for i, (o, d) in enumerate(zip(oe, de)):
+        assert result[i] == pytest.approx(compute_barthag(o, d), abs=1e-12)
+
+
 # ---------------------------------------------------------------------------
 # solve_ratings — two teams
 # ---------------------------------------------------------------------------
@@ -140,6 +151,20 @@ def test_solve_empty():
     assert solve_ratings([]) == {}
 
 
+def test_solve_accepts_game_obs_array():
+    """List input and the equivalent GameObsArray should give identical results."""
+    games = [
+        _make_game(1, 1, 2, 80, 70, 60, 70, home=True),
+        _make_game(1, 2, 1, 60, 70, 80, 70, home=False),
+        _make_game(2, 2, 3, 75, 68, 70, 68, neutral=True),
+        _make_game(2, 3, 2, 70, 68, 75, 68, neutral=True),
+        _make_game(3, 3, 1, 50, 0, 60, 0, home=True),
+    ]
+    arr = GameObsArray.from_list(games)
+    assert len(arr) == 5
+    assert solve_ratings(arr) == solve_ratings(games)
+
+
 def test_solve_with_prior():
     """Warm-start with prior should still converge."""
     games = [
@@ -234,3 +259,75 @@ def test_per_game_adjustment_produces_spread():
     # There should be meaningful spread between best and worst
     spread = max(margins.values()) - min(margins.values())
     assert spread > 40, f"Total spread={spread:.2f} should be > 40"
+
+
+def _reference_solve(games, hca=1.4, max_iter=200, tol=0.01, damping=1.0):
+    """Straightforward per-game solver recomputing every team each iteration."""
+    team_ids = sorted({g.team_id for g in games} | {g.opp_id for g in games})
+    valid = [g for g in games if g.team_poss > 0]
+    league_avg = (
+        sum(g.weight * g.team_pts for g in valid) / sum(g.weight * g.team_poss for g in valid) * 100.0
+    )
+    per_game = []
+    for g in valid:
+        sign = 0.0 if g.is_neutral else (1.0 if g.is_home else -1.0)
+        oe = (g.team_pts - sign * hca * g.team_poss / 100.0) / g.team_poss * 100.0
+        de = (g.opp_pts + sign * hca * g.opp_poss / 100.0) / g.opp_poss * 100.0
+        per_game.append((g, min(max(oe, 40.0), 200.0), min(max(de, 40.0), 200.0)))
+    weight = {tid: 0.0 for tid in team_ids}
+    adj_oe = {tid: 0.0 for tid in team_ids}
+    adj_de = {tid: 0.0 for tid in team_ids}
+    for g, oe, de in per_game:
+        weight[g.team_id] += g.weight
+        adj_oe[g.team_id] += g.weight * oe
+        adj_de[g.team_id] += g.weight * de
+    for tid in team_ids:
+        adj_oe[tid] = adj_oe[tid] / weight[tid] if weight[tid] else league_avg
+        adj_de[tid] = adj_de[tid] / weight[tid] if weight[tid] else league_avg
+
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        num_oe = {tid: 0.0 for tid in team_ids}
+        num_de = {tid: 0.0 for tid in team_ids}
+        for g, oe, de in per_game:
+            num_oe[g.team_id] += g.weight * oe * league_avg / adj_de[g.opp_id]
+            num_de[g.team_id] += g.weight * de * league_avg / adj_oe[g.opp_id]
+        new_oe, new_de = {}, {}
+        for tid in team_ids:
+            for new, num, old in ((new_oe, num_oe, adj_oe), (new_de, num_de, adj_de)):
+                value = num[tid] / weight[tid] if weight[tid] else league_avg
+                value = min(max(value, 40.0), 200.0)
+                new[tid] = damping * value + (1.0 - damping) * old[tid]
+        delta = max(
+            max(abs(new_oe[t] - adj_oe[t]), abs(new_de[t] - adj_de[t])) for t in team_ids
+        )
+        adj_oe, adj_de = new_oe, new_de
+        if delta < tol:
+            break
+    return adj_oe, adj_de, iterations
+
+
+@pytest.mark.parametrize("tol,damping", [(0.01, 1.0), (0.1, 0.5), (0.5, 0.5)])
+def test_solver_matches_full_recompute(tol, damping):
+    """Ratings and iteration count match a solver that recomputes every team."""
+    import random
+
+    rng = random.Random(0)
+    games = []
+    for gid in range(400):
+        t1, t2 = rng.sample(range(1, 41), 2)
+        poss = rng.uniform(60, 75)
+        s1, s2 = rng.randint(50, 95), rng.randint(50, 95)
+        neutral = rng.random() < 0.1
+        w = rng.uniform(0.3, 1.0)
+        for team, opp, tp, op, home in ((t1, t2, s1, s2, True), (t2, t1, s2, s1, False)):
+            game = _make_game(gid, team, opp, tp, poss, op, poss, home=home, neutral=neutral)
+            game.weight = w
+            games.append(game)
+
+    result = solve_ratings(games, tol=tol, damping=damping)
+    ref_oe, ref_de, ref_iterations = _reference_solve(games, tol=tol, damping=damping)
+    for tid, row in result.items():
+        assert row["adj_oe"] == pytest.approx(ref_oe[tid], abs=1e-4)
+        assert row["adj_de"] == pytest.approx(ref_de[tid], abs=1e-4)
+        assert row["iterations"] == ref_iterations
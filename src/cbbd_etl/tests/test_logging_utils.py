@@ -0,0 +1,74 @@
+"""Tests for JSON log formatting."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+
+from cbbd_etl.logging_utils import JsonFormatter, _dumps, log_json
+
+
+def _record(msg: str, *args, extra=None) -> logging.LogRecord:
+    record = logging.LogRecord("cbbd.test", logging.INFO, __file__, 1, msg, args, None)
+    if extra is not None:
+        record._json_extra = extra
+    return record
+
+
+class TestJsonFormatter:
+    def test_plain_message_matches_full_payload(self):
+        """The no-extra fast path writes exactly what the dict serializer would."""
+        record = _record('quote " tab\t café %s', "arg")
+        expected = _dumps({
+            "level": "INFO",
+            "logger": "cbbd.test",
+            "message": 'quote " tab\t café arg',
+        })
+        out = JsonFormatter().format(record)
+        assert out == expected
+        assert json.loads(out)["message"] == 'quote " tab\t café arg'
+
+    def test_extra_fields_merged(self):
+        """Fields passed via extra are merged, with non-JSON values stringified."""
+        when = dt.date(2024, 3, 1)
+        record = _record("gold_build_done", extra={"table": "t", "rows": 3, "date": when})
+        out = json.loads(JsonFormatter().format(record))
+        assert out == {
+            "level": "INFO",
+            "logger": "cbbd.test",
+            "message": "gold_build_done",
+            "table": "t",
+            "rows": 3,
+            "date": "2024-03-01",
+        }
+
+    def test_output_matches_json_dumps(self):
+        """Lines are byte-for-byte what json.dumps(default=str) writes."""
+        extra = {
+            "when": dt.datetime(2024, 3, 1, 12, 30),
+            "ratio": float("nan"),
+            "team": "Montréal",
+        }
+        record = _record("ç %s", "x", extra=extra)
+        expected = json.dumps(
+            {"level": "INFO", "logger": "cbbd.test", "message": "ç x", **extra}, default=str
+        )
+        assert JsonFormatter().format(record) == expected
+
+    def test_log_json_fields_reach_formatter(self):
+        """log_json's keyword fields appear in the formatted line."""
+        logger = logging.getLogger("cbbd.test.log_json")
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            log_json(logger, "gold_build_start", table="t", season=2024)
+        finally:
+            logger.removeHandler(handler)
+        out = json.loads(JsonFormatter().format(records[0]))
+        assert out["message"] == "gold_build_start"
+        assert out["table"] == "t"
+        assert out["season"] == 2024
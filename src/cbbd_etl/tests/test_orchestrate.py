@@ -0,0 +1,448 @@
+"""Tests for orchestrator fanout helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import logging
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from cbbd_etl.orchestrate import Orchestrator, _run_bounded, _use_eager_tasks
+
+
+async def test_run_bounded_caps_inflight_calls():
+    """No more than `limit` calls run at once, and every call completes."""
+    inflight = 0
+    peak = 0
+    finished = []
+
+    def make(i):
+        async def call():
+            nonlocal inflight, peak
+            inflight += 1
+            peak = max(peak, inflight)
+            await asyncio.sleep(0.001 * (i % 3))
+            inflight -= 1
+            finished.append(i)
+
+        return call
+
+    progress = []
+    await _run_bounded((make(i) for i in range(25)), 4, progress.append)
+    assert peak == 4
+    assert sorted(finished) == list(range(25))
+    assert progress == list(range(1, 26))
+
+
+async def test_run_bounded_creates_calls_lazily():
+    """Calls are only pulled from the iterable as slots free up."""
+    pulled = 0
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await release.wait()
+
+    def calls():
+        nonlocal pulled
+        for _ in range(10):
+            pulled += 1
+            yield slow
+
+    task = asyncio.create_task(_run_bounded(calls(), 2))
+    await started.wait()
+    await asyncio.sleep(0)
+    assert pulled <= 3
+    release.set()
+    await task
+    assert pulled == 10
+
+
+async def test_run_bounded_empty():
+    await _run_bounded([], 5)
+
+
+async def test_run_bounded_propagates_early_failure():
+    """A call failing while others are still being submitted is re-raised."""
+    started = []
+
+    async def boom():
+        raise ValueError("boom")
+
+    def make_slow(i):
+        async def slow():
+            started.append(i)
+            await asyncio.sleep(0.001)
+
+        return slow
+
+    with pytest.raises(ValueError, match="boom"):
+        await _run_bounded([boom, make_slow(1), make_slow(2)], 1)
+    # Nothing new is started once a call has failed
+    assert started == []
+
+    with pytest.raises(ValueError, match="boom"):
+        await _run_bounded([make_slow(3), boom], 2)
+
+
+@pytest.mark.skipif(not hasattr(asyncio, "eager_task_factory"), reason="Python 3.12+")
+async def test_run_bounded_with_eager_tasks():
+    """Calls that finish without suspending still release their slots."""
+    _use_eager_tasks()
+    finished = []
+
+    def make(i):
+        async def call():
+            finished.append(i)
+
+        return call
+
+    await _run_bounded((make(i) for i in range(10)), 2)
+    assert finished == list(range(10))
+
+
+def _parquet_bytes(table: pa.Table) -> bytes:
+    buf = io.BytesIO()
+    pq.write_table(table, buf)
+    return buf.getvalue()
+
+
+class TestValidate:
+    def _orchestrator(self, config) -> Orchestrator:
+        orch = Orchestrator.__new__(Orchestrator)
+        orch.config = config
+        orch.logger = logging.getLogger("cbbd.test.validate")
+        return orch
+
+    async def test_validate_reports_missing_primary_keys(self, s3_bucket, sample_config):
+        """The newest silver file per table is checked for its primary keys."""
+        sample_config.raw["validate"] = {"strict_schema": True}
+        summary = {"endpoints": {"games": {"rows": 3}}}
+        s3_bucket.put_object(Bucket="hoops-edge", Key="meta/run_id=a.json", Body=json.dumps(summary))
+        s3_bucket.put_object(
+            Bucket="hoops-edge",
+            Key="silver/fct_games/season=2024/part-1.parquet",
+            Body=_parquet_bytes(pa.table({"gameId": [1, 2]})),
+        )
+        s3_bucket.put_object(
+            Bucket="hoops-edge",
+            Key="silver/dim_teams/part-1.parquet",
+            Body=_parquet_bytes(pa.table({"school": ["A"]})),
+        )
+
+        with pytest.raises(RuntimeError) as exc:
+            await self._orchestrator(sample_config).validate()
+        assert "dim_teams" in str(exc.value)
+        assert "fct_games" not in str(exc.value)
+
+    async def test_validate_passes_clean_tables(self, s3_bucket, sample_config):
+        summary = {"endpoints": {"games": {"rows": 3}}}
+        s3_bucket.put_object(Bucket="hoops-edge", Key="meta/run_id=a.json", Body=json.dumps(summary))
+        s3_bucket.put_object(
+            Bucket="hoops-edge",
+            Key="silver/fct_games/season=2024/part-1.parquet",
+            Body=_parquet_bytes(pa.table({"gameId": [1, 2]})),
+        )
+        sample_config.raw["validate"] = {"strict_schema": True}
+        await self._orchestrator(sample_config).validate()
+
+
+def test_read_parquet_schema_from_footer(s3_bucket):
+    """The schema is read from the file tail, including footers larger than the probe."""
+    from cbbd_etl import orchestrate
+
+    wide = pa.table({f"col_{i:04d}": [i] for i in range(2000)})
+    s3_bucket.put_object(Bucket="hoops-edge", Key="silver/wide.parquet", Body=_parquet_bytes(wide))
+    s3_bucket.put_object(Bucket="hoops-edge", Key="silver/bad.parquet", Body=b"not parquet")
+
+    schema = orchestrate._read_parquet_schema(s3_bucket, "hoops-edge", "silver/wide.parquet")
+    assert schema.names == wide.schema.names
+    with pytest.raises(Exception):
+        orchestrate._read_parquet_schema(s3_bucket, "hoops-edge", "silver/bad.parquet")
+
+
+class TestFilterSeenKeys:
+    def _orchestrator(self) -> Orchestrator:
+        orch = Orchestrator.__new__(Orchestrator)
+        orch._seen_keys = {}
+        return orch
+
+    def test_single_key_dedup_across_calls(self):
+        orch = self._orchestrator()
+        first = orch._filter_seen_keys("fct_plays", [{"id": 1}, {"id": 2}, {"id": 1}], ("id",))
+        assert [r["id"] for r in first] == [1, 2]
+        second = orch._filter_seen_keys("fct_plays", [{"id": 2}, {"id": 3}, {"id": None}], ("id",))
+        assert [r["id"] for r in second] == [3, None]
+
+    def test_composite_key_dedup(self):
+        orch = self._orchestrator()
+        records = [
+            {"gameId": 1, "teamId": 1},
+            {"gameId": 1, "teamId": 2},
+            {"gameId": 1, "teamId": 1},
+            {"gameId": 2},
+        ]
+        out = orch._filter_seen_keys("fct_game_teams", records, ("gameId", "teamId"))
+        assert out == records[:2] + records[3:]
+
+    def test_matches_filter_then_dedupe(self):
+        """The fused pass equals the old seen-key filter followed by dedupe_records."""
+        import random
+
+        from cbbd_etl.normalize import dedupe_records
+
+        def reference(seen, records, key_fields):
+            out = []
+            for rec in records:
+                key = tuple(rec.get(k) for k in key_fields)
+                if None in key:
+                    out.append(rec)
+                elif key not in seen:
+                    seen.add(key)
+                    out.append(rec)
+            return dedupe_records(out, key_fields)
+
+        rng = random.Random(7)
+        for key_fields in (("id",), ("gameId", "teamId")):
+            orch = self._orchestrator()
+            seen = set()
+            for _ in range(20):
+                records = [
+                    {k: rng.choice([None, 1, 2, 3]) for k in key_fields} | {"row": i}
+                    for i in range(rng.randint(0, 12))
+                ]
+                expected = reference(seen, records, key_fields)
+                assert orch._filter_seen_keys("t", records, key_fields) == expected
+
+
+async def test_fetch_strips_path_params():
+    """Path placeholders are formatted into the path and dropped from the query."""
+    from cbbd_etl.extractors.base import EndpointSpec
+
+    spec = EndpointSpec(name="plays_game", path="/plays/game/{gameId}", type="game_fanout")
+    assert spec.path_params == frozenset({"gameId"})
+
+    calls = []
+
+    class FakeApi:
+        async def get_json(self, path, params=None):
+            calls.append((path, params))
+
+    orch = Orchestrator.__new__(Orchestrator)
+    orch.api = FakeApi()
+    await orch._fetch(spec, {"gameId": 7, "season": 2024})
+    assert calls == [("/plays/game/7", {"season": 2024})]
+
+
+class TestWriteLayers:
+    def _orchestrator(self, config, fail_prefix=None):
+        puts = []
+        self.registered = []
+
+        class FakeS3:
+            def put_tmp(self, key, body):
+                puts.append(key)
+
+            def put_json_gz(self, key, records):
+                puts.append(key)
+
+            def put_parquet(self, key, table):
+                if fail_prefix and key.startswith(fail_prefix):
+                    raise RuntimeError("upload failed")
+                puts.append(key)
+
+        registered = self.registered
+
+        class FakeGlue:
+            def ensure_database(self, db):
+                pass
+
+            def ensure_table(self, db, table, location, schema, partitions):
+                registered.append(db)
+
+        orch = Orchestrator.__new__(Orchestrator)
+        orch.config = config
+        orch.s3 = FakeS3()
+        orch.glue = FakeGlue()
+        orch.logger = logging.getLogger("cbbd.test.write_layers")
+        orch._run_id = "run"
+        orch._summary = {}
+        orch._seen_keys = {}
+        return orch, puts
+
+    async def test_all_layers_uploaded_before_return(self, sample_config):
+        """Every layer upload has finished by the time _write_layers returns."""
+        from cbbd_etl.extractors.base import EndpointSpec
+
+        orch, puts = self._orchestrator(sample_config)
+        spec = EndpointSpec(name="games", path="/games", type="season")
+        records = [{"id": 1, "season": 2024}, {"id": 2, "season": 2024}]
+        await orch._write_layers(spec, records, {}, "abcdef1234", "backfill", season=2024)
+
+        prefixes = sorted(key.split("/")[0] for key in puts)
+        assert prefixes == sorted(["tmp", "raw", "bronze", "silver"])
+        assert orch._summary["endpoints"]["games"]["rows"] == 2
+        assert sorted(self.registered) == ["cbbd_bronze", "cbbd_silver"]
+
+    async def test_failed_upload_is_not_registered(self, sample_config):
+        """Glue only learns about layers whose upload succeeded."""
+        from cbbd_etl.extractors.base import EndpointSpec
+
+        orch, puts = self._orchestrator(sample_config, fail_prefix="silver/")
+        spec = EndpointSpec(name="games", path="/games", type="season")
+        records = [{"id": 1, "season": 2024}]
+        with pytest.raises(RuntimeError):
+            await orch._write_layers(spec, records, {}, "abcdef1234", "backfill", season=2024)
+        assert self.registered == ["cbbd_bronze"]
+        assert "games" not in orch._summary.get("endpoints", {})
+
+
+async def test_run_endpoints_overlaps_independent_then_fanouts(sample_config):
+    """Non-fanout endpoints run concurrently (capped); fanouts follow in order."""
+    from cbbd_etl.extractors.base import EndpointSpec
+
+    orch = Orchestrator.__new__(Orchestrator)
+    orch.config = sample_config
+    orch.logger = logging.getLogger("cbbd.test.run_endpoints")
+    orch.registry = {
+        name: EndpointSpec(name=name, path=f"/{name}", type=kind)
+        for name, kind in [
+            ("conferences", "snapshot"),
+            ("games", "season"),
+            ("plays_game", "game_fanout"),
+            ("teams", "snapshot"),
+            ("venues", "snapshot"),
+            ("plays_player", "player_fanout"),
+            ("rankings", "season"),
+            ("lines", "season"),
+        ]
+    }
+    events = []
+    inflight = 0
+    peak = 0
+
+    async def fake_run_endpoint(name, spec, seasons, mode):
+        nonlocal inflight, peak
+        inflight += 1
+        peak = max(peak, inflight)
+        events.append(("start", name))
+        await asyncio.sleep(0.001)
+        events.append(("end", name))
+        inflight -= 1
+
+    orch._run_endpoint = fake_run_endpoint
+    await orch._run_endpoints([2024], "backfill", skip_fanout=False, only_endpoints=None)
+
+    assert peak == 4
+    names = [name for kind, name in events if kind == "start"]
+    assert names[-2:] == ["plays_game", "plays_player"]
+    last_independent_end = max(i for i, (kind, name) in enumerate(events) if kind == "end" and "_" not in name)
+    assert events.index(("start", "plays_game")) > last_independent_end
+
+    events.clear()
+    await orch._run_endpoints([2024], "backfill", skip_fanout=True, only_endpoints=["games", "plays_game"])
+    assert events == [("start", "games"), ("end", "games")]
+
+
+async def test_fanout_with_limits_takes_lowest_pending_ids(sample_config):
+    """Resumed IDs are skipped and a limit keeps the lowest remaining IDs."""
+    from cbbd_etl.extractors.base import EndpointSpec
+
+    orch = Orchestrator.__new__(Orchestrator)
+    orch.config = sample_config
+    orch.logger = logging.getLogger("cbbd.test.fanout_limits")
+    orch._game_ids = {50, 3, 41, 7, 12, 99, 1}
+    orch._game_meta = {}
+    orch._resume_game_ids = {1, 7}
+    orch._request_counts = {}
+    called = []
+
+    async def fake_single_call(spec, params, mode, season=None, date=None):
+        called.append(params["gameId"])
+
+    orch._run_single_call = fake_single_call
+    spec = EndpointSpec(name="plays_game", path="/plays/game/{gameId}", type="game_fanout")
+    await orch._run_fanout_with_limits(spec, [2024], limit=3, batch_size=2)
+    assert sorted(called) == [3, 12, 41]
+
+    called.clear()
+    await orch._run_game_fanout(spec, [2024], "backfill")
+    assert sorted(called) == [3, 12, 41, 50, 99]
+
+
+async def test_failed_call_deadletters_with_single_hash(sample_config, monkeypatch):
+    """The payload hash computed for a call is reused for its deadletter key."""
+    from cbbd_etl import orchestrate
+    from cbbd_etl.extractors.base import EndpointSpec
+    from cbbd_etl.utils import stable_hash
+
+    hashed = []
+
+    def counting_hash(payload):
+        hashed.append(payload)
+        return stable_hash(payload)
+
+    monkeypatch.setattr(orchestrate, "stable_hash", counting_hash)
+    written = []
+
+    class FakeS3:
+        def put_deadletter(self, key, payload):
+            written.append((key, payload))
+
+    async def failing_fetch(spec, params):
+        raise RuntimeError("boom")
+
+    orch = Orchestrator.__new__(Orchestrator)
+    orch.config = sample_config
+    orch.s3 = FakeS3()
+    orch._fetch = failing_fetch
+    spec = EndpointSpec(name="plays_game", path="/plays/game/{gameId}", type="game_fanout")
+    params = {"gameId": 7}
+    await orch._run_single_call(spec, params, "backfill")
+
+    assert hashed == [params]
+    [(key, payload)] = written
+    assert key.endswith(f"part-{stable_hash(params)[:8]}.json")
+    assert payload["reason"] == "error:boom"
+
+
+async def test_run_backfill_aborts_when_an_endpoint_fails(sample_config):
+    """An independent endpoint's error ends the run before fanouts or the summary."""
+    from cbbd_etl.extractors.base import EndpointSpec
+
+    orch = Orchestrator.__new__(Orchestrator)
+    orch.config = sample_config
+    orch.logger = logging.getLogger("cbbd.test.run_backfill")
+    orch.registry = {
+        name: EndpointSpec(name=name, path=f"/{name}", type=kind)
+        for name, kind in [
+            ("plays_date", "date"),
+            ("conferences", "snapshot"),
+            ("plays_game", "game_fanout"),
+        ]
+    }
+    # One at a time, so the failure lands while endpoints are still queued
+    orch.config.api["endpoint_concurrency"] = 1
+    orch.ensure_prefixes = lambda: None
+    ran = []
+    finalized = []
+
+    async def fake_run_endpoint(name, spec, seasons, mode):
+        ran.append(name)
+        if name == "plays_date":
+            raise RuntimeError("checkpoint write failed")
+
+    async def fake_finalize():
+        finalized.append(True)
+
+    orch._run_endpoint = fake_run_endpoint
+    orch._finalize_summary = fake_finalize
+    with pytest.raises(RuntimeError, match="checkpoint write failed"):
+        await orch.run_backfill(seasons=[2024])
+    assert ran == ["plays_date"]
+    assert finalized == []
@@ -12,7 +12,7 @@ import pytest
 from moto import mock_aws
 import boto3
 
-from cbbd_etl.s3_io import S3IO, make_part_key, new_run_id
+from cbbd_etl.s3_io import S3IO, dump_json, load_json, make_part_key, new_run_id
 
 
 @pytest.fixture()
@@ -40,6 +40,16 @@ class TestPutAndGetJsonGz:
         assert parsed[0]["id"] == 1
         assert parsed[1]["name"] == "UNC"
 
+    def test_put_json_gz_spans_write_batches(self, s3io: S3IO):
+        """Pages longer than one write batch keep every line, in order."""
+        records = ({"id": i} for i in range(2503))
+        key = "raw/plays/part-big.json.gz"
+        s3io.put_json_gz(key, records)
+
+        lines = gzip.decompress(s3io.get_object_bytes(key)).decode("utf-8").split("\n")
+        assert lines[-1] == ""
+        assert [json.loads(line)["id"] for line in lines[:-1]] == list(range(2503))
+
 
 class TestPutAndReadParquet:
     def test_put_and_read_parquet(self, s3io: S3IO):
@@ -58,6 +68,25 @@ class TestPutAndReadParquet:
         assert result.column("gameId").to_pylist() == [100, 200]
         assert result.column("team").to_pylist() == ["Duke", "UNC"]
 
+    def test_put_parquet_row_group_size(self, s3io: S3IO):
+        """row_group_size splits the written file into row groups."""
+        table = pa.table({"gameId": pa.array(range(10), type=pa.int64())})
+        key = "gold/test/season=2024/part-abc.parquet"
+        s3io.put_parquet(key, table, row_group_size=4)
+
+        pf = pq.ParquetFile(io.BytesIO(s3io.get_object_bytes(key)))
+        assert pf.metadata.num_row_groups == 3
+        assert pf.read().column("gameId").to_pylist() == list(range(10))
+
+
+class TestMultipartUpload:
+    def test_large_body_round_trips(self, s3io: S3IO):
+        """Bodies over the multipart threshold upload in parts and read back intact."""
+        body = bytes(range(256)) * (9 * 1024 * 1024 // 256 + 1)
+        key = "tmp/large.bin"
+        s3io.put_tmp(key, body)
+        assert s3io.get_object_bytes(key) == body
+
 
 class TestListKeys:
     def test_list_keys(self, s3io: S3IO):
@@ -132,6 +161,27 @@ class TestPutDeadletter:
         assert recovered["error"] == "timeout"
         assert recovered["endpoint"] == "games"
 
+    def test_dump_and_load_json(self):
+        """Summary payloads round-trip, with non-JSON values stringified."""
+        import datetime as dt
+
+        payload = {"run_id": "abc", "endpoints": {"games": {"rows": 3}}, "day": dt.date(2024, 1, 2)}
+        body = dump_json(payload)
+        assert isinstance(body, bytes)
+        assert load_json(body) == {**payload, "day": "2024-01-02"}
+
+    def test_dump_json_matches_json_dumps(self):
+        """Deadletter and summary bytes are exactly json.dumps(default=str)."""
+        import datetime as dt
+
+        payload = {
+            "started_at": dt.datetime(2024, 1, 2, 3, 4, 5),
+            "ratio": float("nan"),
+            "team": "Montréal",
+            "params": {"season": 2024},
+        }
+        assert dump_json(payload) == json.dumps(payload, default=str).encode("utf-8")
+
 
 class TestEnsurePrefixes:
     def test_ensure_prefixes(self, s3io: S3IO):
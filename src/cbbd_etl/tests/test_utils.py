@@ -30,3 +30,22 @@ class TestStableHash:
         h = stable_hash({"key": "value"})
         assert len(h) == 64
         int(h, 16)  # Should not raise for valid hex
+
+    def test_stable_hash_cached_matches_uncached(self):
+        """Memoized scalar payloads hash the same as the JSON/SHA-256 digest."""
+        import hashlib
+        import json
+
+        for payload in ({"table": "t", "season": 2024}, {"x": True}, {"x": 1}, {"x": 1.0}, {"x": None}):
+            raw = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+            assert stable_hash(payload) == hashlib.sha256(raw).hexdigest()
+        assert stable_hash({"x": True}) != stable_hash({"x": 1})
+
+    def test_stable_hash_signed_zero(self):
+        """0.0 and -0.0 compare equal but serialize apart, so they hash apart."""
+        assert stable_hash({"x": 0.0}) != stable_hash({"x": -0.0})
+
+    def test_stable_hash_nested_payload(self):
+        """Non-scalar values bypass the cache and still hash deterministically."""
+        assert stable_hash({"ids": [1, 2]}) == stable_hash({"ids": [1, 2]})
+        assert stable_hash({"ids": [1, 2]}) != stable_hash({"ids": [2, 1]})
@@ -1,8 +1,33 @@
 import hashlib
 import json
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+# Payloads made only of these value types are memoized by stable_hash.
+# Floats are excluded: 0.0 == -0.0 (same cache key) but they serialize
+# differently.
+_SCALAR_TYPES = (str, int, bool, type(None))
 
 
 def stable_hash(payload: Dict[str, Any]) -> str:
+    # The same small request parameters are hashed repeatedly (per table,
+    # chunk and checkpoint), so flat scalar payloads hit a cache. Value types
+    # are part of the key because e.g. True == 1 but they serialize apart.
+    if all(isinstance(v, _SCALAR_TYPES) for v in payload.values()):
+        try:
+            key = tuple(sorted((k, type(v), v) for k, v in payload.items()))
+        except TypeError:
+            pass
+        else:
+            return _cached_hash(key)
+    return _hash_payload(payload)
+
+
+@lru_cache(maxsize=256)
+def _cached_hash(items: Tuple[Tuple[str, type, Any], ...]) -> str:
+    return _hash_payload({k: v for k, _, v in items})
+
+
+def _hash_payload(payload: Dict[str, Any]) -> str:
     raw = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
     return hashlib.sha256(raw).hexdigest()